@@ -0,0 +1,260 @@
+'''
+Optimisation par colonies de fourmis (ACO) guidée par les phéromones des tunnels.
+
+Chaque itération simule un lot de colonies en parallèle, dans des tableaux NumPy
+(position de chaque fourmi de chaque colonie). À chaque étape, une fourmi choisit
+le prochain saut parmi les voisines plus près de Sd (ou à la même distance mais
+plus loin de Sv : branche parallèle), avec une probabilité proportionnelle à
+
+    phéromone(tunnel) ** ALPHA * (capacité en aval / (1 + distance à Sd)) ** BETA
+
+(capacité du goulot de la branche, comme pour le routage ECMP). Ces arcs forment
+un graphe sans cycle ; les salles sont traitées dans son ordre, les plus avancées
+d'abord : les places qu'elles libèrent sont disponibles dans la même étape. Une
+fourmi dont la salle visée est pleine en choisit une autre avec de la place, ou
+attend.
+
+Après chaque lot, les phéromones s'évaporent puis les meilleures colonies
+(et la meilleure solution connue) déposent sur chaque tunnel une quantité
+proportionnelle au nombre de passages, pondérée par leur nombre d'étapes.
+La meilleure solution est retournée au format habituel (movements_history).
+
+Une simulation est bornée : une colonie qui n'a pas fini après
+MAX_STEPS_FACTOR * (fourmis + salles) étapes (au-delà de l'acheminement en file
+indienne), ou dont plus aucune fourmi ne bouge, est un échec et ne dépose rien.
+Si aucune colonie n'aboutit, l'historique retourné est vide.
+'''
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from main import AntColony
+from routing import EcmpRouter
+
+
+ALPHA = 1.0          # Poids des phéromones
+BETA = 1.0           # Poids de l'heuristique (capacité en aval)
+EVAPORATION = 0.1    # Part des phéromones évaporée à chaque itération
+ELITE = 4            # Colonies d'un lot qui déposent des phéromones
+BATCH = 32           # Colonies simulées en parallèle
+ITERATIONS = 10      # Lots simulés
+MAX_STEPS_FACTOR = 4  # Étapes d'une simulation : au plus ce facteur x (fourmis + salles)
+
+
+class AcoSolver:
+    """Recherche ACO par lots de colonies simulées en parallèle (état NumPy)"""
+
+    def __init__(self, antnest, batch: int = BATCH, seed: int = 0):
+        self.antnest = antnest
+        self.batch = batch
+        self.rng = np.random.default_rng(seed)
+        colony = AntColony(antnest)
+        distance = colony.distance_to_sd
+        from_sv = colony._compute_distances_to("Sv")
+        self.reachable = "Sv" in distance and antnest.ants > 0
+
+        # Salles sur un chemin Sv -> Sd, numérotées ; rang dans l'ordre de traitement
+        # (plus près de Sd d'abord, puis plus loin de Sv) : un arc descend toujours ce rang
+        self.names = [room for room in colony.adjacency if room in distance and room in from_sv]
+        index = {room: i for i, room in enumerate(self.names)}
+        key = {room: (distance[room], -from_sv[room]) for room in self.names}
+        rank = {k: i for i, k in enumerate(sorted(set(key.values())))}
+        rooms = antnest.rooms
+        ecmp = EcmpRouter(colony) if self.reachable else None
+        hops = [[n for n in colony.adjacency[room]
+                 if n in key and key[n] < key[room] and distance[n] <= distance[room]
+                 and (n == "Sd" or rooms.get(n, 1) >= 1)]
+                for room in self.names]
+        width = max(1, max((len(h) for h in hops), default=1))
+        nb_rooms = len(self.names)
+        self.next_room = np.zeros((nb_rooms, width), dtype=np.int64)
+        self.valid = np.zeros((nb_rooms, width), dtype=bool)
+        self.heuristic = np.zeros((nb_rooms, width))
+        for r, targets in enumerate(hops):
+            for k, n in enumerate(targets):
+                self.next_room[r, k] = index[n]
+                self.valid[r, k] = True
+                self.heuristic[r, k] = min(ecmp.branch_capacity[n], antnest.ants) / (1 + distance[n])
+        self.pheromone = np.where(self.valid, 1.0, 0.0)
+
+        self.level = np.array([rank[key[room]] for room in self.names], dtype=np.int64)
+        unlimited = antnest.ants * batch + 1
+        self.capacity = np.array([unlimited if room in ("Sv", "Sd") else rooms.get(room, 1)
+                                  for room in self.names], dtype=np.int64)
+        self.sv = index.get("Sv")
+        self.sd = index.get("Sd")
+
+        self.best_steps: Optional[int] = None
+        self.best_history: List[List[Tuple[int, str, str]]] = []
+        self._best_arcs = np.empty(0, dtype=np.int64)
+        self.max_steps = MAX_STEPS_FACTOR * (antnest.ants + len(self.names))
+        self.rollouts = 0
+        self.failures = 0
+
+    # ---------------------------------------------------------------- simulation
+
+    def _weights(self) -> np.ndarray:
+        return np.where(self.valid, self.pheromone ** ALPHA * self.heuristic ** BETA, 0.0)
+
+    def rollout(self):
+        """
+        Simule un lot de colonies jusqu'à l'arrivée de toutes les fourmis.
+
+        La simulation s'arrête après self.max_steps étapes, ou dès qu'une étape ne
+        déplace aucune fourmi (blocage définitif : l'état ne change plus).
+
+        Returns:
+            (étapes par colonie, -1 pour un échec ; mouvements (colonie, fourmi, étape,
+            arc) en colonnes)
+        """
+        batch, ants, nb_rooms = self.batch, self.antnest.ants, len(self.names)
+        width = self.next_room.shape[1]
+        weights = self._weights()
+        position = np.full(batch * ants, self.sv, dtype=np.int64)
+        colony_of = np.repeat(np.arange(batch), ants)
+        finished = np.zeros(batch, dtype=np.int64)
+        moves = []
+        step = 0
+        while True:
+            active = np.flatnonzero(position != self.sd)
+            done = np.bincount(colony_of[active], minlength=batch) == 0
+            finished[done & (finished == 0)] = step
+            if len(active) == 0 or step >= self.max_steps:
+                break
+            step += 1
+            moved = len(moves)
+            occupancy = np.bincount(colony_of * nb_rooms + position, minlength=batch * nb_rooms)
+            free = np.repeat(self.capacity[None, :], batch, axis=0).ravel() - occupancy
+
+            # Salles dans l'ordre de traitement : les départs précèdent les arrivées
+            order = active[np.argsort(self.level[position[active]], kind='stable')]
+            levels = self.level[position[order]]
+            bounds = np.flatnonzero(np.diff(levels)) + 1
+            for pending in np.split(order, bounds):
+                if position[pending[0]] == self.sv:
+                    pending = self._leaving_sv(pending, free, colony_of, nb_rooms)
+                while len(pending):
+                    room = position[pending]
+                    colony = colony_of[pending]
+                    targets = self.next_room[room]
+                    slots = colony[:, None] * nb_rooms + targets
+                    choice_weights = weights[room] * (free[slots] > 0)
+                    total = choice_weights.sum(axis=1)
+                    movable = total > 0
+                    pending, room, colony, slots = (pending[movable], room[movable],
+                                                    colony[movable], slots[movable])
+                    if len(pending) == 0:
+                        break
+                    cumulative = np.cumsum(choice_weights[movable], axis=1)
+                    draw = self.rng.random(len(pending)) * cumulative[:, -1]
+                    k = np.minimum((cumulative <= draw[:, None]).sum(axis=1), width - 1)
+                    slot = slots[np.arange(len(pending)), k]
+
+                    # Rang de chaque fourmi parmi celles qui visent la même salle (ordre aléatoire)
+                    ranking = np.lexsort((self.rng.random(len(pending)), slot))
+                    sorted_slots = slot[ranking]
+                    first = np.searchsorted(sorted_slots, sorted_slots)
+                    rank = np.empty(len(pending), dtype=np.int64)
+                    rank[ranking] = np.arange(len(pending)) - first
+                    accepted = rank < free[slot]
+                    if not accepted.any():
+                        break
+
+                    movers = pending[accepted]
+                    target_slots = slot[accepted]
+                    np.subtract.at(free, target_slots, 1)
+                    np.add.at(free, colony[accepted] * nb_rooms + room[accepted], 1)
+                    moves.append((colony[accepted], movers % ants, np.full(len(movers), step),
+                                  room[accepted] * width + k[accepted]))
+                    position[movers] = target_slots % nb_rooms
+                    pending = pending[~accepted]
+            if len(moves) == moved:
+                break   # Aucun mouvement : blocage
+
+        # Colonies non terminées : échec
+        unfinished = np.bincount(colony_of[position != self.sd], minlength=batch) > 0
+        finished[unfinished] = -1
+        self.failures += int(unfinished.sum())
+        self.rollouts += batch
+        if not moves:
+            return finished, tuple(np.empty(0, dtype=np.int64) for _ in range(4))
+        return finished, tuple(np.concatenate(column) for column in zip(*moves))
+
+    def _leaving_sv(self, waiting, free, colony_of, nb_rooms):
+        """Fourmis de Sv qui tentent de partir : par colonie, au plus les places libres en aval"""
+        targets = self.next_room[self.sv][self.valid[self.sv]]
+        colonies = np.arange(self.batch)
+        places = np.maximum(free[colonies[:, None] * nb_rooms + targets], 0).sum(axis=1)
+        # Fourmis de Sv triées par colonie (ordre d'identifiant) : rang dans la colonie
+        colony = colony_of[waiting]
+        rank = np.arange(len(waiting)) - np.searchsorted(colony, colony)
+        return waiting[rank < places[colony]]
+
+    # ------------------------------------------------------------------ recherche
+
+    def _history(self, moves, colony: int) -> List[List[Tuple[int, str, str]]]:
+        """Historique des mouvements d'une colonie du lot"""
+        colonies, ant_ids, steps, arcs = moves
+        mine = colonies == colony
+        ant_ids, steps, arcs = ant_ids[mine], steps[mine], arcs[mine]
+        order = np.lexsort((ant_ids, steps))
+        width = self.next_room.shape[1]
+        sources = arcs // width
+        targets = self.next_room.ravel()[arcs]
+        history = [[] for _ in range(int(steps.max()) if len(steps) else 0)]
+        names = self.names
+        for i in order.tolist():
+            history[steps[i] - 1].append((int(ant_ids[i]) + 1, names[sources[i]], names[targets[i]]))
+        return history
+
+    def _deposit(self, arcs, steps: int):
+        """Dépôt d'une colonie : passages par arc, pondérés par meilleur nombre d'étapes / étapes"""
+        passages = np.bincount(arcs, minlength=self.pheromone.size).reshape(self.pheromone.shape)
+        self.pheromone += self.best_steps / steps / self.antnest.ants * passages
+
+    def run(self, iterations: int = ITERATIONS, budget: Optional[float] = None):
+        """Itère les lots (au plus `iterations`, ou jusqu'à épuisement du budget en secondes)"""
+        if not self.reachable:
+            return self.best_history
+        deadline = time.perf_counter() + budget if budget is not None else None
+        for _ in range(iterations):
+            steps, moves = self.rollout()
+            ranking = [c for c in np.argsort(steps, kind='stable') if steps[c] >= 0]
+            if not ranking:
+                # Aucune colonie n'a abouti : pas de dépôt, les phéromones s'évaporent
+                self.pheromone = np.where(self.valid, np.maximum(self.pheromone * (1 - EVAPORATION), 1e-3), 0.0)
+                if deadline is not None and time.perf_counter() > deadline:
+                    break
+                continue
+            best = int(ranking[0])
+            if self.best_steps is None or steps[best] < self.best_steps:
+                self.best_steps = int(steps[best])
+                self.best_history = self._history(moves, best)
+                self._best_arcs = moves[3][moves[0] == best]
+
+            # Évaporation puis renforcement : élites du lot et meilleure solution connue
+            self.pheromone *= 1 - EVAPORATION
+            for colony in ranking[:ELITE]:
+                self._deposit(moves[3][moves[0] == colony], steps[colony])
+            self._deposit(self._best_arcs, self.best_steps)
+            self.pheromone = np.where(self.valid, np.maximum(self.pheromone, 1e-3), 0.0)
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+        return self.best_history
+
+    def pheromones(self) -> Dict[tuple, float]:
+        """Phéromones par tunnel, clés comme AntColony.edge_passages"""
+        result: Dict[tuple, float] = {}
+        for r, k in zip(*np.nonzero(self.valid)):
+            edge = tuple(sorted((self.names[r], self.names[self.next_room[r, k]])))
+            result[edge] = result.get(edge, 0.0) + float(self.pheromone[r, k])
+        return result
+
+
+def solve_aco(antnest, iterations: int = ITERATIONS, batch: int = BATCH, seed: int = 0,
+              budget: Optional[float] = None) -> AntColony:
+    """Colonie rejouant la meilleure solution trouvée par ACO (vide si aucune n'aboutit)"""
+    history = AcoSolver(antnest, batch, seed).run(iterations, budget)
+    return AntColony(antnest).load_history(history)
@@ -6,10 +6,19 @@ import matplotlib.pyplot as plt
 import networkx as nx
 import time
 from main import load_antnest_from_txt, solve_antnest
+from layout import default_layout
+from rendering import StepRenderer, LOD_MIN_NODES
+from tracing import traced
 
 
-def animation_simple(fourmiliere_path, delay=1.5):
-    """Animation simple d'une fourmilière"""
+def animation_simple(fourmiliere_path, delay=1.5, export=None, jobs=None):
+    """Animation simple d'une fourmilière
+    
+    Args:
+        export: fichier .mp4/.gif ; si donné, l'animation est rendue hors écran
+                (backend Agg, pool de processus) au lieu d'être affichée
+        jobs: nombre de processus de rendu pour l'export
+    """
     print(f"🎬 Animation de {fourmiliere_path}")
     
     # Charger et résoudre
@@ -18,18 +27,33 @@ def animation_simple(fourmiliere_path, delay=1.5):
     
     print(f"Solution trouvée en {len(colony.movements_history)} étapes")
     
+    if export:
+        from export import export_animation
+        export_animation(colony, export, fps=1 / delay, jobs=jobs)
+        return
+    
     # Configuration de l'affichage
     plt.ion()  # Mode interactif
     fig, ax = plt.subplots(figsize=(12, 8))
-    pos = nx.spring_layout(colony.graph, seed=42, k=2)
+    pos = default_layout(antnest, seed=42, k=2)
     
     # État initial - toutes les fourmis au vestibule
     occupancy = {room: [] for room in antnest.rooms.keys()}
     occupancy["Sv"] = list(range(1, antnest.ants + 1))
     occupancy["Sd"] = []
     
+    # Grandes fourmilières : rendu persistant avec niveau de détail (chaînes regroupées,
+    # étiquettes selon le zoom, flèches agrégées par région)
+    renderer = StepRenderer(ax, colony, pos) if len(colony.adjacency) >= LOD_MIN_NODES else None
+    
+    @traced("anime.dessiner_etape", cat="render")
     def dessiner_etape(step_num, occupancy):
         """Dessine une étape"""
+        if renderer is not None:
+            renderer.update(step_num, occupancy)
+            plt.pause(delay)
+            return
+        
         ax.clear()
         
         # Couleurs et tailles selon occupation
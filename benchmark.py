@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai des stratégies de résolution
+
+Exécute les vraies stratégies de main.STRATEGIES sur les fourmilières fournies et
+sur des fourmilières générées (10 à 10k salles, 10 à 10k fourmis), avec échauffement,
+répétitions, médiane des temps, pic mémoire et nombre d'étapes.
+
+Usage :
+    python benchmark.py run --profile quick --out bench.json
+    python benchmark.py compare baseline.json bench.json --time-threshold 0.10
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from main import AntNest, load_antnest_from_txt, STRATEGIES
+
+
+# Grilles (salles, fourmis) des fourmilières générées
+PROFILES = {
+    "quick": {
+        "rooms": [10, 100],
+        "ants": [10, 100, 1000],
+    },
+    # Mesuré : 1112 s (~19 min) pour la stratégie hybrid, échauffement + 3 répétitions
+    # + mesure mémoire (50 s par résolution pour 10 salles x 10k fourmis). Au-delà de
+    # 10k fourmis, une seule résolution dépasse plusieurs minutes (1k salles x 100k : > 5 min)
+    "full": {
+        "rooms": [10, 100, 1000, 10000],
+        "ants": [10, 100, 1000, 10000],
+    },
+}
+
+
+def generate_antnest(num_rooms: int, num_ants: int, seed: int = 0,
+                     max_capacity: int = 4, name: str = None) -> AntNest:
+    """
+    Génère une fourmilière en couches (reproductible pour une graine donnée).
+
+    Les salles sont réparties en couches d'environ sqrt(num_rooms) salles ; chaque
+    salle est reliée à une ou deux salles de la couche suivante, Sv à la première
+    couche et la dernière couche à Sd.
+    """
+    rng = random.Random(seed)
+    width = max(1, round(math.sqrt(num_rooms)))
+    room_names = [f"S{i + 1}" for i in range(num_rooms)]
+    layers = [room_names[i:i + width] for i in range(0, num_rooms, width)]
+
+    rooms = {room: rng.randint(1, max_capacity) for room in room_names}
+    tubes = [("Sv", room) for room in layers[0]]
+
+    for layer, next_layer in zip(layers, layers[1:]):
+        reached = set()
+        for room in layer:
+            targets = {rng.choice(next_layer)}
+            if rng.random() < 0.5:
+                targets.add(rng.choice(next_layer))
+            for target in sorted(targets):
+                tubes.append((room, target))
+            reached |= targets
+        # Chaque salle de la couche suivante doit avoir un prédécesseur
+        for target in next_layer:
+            if target not in reached:
+                tubes.append((rng.choice(layer), target))
+
+    tubes.extend((room, "Sd") for room in layers[-1])
+
+    if name is None:
+        name = f"gen_r{num_rooms}_a{num_ants}_s{seed}"
+    return AntNest(name, num_ants, rooms, tubes)
+
+
+def build_corpus(profile="quick", nest_dir: str = "fourmilieres", seed: int = 0):
+    """
+    Retourne la liste des fourmilières du banc d'essai (fournies + générées).
+
+    Args:
+        profile: nom d'un profil de PROFILES, ou grille {"rooms": [...], "ants": [...]}
+    """
+    corpus = []
+    if nest_dir and os.path.isdir(nest_dir):
+        for filename in sorted(os.listdir(nest_dir)):
+            if filename.endswith('.txt'):
+                corpus.append(load_antnest_from_txt(os.path.join(nest_dir, filename)))
+
+    grid = PROFILES[profile] if isinstance(profile, str) else profile
+    for num_rooms in grid["rooms"]:
+        for num_ants in grid["ants"]:
+            corpus.append(generate_antnest(num_rooms, num_ants, seed))
+    return corpus
+
+
+def run_case(antnest: AntNest, strategy: str, warmup: int = 1, repeats: int = 3) -> dict:
+    """Mesure une stratégie sur une fourmilière : médiane des temps, pic mémoire, étapes"""
+    solve = STRATEGIES[strategy]
+
+    for _ in range(warmup):
+        solve(antnest)
+
+    times = []
+    colony = None
+    for _ in range(repeats):
+        gc.collect()
+        start = time.perf_counter()
+        colony = solve(antnest)
+        times.append(time.perf_counter() - start)
+
+    # Pic mémoire mesuré sur une exécution séparée (tracemalloc ralentit l'exécution)
+    gc.collect()
+    tracemalloc.start()
+    solve(antnest)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'case': antnest.name,
+        'strategy': strategy,
+        'rooms': len(antnest.rooms),
+        'tubes': len(antnest.tubes),
+        'ants': antnest.ants,
+        'steps': len(colony.movements_history),
+        'solved': colony.all_ants_arrived(),
+        'time_median_s': statistics.median(times),
+        'times_s': times,
+        'peak_memory_kb': round(peak / 1024, 1),
+    }
+
+
+def run_benchmark(corpus, strategies, warmup=1, repeats=3, verbose=True) -> dict:
+    """Exécute toutes les stratégies sur tout le corpus et retourne le rapport JSON"""
+    results = []
+    for antnest in corpus:
+        for strategy in strategies:
+            result = run_case(antnest, strategy, warmup, repeats)
+            results.append(result)
+            if verbose:
+                print(f"{result['case']:28} | {strategy:10} | {result['steps']:>7} étapes | "
+                      f"{result['time_median_s'] * 1000:>10.2f} ms | {result['peak_memory_kb']:>10.1f} Ko",
+                      file=sys.stderr)
+
+    return {
+        'meta': {
+            'date': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'warmup': warmup,
+            'repeats': repeats,
+        },
+        'results': results,
+    }
+
+
+def compare_reports(baseline: dict, current: dict, time_threshold: float = 0.10,
+                    steps_threshold: float = 0.0, min_time_s: float = 0.001) -> list:
+    """
+    Compare deux rapports et retourne la liste des régressions.
+
+    Une régression est signalée lorsque la médiane des temps dépasse celle de
+    référence de plus de time_threshold (relatif), ou que le nombre d'étapes
+    dépasse la référence de plus de steps_threshold (relatif). Les cas plus
+    rapides que min_time_s sont ignorés pour le temps (bruit de mesure). Un cas
+    présent d'un seul côté est aussi signalé (métrique 'missing') : un cas retiré
+    ou ajouté ne doit pas masquer une régression. Un cas résolu dans la référence
+    et non résolu maintenant est une régression (métrique 'solved') : une
+    résolution arrêtée tôt compte moins d'étapes, qui ne sont alors pas comparées.
+    """
+    reference = {(r['case'], r['strategy']): r for r in baseline['results']}
+    measured = {(r['case'], r['strategy']) for r in current['results']}
+    regressions = [{'case': key[0], 'strategy': key[1], 'metric': 'missing',
+                    'baseline': 'présent', 'current': 'absent'}
+                   for key in reference if key not in measured]
+
+    for result in current['results']:
+        key = (result['case'], result['strategy'])
+        if key not in reference:
+            regressions.append({'case': key[0], 'strategy': key[1], 'metric': 'missing',
+                                'baseline': 'absent', 'current': 'présent'})
+            continue
+        base = reference[key]
+
+        if base.get('solved', True) and not result.get('solved', True):
+            regressions.append({'case': key[0], 'strategy': key[1], 'metric': 'solved',
+                                'baseline': True, 'current': False})
+        if result.get('solved', True) and result['steps'] > base['steps'] * (1 + steps_threshold):
+            regressions.append({'case': key[0], 'strategy': key[1], 'metric': 'steps',
+                                'baseline': base['steps'], 'current': result['steps']})
+
+        base_time = base['time_median_s']
+        if (max(base_time, result['time_median_s']) >= min_time_s
+                and result['time_median_s'] > base_time * (1 + time_threshold)):
+            regressions.append({'case': key[0], 'strategy': key[1], 'metric': 'time_median_s',
+                                'baseline': base_time, 'current': result['time_median_s']})
+
+    return regressions
+
+
+def build_parser():
+    """Construit l'analyseur d'arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(description="Banc d'essai des stratégies de résolution")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", help="Exécute le banc d'essai et écrit un rapport JSON")
+    run.add_argument("--profile", choices=sorted(PROFILES), default="quick")
+    run.add_argument("--rooms", type=int, nargs="+", help="Tailles de fourmilières générées (remplace le profil)")
+    run.add_argument("--ants", type=int, nargs="+", help="Nombres de fourmis générés (remplace le profil)")
+    run.add_argument("--strategy", "-s", nargs="+", default=["hybrid"], choices=sorted(STRATEGIES))
+    run.add_argument("--nests", default="fourmilieres", help="Dossier des fourmilières fournies ('' pour ignorer)")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--warmup", type=int, default=1)
+    run.add_argument("--repeats", type=int, default=3)
+    run.add_argument("--out", "-o", default="bench.json")
+
+    compare = subparsers.add_parser("compare", help="Compare deux rapports et échoue en cas de régression")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--time-threshold", type=float, default=0.10,
+                         help="Régression de temps tolérée (relative, défaut: 0.10)")
+    compare.add_argument("--steps-threshold", type=float, default=0.0,
+                         help="Régression d'étapes tolérée (relative, défaut: 0)")
+    compare.add_argument("--min-time", type=float, default=0.001,
+                         help="Temps en dessous duquel les cas sont ignorés (secondes)")
+    return parser
+
+
+def main(argv=None):
+    """Point d'entrée de la ligne de commande"""
+    args = build_parser().parse_args(argv)
+
+    if args.command == "run":
+        grid = PROFILES[args.profile]
+        profile_name = args.profile
+        if args.rooms or args.ants:
+            grid = {"rooms": args.rooms or grid["rooms"], "ants": args.ants or grid["ants"]}
+            profile_name = "custom"
+        corpus = build_corpus(grid, args.nests, args.seed)
+        report = run_benchmark(corpus, args.strategy, args.warmup, args.repeats)
+        report['meta']['profile'] = profile_name
+        report['meta']['grid'] = grid
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"✅ {len(report['results'])} mesures écrites dans {args.out}", file=sys.stderr)
+        return 0
+
+    if args.command == "compare":
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        with open(args.current, encoding="utf-8") as f:
+            current = json.load(f)
+
+        regressions = compare_reports(baseline, current, args.time_threshold,
+                                      args.steps_threshold, args.min_time)
+        for r in regressions:
+            print(f"❌ {r['case']} [{r['strategy']}] {r['metric']}: {r['baseline']} → {r['current']}")
+        if regressions:
+            print(f"{len(regressions)} régression(s) détectée(s)")
+            return 1
+        print("✅ Aucune régression")
+        return 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,371 @@
+'''
+Planification coopérative : itinéraire complet de chaque fourmi dans une table de
+réservations espace-temps.
+
+La table compte, pour chaque salle et chaque étape, les fourmis qui s'y trouvent à
+la fin de l'étape (Sv et Sd : capacité illimitée, non comptées). Les fourmis sont
+planifiées une à une : chacune réserve son itinéraire, les suivantes contournent
+ces réservations. Les plans obtenus respectent les capacités par construction, sans
+résolution de conflits.
+
+Pour chaque fourmi :
+- les itinéraires connus (gabarits) sont essayés au plus tôt : le premier départ
+  possible d'un gabarit ne fait que reculer, un pointeur par gabarit évite de
+  réexaminer les départs déjà refusés. Les gabarits initiaux sont les chemins d'un
+  flot maximal (capacités des salles), que le glouton seul ne trouve pas : une
+  fourmi planifiée sur le plus court chemin peut bloquer une combinaison de
+  chemins plus longs mais plus débitante ;
+- une recherche A* dans le graphe espace-temps (salle, étape), heuristique =
+  distance au dortoir, cherche un itinéraire strictement meilleur (attentes
+  comprises), dans la limite de MAX_EXPANSIONS états.
+
+Si la recherche échoue, elle est sautée pour un nombre croissant de fourmis
+suivantes (recul exponentiel) : le coût de planification par fourmi reste borné.
+'''
+
+import heapq
+import time
+from collections import Counter, deque
+from typing import Dict, List, Optional, Tuple
+
+from main import AntColony
+
+
+MAX_EXPANSIONS = 256   # États développés au plus par recherche A*
+MAX_TEMPLATES = 16     # Gabarits d'itinéraires conservés
+MAX_BACKOFF = 64       # Fourmis sautées au plus après des recherches infructueuses
+_UNLIMITED = float('inf')
+
+
+class ReservationTable:
+    """Occupation réservée (salle, étape) -> nombre de fourmis en fin d'étape"""
+
+    def __init__(self, capacities: List[float]):
+        self.capacities = capacities
+        self.counts: List[List[int]] = [[] for _ in capacities]
+
+    def is_free(self, room: int, step: int) -> bool:
+        """Reste-t-il une place dans la salle à la fin de l'étape ?"""
+        counts = self.counts[room]
+        return step >= len(counts) or counts[step] < self.capacities[room]
+
+    def reserve(self, room: int, first_step: int, last_step: int):
+        """Réserve une place dans la salle pour les étapes first_step à last_step"""
+        if self.capacities[room] == _UNLIMITED:
+            return
+        counts = self.counts[room]
+        if len(counts) <= last_step:
+            # Croissance par doublement : extensions rares
+            counts.extend([0] * max(last_step + 1 - len(counts), len(counts)))
+        if first_step == last_step:
+            counts[first_step] += 1
+        else:
+            for step in range(first_step, last_step + 1):
+                counts[step] += 1
+
+    def release(self, room: int, first_step: int, last_step: int):
+        """Libère une place réservée par reserve()"""
+        if self.capacities[room] == _UNLIMITED:
+            return
+        counts = self.counts[room]
+        for step in range(first_step, last_step + 1):
+            counts[step] -= 1
+
+    def _stays(self, plan: List[int], departure: int):
+        """Séjours d'un plan (salle occupée à chaque étape depuis `departure`) : (salle, début, fin)"""
+        arrival = departure
+        for i in range(1, len(plan)):
+            if plan[i] != plan[i - 1]:
+                yield plan[i - 1], arrival, departure + i - 1
+                arrival = departure + i
+
+    def reserve_plan(self, plan: List[int], departure: int):
+        """Réserve chaque séjour d'un plan, de l'arrivée dans la salle à son départ"""
+        for room, first_step, last_step in self._stays(plan, departure):
+            self.reserve(room, first_step, last_step)
+
+    def release_plan(self, plan: List[int], departure: int):
+        """Libère les réservations d'un plan"""
+        for room, first_step, last_step in self._stays(plan, departure):
+            self.release(room, first_step, last_step)
+
+    def fits(self, route: List[int], departure: int) -> bool:
+        """Un itinéraire (Sv ... Sd) peut-il partir à cette étape sans attendre ?"""
+        counts, capacities = self.counts, self.capacities
+        for i in range(1, len(route) - 1):
+            room = route[i]
+            reserved = counts[room]
+            step = departure + i
+            if step < len(reserved) and reserved[step] >= capacities[room]:
+                return False
+        return True
+
+
+def flow_routes(neighbors: List[List[int]], capacities: List[float], source: int, sink: int,
+                limit: int) -> List[List[int]]:
+    """
+    Chemins d'un flot maximal de source à sink (au plus `limit` unités).
+
+    Les salles sont dédoublées (entrée -> sortie, arc de la capacité de la salle) ;
+    les chemins augmentants sont les plus courts du graphe résiduel (Edmonds-Karp),
+    puis le flot est décomposé en chemins de salles.
+    """
+    residual: Dict[int, Dict[int, float]] = {}
+
+    def arc(a, b, capacity):
+        residual.setdefault(a, {})[b] = residual.get(a, {}).get(b, 0) + capacity
+        residual.setdefault(b, {}).setdefault(a, 0)
+
+    # Salle i : entrée 2i, sortie 2i + 1
+    for room, capacity in enumerate(capacities):
+        arc(2 * room, 2 * room + 1, min(capacity, limit))
+        for n in neighbors[room]:
+            arc(2 * room + 1, 2 * n, limit)
+
+    start, goal = 2 * source + 1, 2 * sink
+    total = 0
+    while total < limit:
+        parents = {start: None}
+        queue = deque([start])
+        while queue and goal not in parents:
+            node = queue.popleft()
+            for nxt, capacity in residual[node].items():
+                if capacity > 0 and nxt not in parents:
+                    parents[nxt] = node
+                    queue.append(nxt)
+        if goal not in parents:
+            break
+        path = [goal]
+        while parents[path[-1]] is not None:
+            path.append(parents[path[-1]])
+        path.reverse()
+        amount = min(limit - total, *(residual[a][b] for a, b in zip(path, path[1:])))
+        for a, b in zip(path, path[1:]):
+            residual[a][b] -= amount
+            residual[b][a] += amount
+        total += amount
+
+    # Flot net entre salles voisines, puis décomposition en chemins
+    flow = {}
+    for room in range(len(capacities)):
+        for n in neighbors[room]:
+            net = residual[2 * n][2 * room + 1] - residual[2 * room][2 * n + 1]
+            if net > 0:
+                flow[(room, n)] = net
+    routes = []
+    while True:
+        route = [source]
+        while route[-1] != sink:
+            nxt = next((n for n in neighbors[route[-1]]
+                        if flow.get((route[-1], n), 0) > 0 and n not in route), None)
+            if nxt is None:
+                break
+            route.append(nxt)
+        if route[-1] != sink:
+            return routes
+        amount = min(flow[(a, b)] for a, b in zip(route, route[1:]))
+        for a, b in zip(route, route[1:]):
+            flow[(a, b)] -= amount
+        routes.append(route)
+
+
+class ReservationPlanner:
+    """
+    Planifie les fourmis une à une contre une table de réservations espace-temps.
+
+    Les salles sont numérotées (0 = Sv) ; un plan est la salle occupée à chaque étape,
+    du départ de Sv (plan[0] à l'étape `departure`) jusqu'à Sd.
+    """
+
+    def __init__(self, colony: AntColony, max_expansions: int = MAX_EXPANSIONS):
+        self.colony = colony
+        self.max_expansions = max_expansions
+        rooms = colony.antnest.rooms
+        self.names = ["Sv", "Sd"] + [room for room in colony.adjacency if room not in ("Sv", "Sd")]
+        index = {room: i for i, room in enumerate(self.names)}
+        self.sd = index["Sd"] if "Sd" in colony.adjacency else None
+
+        capacities = [_UNLIMITED if room in ("Sv", "Sd") else rooms.get(room, 1) for room in self.names]
+        # Salles sans place : jamais empruntées
+        self.neighbors = [[index[n] for n in colony.adjacency.get(room, ()) if capacities[index[n]] >= 1]
+                          for room in self.names]
+        self.distance = [colony.distance_to_sd.get(room) for room in self.names]
+        self.table = ReservationTable(capacities)
+
+        # Itinéraires (salles, sans attente) et premier départ non refusé de chacun ;
+        # les chemins du flot maximal sont conservés, les itinéraires trouvés par A*
+        # forment une réserve limitée à MAX_TEMPLATES
+        self.templates: List[List[int]] = []
+        self.pointers: List[int] = []
+        if self.sd is not None and self.distance[0] is not None:
+            self.templates = flow_routes(self.neighbors, capacities, 0, self.sd, colony.antnest.ants)
+            self.pointers = [0] * len(self.templates)
+        self._kept = len(self.templates)
+        self.entries = [(1, n) for n in self.neighbors[0]]  # Première étape libre des voisines de Sv
+        heapq.heapify(self.entries)
+        self._skip = 0
+        self._backoff = 0
+        self.searches = 0
+
+    # ------------------------------------------------------------------ gabarits
+
+    def _template_departure(self, k: int, earliest: int) -> int:
+        """Premier départ possible du gabarit k (au plus tôt `earliest`)"""
+        route = self.templates[k]
+        departure = max(self.pointers[k], earliest)
+        while not self.table.fits(route, departure):
+            departure += 1
+        self.pointers[k] = departure
+        return departure
+
+    def _add_template(self, plan: List[int]):
+        """Mémorise l'itinéraire d'un plan (attentes retirées)"""
+        route = [plan[0]]
+        for room in plan[1:]:
+            if room != route[-1]:
+                route.append(room)
+        if route in self.templates:
+            return
+        if len(self.templates) - self._kept >= MAX_TEMPLATES:
+            # Remplace le gabarit de la réserve qui arrive le plus tard
+            worst = max(range(self._kept, len(self.templates)),
+                        key=lambda k: self.pointers[k] + len(self.templates[k]))
+            del self.templates[worst]
+            del self.pointers[worst]
+        self.templates.append(route)
+        self.pointers.append(0)
+
+    def _earliest_departure(self) -> int:
+        """Première étape où une fourmi peut quitter Sv (place libre dans une voisine)"""
+        # Tas (première étape libre possible, salle) : seules les salles en tête avancent
+        entries = self.entries
+        if not entries:
+            return 0
+        while not self.table.is_free(entries[0][1], entries[0][0]):
+            step, room = entries[0]
+            heapq.heapreplace(entries, (step + 1, room))
+        return entries[0][0] - 1
+
+    # ---------------------------------------------------------------------- A*
+
+    def _search(self, start: int, bound: float, limit: Optional[int]) -> Optional[List[int]]:
+        """
+        A* de (Sv, start) vers Sd : plan strictement plus court que `bound`, ou None
+        (au plus `limit` états développés, sans limite si None).
+
+        Heuristique : distance au dortoir (admissible, les attentes ne font que
+        rallonger). À coût égal : le moins d'attentes hors de Sv (une fourmi qui attend
+        dans une salle y occupe une place), puis les états les plus avancés.
+        """
+        self.searches += 1
+        distance, neighbors, is_free, sd = self.distance, self.neighbors, self.table.is_free, self.sd
+        heap = [(start + distance[0], 0, -start, 0, start, -1)]
+        states = []   # (salle, parent)
+        closed = set()
+        while heap and (limit is None or len(states) < limit):
+            f, waits, _, room, step, parent = heapq.heappop(heap)
+            if (room, step) in closed:
+                continue
+            closed.add((room, step))
+            states.append((room, parent))
+            if room == sd:
+                plan = []
+                i = len(states) - 1
+                while i >= 0:
+                    plan.append(states[i][0])
+                    i = states[i][1]
+                return plan[::-1]
+            me = len(states) - 1
+            following = step + 1
+            for nxt in (room, *neighbors[room]):
+                d = distance[nxt]
+                if d is None or following + d >= bound or (nxt, following) in closed:
+                    continue
+                if nxt == sd or is_free(nxt, following):
+                    waited = waits + (nxt == room and room != 0)
+                    heapq.heappush(heap, (following + d, waited, -following, nxt, following, me))
+        return None
+
+    # -------------------------------------------------------------- planification
+
+    def plan_ant(self) -> Tuple[int, List[int]]:
+        """Plan de la fourmi suivante (réservé dans la table) : (départ, salles)"""
+        earliest = self._earliest_departure()
+        # Gabarits par arrivée au plus tôt croissante (départ >= pointeur) : arrêt dès
+        # qu'aucun ne peut plus faire mieux que le meilleur trouvé
+        best = None
+        bound = _UNLIMITED
+        arrivals = [max(pointer, earliest) + len(route) - 1
+                    for pointer, route in zip(self.pointers, self.templates)]
+        for k in sorted(range(len(arrivals)), key=arrivals.__getitem__):
+            if arrivals[k] >= bound:
+                break
+            route = self.templates[k]
+            departure = self._template_departure(k, earliest)
+            if departure + len(route) - 1 < bound:
+                best = (departure, route)
+                bound = departure + len(route) - 1
+
+        ideal = earliest + self.distance[0]
+        if bound > ideal and self._skip == 0:
+            # Sans gabarit : recherche complète
+            plan = self._search(earliest, bound, self.max_expansions if best else None)
+            if plan is not None:
+                best = (earliest, plan)
+                self._add_template(plan)
+                self._backoff = 0
+            else:
+                self._backoff = min(MAX_BACKOFF, max(1, 2 * self._backoff))
+                self._skip = self._backoff
+        elif self._skip:
+            self._skip -= 1
+        if best is None:
+            raise RuntimeError("Aucun itinéraire trouvé vers le dortoir")
+
+        departure, plan = best
+        self.table.reserve_plan(plan, departure)
+        return departure, plan
+
+    def plan(self, ants: int) -> List[List[Tuple[int, str, str]]]:
+        """Planifie toutes les fourmis ; retourne l'historique des mouvements par étape"""
+        if self.sd is None or self.distance[0] is None:
+            return []
+        moves_by_step: Dict[int, List[Tuple[int, str, str]]] = {}
+        names = self.names
+        for ant_id in range(1, ants + 1):
+            departure, plan = self.plan_ant()
+            for i in range(1, len(plan)):
+                if plan[i] != plan[i - 1]:
+                    moves_by_step.setdefault(departure + i, []).append(
+                        (ant_id, names[plan[i - 1]], names[plan[i]]))
+        last = max(moves_by_step, default=0)
+        return [moves_by_step.get(step, []) for step in range(1, last + 1)]
+
+
+def plan_colony(colony: AntColony, max_expansions: int = MAX_EXPANSIONS) -> AntColony:
+    """
+    Planifie les fourmis d'une colonie neuve et y installe la solution.
+
+    L'état final (toutes les fourmis au dortoir, passages par tunnel) est écrit
+    directement plutôt que rejoué mouvement par mouvement.
+    """
+    start = time.perf_counter()
+    history = ReservationPlanner(colony, max_expansions).plan(colony.antnest.ants)
+
+    passages = Counter((old_room, new_room) for movements in history
+                       for _, old_room, new_room in movements)
+    for (old_room, new_room), count in passages.items():
+        edge = tuple(sorted((old_room, new_room)))
+        if edge in colony.edge_passages:
+            colony.edge_passages[edge] += count
+    arrived = [ant_id for movements in history for ant_id, _, new_room in movements if new_room == "Sd"]
+
+    if history:
+        for ant in colony.ants:
+            ant.current_room = "Sd"
+        colony.room_occupancy = {room: [] for room in colony.room_occupancy}
+        colony.room_occupancy["Sd"] = arrived
+    colony.movements_history = history
+    colony.step_count = len(history)
+    colony.planning_time = time.perf_counter() - start
+    return colony
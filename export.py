@@ -0,0 +1,267 @@
+'''
+Export hors écran des animations (MP4 / GIF) sans fenêtre interactive.
+
+Les images sont rendues avec le backend Agg dans un pool de processus : chaque
+processus reçoit une fois la fourmilière, le descripteur de la solution et les
+positions, puis rend des plages d'étapes contiguës en se positionnant directement
+sur la première étape de sa plage. La solution est publiée une fois en mémoire
+partagée (shared.py) : les processus s'y attachent sans copie sérialisée de
+l'historique et partent de l'image clé précédente. Les images sont transmises
+dans l'ordre à ffmpeg (si disponible) ou, à défaut, assemblées en GIF par Pillow.
+'''
+
+import math
+import os
+import shutil
+import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.util import Finalize
+
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from main import AntColony
+from layout import default_layout
+from rendering import StepRenderer
+from shared import SharedSolution, publish_solution
+from tracing import traced
+
+
+CHUNKS_PER_JOB = 4   # Plages d'étapes par processus (équilibrage de charge)
+PILLOW_FRAME_WARNING = 500   # Au-delà, le GIF Pillow (toutes les images en mémoire) est signalé
+
+# État du processus de rendu (initialisé une fois par processus)
+_worker = None
+
+
+class _FrameWorker:
+    """Rendu Agg réutilisé pour toutes les plages d'étapes d'un processus"""
+
+    def __init__(self, antnest, solution, pos, figsize, dpi):
+        # Solution lue en mémoire partagée : mouvements et passages lus à la demande,
+        # l'historique n'est jamais reconstitué dans le processus de rendu
+        self.solution = SharedSolution.attach(solution)
+        self.colony = AntColony(antnest)
+        self.visited_rooms = self.solution.visited_rooms()
+
+        self.figure = Figure(figsize=figsize, dpi=dpi)
+        self.canvas = FigureCanvasAgg(self.figure)
+        ax = self.figure.add_subplot()
+        self.figure.subplots_adjust(left=0.02, right=0.98, bottom=0.02, top=0.9)
+        self.renderer = StepRenderer(ax, self.colony, pos, solution=self.solution)
+
+    def render(self, start, stop):
+        """Rend les étapes [start, stop) et retourne les images RGB brutes"""
+        # Positionnement direct sur la première étape à partir de l'image clé précédente
+        occupancy = self.solution.occupancy_at(start)
+        frames = []
+        for step in range(start, stop):
+            if step > start:
+                for ant_id, old_room, new_room in self.solution.movements(step):
+                    occupancy[old_room].remove(ant_id)
+                    occupancy.setdefault(new_room, []).append(ant_id)
+            self.renderer.update(step, occupancy, self.visited_rooms)
+            frames.append(np.asarray(self.canvas.buffer_rgba())[..., :3].tobytes())
+        return frames
+
+    def close(self):
+        """Détache la solution partagée (fin du processus ou de l'export)"""
+        self.solution.close()
+
+
+def _init_worker(antnest, solution, pos, figsize, dpi):
+    global _worker
+    _worker = _FrameWorker(antnest, solution, pos, figsize, dpi)
+
+
+def _close_worker():
+    global _worker
+    if _worker is not None:
+        _worker.close()
+        _worker = None
+
+
+def _init_pool_worker(*init_args):
+    _init_worker(*init_args)
+    # Détachement à la sortie du processus de rendu (les processus du pool n'exécutent
+    # pas atexit, mais bien les finaliseurs de multiprocessing)
+    Finalize(None, _close_worker, exitpriority=10)
+
+
+def _render_chunk(start, stop):
+    return _worker.render(start, stop)
+
+
+class FFmpegWriter:
+    """
+    Encode des images RGB brutes via un tube vers ffmpeg.
+
+    La sortie d'erreur de ffmpeg va dans un fichier temporaire, lu à la fermeture :
+    un tube non lu pendant l'encodage pourrait se remplir et bloquer ffmpeg (et donc
+    l'écriture des images).
+    """
+
+    def __init__(self, path, size, fps):
+        width, height = size
+        command = [shutil.which("ffmpeg"), "-y", "-loglevel", "error",
+                   "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}",
+                   "-r", str(fps), "-i", "-"]
+        if path.lower().endswith(".gif"):
+            command += ["-vf", "split[a][b];[a]palettegen[p];[b][p]paletteuse"]
+        else:
+            # yuv420p (lisible partout) impose des dimensions paires
+            command += ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p"]
+        command.append(path)
+        self.stderr = tempfile.TemporaryFile()
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stderr=self.stderr)
+
+    def write(self, frame: bytes):
+        try:
+            self.process.stdin.write(frame)
+        except BrokenPipeError:
+            # ffmpeg s'est arrêté : son message d'erreur est plus utile que le tube cassé
+            self.close()
+            raise RuntimeError("ffmpeg s'est arrêté pendant l'encodage")
+
+    def close(self):
+        if self.process.stdin.closed:
+            return
+        try:
+            self.process.stdin.close()
+        except BrokenPipeError:
+            pass
+        returncode = self.process.wait()
+        self.stderr.seek(0)
+        stderr = self.stderr.read().decode(errors="replace")
+        self.stderr.close()
+        if returncode != 0:
+            raise RuntimeError(f"ffmpeg a échoué : {stderr.strip()}")
+
+
+class PillowGifWriter:
+    """
+    Assemble les images en GIF animé avec Pillow (sans dépendance externe).
+
+    Pillow écrit un GIF animé en une fois : toutes les images restent en mémoire
+    jusqu'à close(), soit environ largeur x hauteur octets par image après
+    quantification (près de 1 Mo en 1200x800). Pour de longues animations, ffmpeg
+    encode au fil de l'eau.
+    """
+
+    def __init__(self, path, size, fps):
+        self.path = path
+        self.size = size
+        self.duration = round(1000 / fps)
+        self.frames = []
+
+    def write(self, frame: bytes):
+        from PIL import Image
+        # Palette adaptative dès la réception pour limiter la mémoire
+        self.frames.append(Image.frombytes("RGB", self.size, frame)
+                           .quantize(colors=256, method=Image.Quantize.FASTOCTREE))
+
+    def close(self):
+        if not self.frames:
+            raise RuntimeError("Aucune image à écrire")
+        first, *others = self.frames
+        first.save(self.path, save_all=True, append_images=others,
+                   duration=self.duration, loop=0)
+
+
+def open_writer(path, size, fps, backend=None):
+    """
+    Ouvre le writer adapté : ffmpeg si disponible (MP4, GIF, ...), sinon Pillow (GIF seulement).
+
+    Args:
+        backend: "ffmpeg", "pillow" ou None (choix automatique)
+    """
+    if backend is None:
+        backend = "ffmpeg" if shutil.which("ffmpeg") else "pillow"
+
+    if backend == "ffmpeg":
+        if not shutil.which("ffmpeg"):
+            raise RuntimeError("ffmpeg introuvable dans le PATH")
+        return FFmpegWriter(path, size, fps)
+    if backend == "pillow":
+        if not path.lower().endswith(".gif"):
+            raise ValueError(f"Sans ffmpeg, seul l'export GIF est possible (reçu : {path})")
+        return PillowGifWriter(path, size, fps)
+    raise ValueError(f"Writer inconnu : {backend}")
+
+
+def frame_ranges(nb_frames, chunks):
+    """Découpe [0, nb_frames) en au plus `chunks` plages contiguës"""
+    size = max(1, math.ceil(nb_frames / max(1, chunks)))
+    return [(start, min(start + size, nb_frames)) for start in range(0, nb_frames, size)]
+
+
+@traced("export.export_animation", cat="render")
+def export_animation(colony, output, fps=2.0, jobs=None, pos=None,
+                     figsize=(12, 8), dpi=100, backend=None, verbose=True) -> int:
+    """
+    Exporte l'animation d'une colonie résolue vers un fichier MP4/GIF.
+
+    Args:
+        colony: colonie résolue (historique des mouvements rempli)
+        output: fichier de sortie (.mp4, .gif, ...)
+        fps: images par seconde (une image par étape)
+        jobs: nombre de processus de rendu (défaut: nombre de cœurs)
+        pos: positions des salles (défaut: layout.default_layout)
+    Returns:
+        Nombre d'images écrites
+    """
+    if pos is None:
+        pos = default_layout(colony.antnest, seed=42, k=2)
+
+    nb_frames = len(colony.movements_history) + 1  # État initial + une image par étape
+    jobs = max(1, min(jobs or os.cpu_count() or 1, nb_frames))
+    # Les processus de rendu s'attachent à la solution publiée en mémoire partagée
+    solution = publish_solution(colony)
+    init_args = (colony.antnest, solution.descriptor, pos, figsize, dpi)
+    ranges = frame_ranges(nb_frames, jobs * CHUNKS_PER_JOB)
+    size = FigureCanvasAgg(Figure(figsize=figsize, dpi=dpi)).get_width_height()
+
+    writer = open_writer(output, size, fps, backend)
+    if isinstance(writer, PillowGifWriter) and nb_frames > PILLOW_FRAME_WARNING and verbose:
+        print(f"⚠️  {nb_frames} images gardées en mémoire par Pillow "
+              f"(~{nb_frames * size[0] * size[1] // 2**20} Mo) : installez ffmpeg pour les longues animations")
+    written = 0
+    try:
+        if jobs == 1:
+            _init_worker(*init_args)
+            try:
+                for start, stop in ranges:
+                    for frame in _render_chunk(start, stop):
+                        writer.write(frame)
+                        written += 1
+            finally:
+                _close_worker()
+        else:
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_pool_worker,
+                                     initargs=init_args) as executor:
+                # Fenêtre de plages en cours : les images sont écrites dans l'ordre
+                # sans garder toute la vidéo en mémoire
+                pending = deque()
+                remaining = iter(ranges)
+                for start, stop in remaining:
+                    pending.append(executor.submit(_render_chunk, start, stop))
+                    if len(pending) >= jobs * 2:
+                        break
+                while pending:
+                    frames = pending.popleft().result()
+                    next_range = next(remaining, None)
+                    if next_range is not None:
+                        pending.append(executor.submit(_render_chunk, *next_range))
+                    for frame in frames:
+                        writer.write(frame)
+                        written += 1
+    finally:
+        writer.close()
+        solution.close()
+
+    if verbose:
+        print(f"✅ {written} images exportées dans {output}")
+    return written
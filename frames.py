@@ -0,0 +1,103 @@
+'''
+Ordonnanceur d'images de l'animation : la plus récente gagne.
+
+Le thread d'animation publie un instantané immuable par étape ; la boucle Tk
+prend l'instantané le plus récent lorsqu'elle est prête à dessiner. Les étapes
+publiées entre deux rendus sont abandonnées au lieu de s'accumuler, et le débit
+effectif (images rendues par seconde) est comparé au débit visé.
+'''
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+
+FPS_WINDOW = 20   # Nombre de rendus pris en compte pour le débit instantané
+
+
+@dataclass(frozen=True)
+class FrameSnapshot:
+    """État figé d'une étape (l'occupation n'est plus modifiée après publication)"""
+    step_num: int
+    occupancy: Mapping[str, Tuple[int, ...]]
+    colony: Any
+    pos: Mapping[str, Tuple[float, float]]
+    published_at: float
+
+    @property
+    def is_final(self) -> bool:
+        """Affichage final (après le dernier mouvement)"""
+        return self.step_num > len(self.colony.movements_history)
+
+
+def freeze_occupancy(occupancy) -> Mapping[str, Tuple[int, ...]]:
+    """Copie immuable de l'occupation (tuples dans un mappage en lecture seule)"""
+    return MappingProxyType({room: tuple(ants) for room, ants in occupancy.items()})
+
+
+class FrameScheduler:
+    """Emplacement unique « dernière image » partagé entre le producteur et la boucle Tk"""
+
+    def __init__(self, target_fps: float = None):
+        self.target_fps = target_fps
+        self._lock = threading.Lock()
+        self._pending: Optional[FrameSnapshot] = None
+        self._render_times = deque(maxlen=FPS_WINDOW)
+        self.published = 0
+        self.rendered = 0
+        self.dropped = 0
+        self._first_render = None
+        self._last_render = None
+
+    def publish(self, step_num, occupancy, colony, pos) -> FrameSnapshot:
+        """Publie l'instantané d'une étape (remplace l'image en attente non rendue)"""
+        # Les positions sont partagées telles quelles (même objet d'une étape à l'autre)
+        snapshot = FrameSnapshot(step_num, freeze_occupancy(occupancy), colony, pos,
+                                 time.perf_counter())
+        with self._lock:
+            if self._pending is not None:
+                self.dropped += 1
+            self._pending = snapshot
+            self.published += 1
+        return snapshot
+
+    def take(self) -> Optional[FrameSnapshot]:
+        """Retire l'image la plus récente (None si rien de nouveau)"""
+        with self._lock:
+            snapshot, self._pending = self._pending, None
+        return snapshot
+
+    def has_pending(self) -> bool:
+        """Indique si une image attend d'être rendue"""
+        with self._lock:
+            return self._pending is not None
+
+    def frame_rendered(self):
+        """Enregistre la fin du rendu d'une image"""
+        now = time.perf_counter()
+        self._render_times.append(now)
+        if self._first_render is None:
+            self._first_render = now
+        self._last_render = now
+        self.rendered += 1
+
+    def effective_fps(self) -> float:
+        """Débit des derniers rendus (images par seconde)"""
+        times = self._render_times
+        if len(times) < 2 or times[-1] == times[0]:
+            return 0.0
+        return (len(times) - 1) / (times[-1] - times[0])
+
+    def stats(self) -> dict:
+        """Bilan : images publiées, rendues, abandonnées et débits"""
+        elapsed = (self._last_render - self._first_render) if self.rendered > 1 else 0.0
+        return {
+            'published': self.published,
+            'rendered': self.rendered,
+            'dropped': self.dropped,
+            'effective_fps': (self.rendered - 1) / elapsed if elapsed > 0 else 0.0,
+            'target_fps': self.target_fps,
+        }
@@ -9,13 +9,26 @@ from tkinter import ttk, messagebox, scrolledtext, filedialog
 import time
 import threading
 import queue
+import heapq
+import itertools
 import random
 import string
+import multiprocessing
 import os
+import signal
+from bisect import bisect_left
+from types import MappingProxyType
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from main import load_antnest_from_txt, solve_antnest, AntNest
+from main import load_antnest_from_txt, solve_antnest, describe_solve_stop, AntNest
+from rendering import StepRenderer, arrow_segments, offset_segments, path_segments
+from layout import get_layout
+from frames import FrameScheduler
+from solver_process import SolveProcess
+import tracing
 
 
 class BottleneckAnalyzer:
@@ -284,9 +297,132 @@ class BottleneckAnalyzer:
             return "Erreur"
 
 
+class AnalysisTimeout(BaseException):
+    """Délai d'analyse dépassé (BaseException : ne doit pas être intercepté par les analyses)"""
+
+
+def analyze_nest_file(filepath, timeout=None):
+    """
+    Analyse une fourmilière (résolution + complexité) et retourne la ligne du tableau d'analyse.
+    
+    Exécutée dans un processus du pool d'analyse ; le délai est appliqué dans le
+    processus lui-même (SIGALRM, si disponible) pour libérer le processus.
+    """
+    filename = os.path.basename(filepath)
+    use_alarm = timeout and hasattr(signal, "SIGALRM")
+    
+    def on_timeout(signum, frame):
+        raise AnalysisTimeout
+    
+    if use_alarm:
+        previous_handler = signal.signal(signal.SIGALRM, on_timeout)
+    try:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, timeout)
+        antnest = load_antnest_from_txt(filepath)
+        
+        # Mesure du temps de résolution
+        start_time = time.perf_counter()
+        colony = solve_antnest(antnest)
+        end_time = time.perf_counter()
+        execution_time_ms = round((end_time - start_time) * 1000, 2)
+        
+        # Calcul de la complexité du réseau avec raisons et protection
+        try:
+            network_complexity = BottleneckAnalyzer.evaluate_network_complexity_with_reasons(antnest)
+            if network_complexity is None:
+                network_complexity = "Erreur"
+        except Exception:
+            network_complexity = "Erreur"
+        
+        return (antnest.name, antnest.ants, len(antnest.rooms), len(antnest.tubes),
+                len(colony.movements_history), f"{execution_time_ms:.2f}", network_complexity)
+    
+    except AnalysisTimeout:
+        return (filename, "-", "-", "-", "Délai dépassé", f"> {timeout * 1000:.0f}", "-")
+    except Exception:
+        # Ligne d'erreur pour identifier le problème
+        return (filename,) + ("Erreur",) * 6
+    finally:
+        if use_alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous_handler)
+
+
+class AnalysisBatch:
+    """
+    Analyse d'un lot de fourmilières dans un pool de processus.
+    
+    Les résultats sont publiés au fil de l'eau par la fonction `post` (la file de
+    messages de l'interface) : ("analysis_row", (index, valeurs)) pour chaque
+    fourmilière, ("analysis_progress", (terminées, total)) puis ("analysis_done", ...).
+    
+    Les processus sont lancés par « spawn » : un fork depuis l'interface copierait
+    l'état de Tk et des threads (animation, coordinateur) dans chaque processus.
+    """
+    
+    def __init__(self, filepaths, post, jobs=None, timeout=None):
+        self.filepaths = list(filepaths)
+        self.post = post
+        self.jobs = max(1, min(jobs or os.cpu_count() or 1, len(self.filepaths) or 1))
+        self.timeout = timeout
+        self.cancelled = threading.Event()
+        self.thread = None
+    
+    def start(self):
+        """Lance l'analyse dans un thread coordinateur (non bloquant)"""
+        self.thread = threading.Thread(target=self.run, name="analyse", daemon=True)
+        self.thread.start()
+        return self
+    
+    def cancel(self):
+        """Demande l'annulation : les fourmilières non commencées ne sont pas analysées"""
+        self.cancelled.set()
+    
+    @tracing.traced("AnalysisBatch.run", cat="gui")
+    def run(self):
+        """Soumet les fourmilières au pool et publie chaque ligne dès qu'elle est prête"""
+        total = len(self.filepaths)
+        done = 0
+        executor = ProcessPoolExecutor(max_workers=self.jobs,
+                                       mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = {executor.submit(analyze_nest_file, filepath, self.timeout): index
+                       for index, filepath in enumerate(self.filepaths)}
+            pending = set(futures)
+            while pending and not self.cancelled.is_set():
+                # Attente courte pour réagir rapidement à l'annulation
+                finished, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    index = futures[future]
+                    try:
+                        values = future.result()
+                    except Exception:  # Processus du pool interrompu
+                        values = (os.path.basename(self.filepaths[index]),) + ("Erreur",) * 6
+                    done += 1
+                    self.post(("analysis_row", (index, values)))
+                    self.post(("analysis_progress", (done, total)))
+            # Annulation : les fourmilières non commencées ne sont pas analysées
+            for future in pending:
+                future.cancel()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self.post(("analysis_done", (done, total, self.cancelled.is_set())))
+
+
 class FourmiGUI:
     """Interface graphique principale"""
     
+    # Limites de l'affichage de tous les chemins possibles
+    MAX_DISPLAYED_PATHS = 12        # Nombre de plus courts chemins dessinés
+    PATH_COUNT_CAP = 10000          # Arrêt du comptage des chemins non affichés
+    PATH_SEARCH_TIME_BUDGET = 0.5   # Budget de temps de la recherche (secondes)
+    
+    ANALYSIS_TIMEOUT = 30.0         # Délai maximal d'analyse par fourmilière (secondes)
+    
+    QUEUE_POLL_MS = 100             # Intervalle de traitement de la file de messages
+    FRAME_POLL_MS = 15              # Intervalle pendant une animation (prise de la dernière image)
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Une vie de fourmi - Interface Graphique")
@@ -294,7 +430,7 @@ class FourmiGUI:
         
         # Variables d'état
         self.animation_running = False
-        self.message_queue = queue.Queue()
+        self.message_queue = tracing.TracedQueue()  # Passages de relais visibles dans la trace
         self.gui_active = True  # Flag pour arrêter process_queue
         self.process_queue_id = None  # ID du callback pour pouvoir l'annuler
         
@@ -308,6 +444,13 @@ class FourmiGUI:
         self.last_occupancy = None
         self.last_colony = None
         self.last_pos = None
+        self.renderer = None  # Rendu persistant (blitting) des étapes intermédiaires
+        self.frame_scheduler = None  # Dernière image publiée par le thread d'animation
+        self.solve_process = None    # Résolution en cours dans un processus séparé
+        
+        # Analyse en lot (pool de processus)
+        self.analysis_batch = None
+        self.analysis_indices = []  # Index (ordre des fichiers) des lignes déjà insérées
         
         # Variables pour la sélection des chemins individuels
         self.path_groups = {}  # Stockage des groupes de chemins
@@ -366,86 +509,70 @@ class FourmiGUI:
             colormap = cm.get_cmap('tab20')
             return [colormap(i / num_paths) for i in range(num_paths)]
     
+    @staticmethod
+    def get_path_groups(colony):
+        """Groupes de fourmis ayant suivi le même chemin, calculés une seule fois par solution
+        
+        Returns:
+            Liste de (chemin, [identifiants des fourmis]) dans l'ordre de première apparition
+        """
+        cache = getattr(colony, '_path_groups', None)
+        if cache is not None and cache[0] == len(colony.movements_history):
+            return cache[1]
+        
+        path_groups = {}
+        for ant_id, path in FourmiGUI.extract_ant_paths(colony).items():
+            path_groups.setdefault(tuple(path), []).append(ant_id)
+        groups = list(path_groups.items())
+        colony._path_groups = (len(colony.movements_history), groups)
+        return groups
+    
     @staticmethod
     def draw_ant_paths(colony, pos, ax, selected_paths=None):
         """Dessine les chemins complets de chaque fourmi avec des couleurs différentes
         
+        Tous les segments sont décalés et raccourcis en une passe NumPy, puis dessinés
+        par une LineCollection (corps des flèches) et une seconde (pointes).
+        
         Args:
             colony: La colonie de fourmis
             pos: Positions des nœuds
             ax: Axes matplotlib
             selected_paths: Liste des indices des chemins sélectionnés (None = tous)
         """
-        ant_paths = FourmiGUI.extract_ant_paths(colony)
+        from matplotlib.collections import LineCollection
+        from matplotlib.colors import to_rgba_array
+        from matplotlib.lines import Line2D
         
-        # Regrouper les chemins identiques
-        path_groups = {}
-        for ant_id, path in ant_paths.items():
-            path_key = tuple(path)
-            if path_key not in path_groups:
-                path_groups[path_key] = []
-            path_groups[path_key].append(ant_id)
+        path_groups = FourmiGUI.get_path_groups(colony)
         
         # Filtrer selon la sélection si fournie
-        unique_paths = list(path_groups.keys())
         if selected_paths is not None:
-            # Garder seulement les chemins sélectionnés
-            filtered_groups = {}
-            for i, (path_key, ant_ids) in enumerate(path_groups.items()):
-                if i in selected_paths:
-                    filtered_groups[path_key] = ant_ids
-            path_groups = filtered_groups
-            unique_paths = list(path_groups.keys())
-        
-        # Générer les couleurs pour chaque groupe de chemins
-        colors = FourmiGUI.generate_path_colors(len(unique_paths))
+            selected = set(selected_paths)
+            path_groups = [group for i, group in enumerate(path_groups) if i in selected]
+        if not path_groups:
+            return 0
         
+        # Couleur, épaisseur (selon le nombre de fourmis) et décalage de chaque groupe
+        colors = FourmiGUI.generate_path_colors(len(path_groups))
+        group_colors = to_rgba_array([colors[idx % len(colors)] for idx in range(len(path_groups))], alpha=0.8)
+        group_widths = np.array([min(1.5 + len(ant_ids) * 0.5, 4) for _, ant_ids in path_groups])
+        group_offsets = (np.arange(len(path_groups)) % 3 - 1) * 0.02  # -0.02, 0, +0.02
+        
+        # Segments décalés perpendiculairement, flèches raccourcies aux extrémités
+        starts, ends, owner = path_segments([path for path, _ in path_groups], pos)
+        if len(owner):
+            starts, ends = offset_segments(starts, ends, group_offsets[owner])
+            arrows = arrow_segments(starts, ends).reshape(-1, 3, 2, 2)
+            ax.add_collection(LineCollection(arrows[:, 0], colors=group_colors[owner],
+                                             linewidths=group_widths[owner], zorder=3))
+            ax.add_collection(LineCollection(arrows[:, 1:].reshape(-1, 2, 2),
+                                             colors=np.repeat(group_colors[owner], 2, axis=0),
+                                             linewidths=np.repeat(group_widths[owner], 2), zorder=3))
+        
+        # Légende : une entrée par groupe de chemins
         legend_handles = []
-        
-        for idx, (path, ant_ids) in enumerate(path_groups.items()):
-            color = colors[idx % len(colors)]
-            
-            # Dessiner le chemin
-            for i in range(len(path) - 1):
-                room1, room2 = path[i], path[i + 1]
-                if room1 in pos and room2 in pos:
-                    x1, y1 = pos[room1]
-                    x2, y2 = pos[room2]
-                    
-                    # Calculer un léger décalage pour éviter la superposition des flèches
-                    offset_multiplier = (idx % 3 - 1) * 0.02  # -0.02, 0, +0.02
-                    
-                    # Décaler perpendiculairement à la direction de la flèche
-                    dx, dy = x2 - x1, y2 - y1
-                    length = (dx**2 + dy**2)**0.5
-                    if length > 0:
-                        perp_dx = -dy / length * offset_multiplier
-                        perp_dy = dx / length * offset_multiplier
-                    else:
-                        perp_dx = perp_dy = 0
-                    
-                    # Positions avec décalage
-                    x1_offset = x1 + perp_dx
-                    y1_offset = y1 + perp_dy
-                    x2_offset = x2 + perp_dx
-                    y2_offset = y2 + perp_dy
-                    
-                    # Réduire la longueur de la flèche pour ne pas toucher les nœuds
-                    arrow_reduction = 0.15
-                    arrow_dx = x2_offset - x1_offset
-                    arrow_dy = y2_offset - y1_offset
-                    x1_arrow = x1_offset + arrow_dx * arrow_reduction
-                    y1_arrow = y1_offset + arrow_dy * arrow_reduction
-                    x2_arrow = x2_offset - arrow_dx * arrow_reduction
-                    y2_arrow = y2_offset - arrow_dy * arrow_reduction
-                    
-                    # Épaisseur basée sur le nombre de fourmis suivant ce chemin
-                    line_width = min(1.5 + len(ant_ids) * 0.5, 4)
-                    
-                    ax.annotate('', xy=(x2_arrow, y2_arrow), xytext=(x1_arrow, y1_arrow),
-                               arrowprops=dict(arrowstyle='->', color=color, lw=line_width, alpha=0.8))
-            
-            # Créer une légende
+        for idx, (path, ant_ids) in enumerate(path_groups):
             if len(ant_ids) == 1:
                 legend_label = f"f{ant_ids[0]}: {' → '.join(path)}"
             elif len(ant_ids) <= 3:
@@ -462,135 +589,241 @@ class FourmiGUI:
                 else:
                     legend_label = f"{len(ant_ids)} fourmis: {path_short}"
             
-            from matplotlib.lines import Line2D
-            legend_handles.append(Line2D([0], [0], color=color, lw=line_width, label=legend_label))
+            legend_handles.append(Line2D([0], [0], color=colors[idx % len(colors)],
+                                         lw=group_widths[idx], label=legend_label))
         
         # Ajouter la légende
-        if legend_handles:
-            ax.legend(handles=legend_handles, loc='upper right', bbox_to_anchor=(1, 1), 
-                     fontsize=8, framealpha=0.9, title="Chemins des fourmis")
+        ax.legend(handles=legend_handles, loc='upper right', bbox_to_anchor=(1, 1), 
+                 fontsize=8, framealpha=0.9, title="Chemins des fourmis")
+        
+        return len(path_groups)
+    
+    @staticmethod
+    def iter_shortest_paths(graph, source="Sv", target="Sd", max_paths=None, time_budget=None):
+        """Énumère paresseusement les chemins simples par longueur croissante
+        
+        Recherche au meilleur d'abord sur les chemins partiels, ordonnés par longueur
+        + distance restante (BFS depuis la cible) : les chemins complets sortent par
+        longueur croissante. Le budget est vérifié à chaque extension, pas seulement
+        entre deux chemins produits.
+        
+        Args:
+            graph: Graphe NetworkX de la fourmilière
+            source: Salle de départ
+            target: Salle d'arrivée
+            max_paths: Nombre maximal de chemins produits (None = pas de limite)
+            time_budget: Budget de temps en secondes (None = pas de limite)
+        """
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        if source not in graph or target not in graph or max_paths == 0:
+            return
+        distance = nx.single_source_shortest_path_length(graph, target)
+        if source not in distance:
+            return
+        
+        order = itertools.count()
+        frontier = [(distance[source], next(order), (source,))]
+        produced = 0
+        while frontier:
+            if deadline is not None and time.perf_counter() > deadline:
+                return
+            _, _, path = heapq.heappop(frontier)
+            node = path[-1]
+            if node == target:
+                yield list(path)
+                produced += 1
+                if max_paths is not None and produced >= max_paths:
+                    return
+                continue
+            for neighbor in graph.adj[node]:
+                if neighbor in distance and neighbor not in path:
+                    heapq.heappush(frontier, (len(path) + distance[neighbor], next(order),
+                                              path + (neighbor,)))
+    
+    @staticmethod
+    def count_simple_paths(graph, source="Sv", target="Sd", count_cap=None, time_budget=None):
+        """Compte les chemins simples (parcours en profondeur itératif, sans les stocker)
+        
+        Le budget est vérifié pendant le parcours (toutes les 64 extensions) ; la
+        profondeur est bornée par le nombre de salles reliées à la cible.
+        
+        Returns:
+            (nombre de chemins comptés, comptage exhaustif)
+        """
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        if source not in graph or target not in graph:
+            return 0, True
+        reachable = nx.node_connected_component(graph, target)
+        if source not in reachable:
+            return 0, True
+        
+        stack = [(source, iter(graph.adj[source]))]
+        on_path = {source}
+        count = 0
+        expansions = 0
+        while stack:
+            expansions += 1
+            if deadline is not None and expansions % 64 == 0 and time.perf_counter() > deadline:
+                return count, False
+            node, neighbors = stack[-1]
+            neighbor = next(neighbors, None)
+            if neighbor is None:
+                stack.pop()
+                on_path.discard(node)
+            elif neighbor == target:
+                count += 1
+                if count_cap is not None and count >= count_cap:
+                    return count, False
+            elif neighbor not in on_path and neighbor in reachable:
+                on_path.add(neighbor)
+                stack.append((neighbor, iter(graph.adj[neighbor])))
+        return count, True
+    
+    @staticmethod
+    def collect_possible_paths(graph, max_paths=None, count_cap=None, time_budget=None):
+        """Retourne les k plus courts chemins Sv → Sd et le nombre de chemins non affichés
         
-        return len(unique_paths)
+        La recherche des plus courts chemins et le comptage des chemins restants ont
+        chacun le budget de temps complet ; le comptage s'arrête aussi à count_cap
+        chemins. Le booléen retourné indique si le résultat est exhaustif.
+        
+        Returns:
+            (chemins affichés, nombre de chemins restants, comptage exhaustif)
+        """
+        if max_paths is None:
+            max_paths = FourmiGUI.MAX_DISPLAYED_PATHS
+        if count_cap is None:
+            count_cap = FourmiGUI.PATH_COUNT_CAP
+        if time_budget is None:
+            time_budget = FourmiGUI.PATH_SEARCH_TIME_BUDGET
+        
+        start = time.perf_counter()
+        shown = list(FourmiGUI.iter_shortest_paths(graph, "Sv", "Sd", max_paths, time_budget))
+        if len(shown) < max_paths:
+            # Recherche épuisée (ou budget écoulé) : rien de plus à compter
+            exhaustive = time.perf_counter() - start <= time_budget
+            return shown, 0, exhaustive
+        
+        # Compter les chemins restants sans les stocker (ordre indifférent)
+        total, exhaustive = FourmiGUI.count_simple_paths(graph, "Sv", "Sd", count_cap, time_budget)
+        return shown, max(0, total - len(shown)), exhaustive
     
     @staticmethod
-    def draw_all_possible_paths(colony, pos, ax):
-        """Dessine tous les chemins possibles entre Sv et Sd avec décalage et couleurs uniques
+    def possible_paths(colony):
+        """Chemins possibles de la colonie (collect_possible_paths), calculés une fois par solution
+        
+        Appelée par le thread d'animation avant l'affichage final : la boucle Tk ne
+        fait alors que relire le résultat.
+        """
+        cache = getattr(colony, '_possible_paths', None)
+        if cache is not None and cache[0] == len(colony.movements_history):
+            return cache[1]
+        
+        result = FourmiGUI.collect_possible_paths(colony.graph)
+        colony._possible_paths = (len(colony.movements_history), result)
+        return result
+    
+    @staticmethod
+    def _used_paths(colony):
+        """Ensemble des chemins empruntés (tuples de salles), calculé une seule fois par solution"""
+        cache = getattr(colony, '_used_paths', None)
+        if cache is not None and cache[0] == len(colony.movements_history):
+            return cache[1]
+        
+        used_paths = {tuple(path) for path, _ in FourmiGUI.get_path_groups(colony)}
+        colony._used_paths = (len(colony.movements_history), used_paths)
+        return used_paths
+    
+    @staticmethod
+    def draw_all_possible_paths(colony, pos, ax, max_paths=None, time_budget=None):
+        """Dessine les k plus courts chemins entre Sv et Sd avec décalage et couleurs uniques
+        
+        Les chemins sont énumérés paresseusement par longueur croissante ; au-delà de
+        max_paths, un indicateur « N autres chemins non affichés » est ajouté à la légende.
+        La géométrie décalée est calculée en une passe NumPy : une LineCollection pour
+        les chemins et une pour les flèches de sens.
         
         Args:
             colony: La colonie de fourmis
             pos: Positions des nœuds
             ax: Axes matplotlib
+            max_paths: Nombre maximal de chemins dessinés (défaut: MAX_DISPLAYED_PATHS)
+            time_budget: Budget de temps de la recherche en secondes
         """
         try:
-            # Trouver tous les chemins possibles entre Sv et Sd
-            all_paths = list(nx.all_simple_paths(colony.graph, "Sv", "Sd"))
+            from matplotlib.collections import LineCollection
+            from matplotlib.colors import to_rgba_array
+            from matplotlib.lines import Line2D
+            
+            # Trouver les plus courts chemins entre Sv et Sd (énumération bornée, déjà
+            # calculée par le thread d'animation pour les paramètres par défaut)
+            if max_paths is None and time_budget is None:
+                all_paths, hidden_count, exhaustive = FourmiGUI.possible_paths(colony)
+            else:
+                all_paths, hidden_count, exhaustive = FourmiGUI.collect_possible_paths(
+                    colony.graph, max_paths=max_paths, time_budget=time_budget)
             
             if not all_paths:
                 print("⚠️  Aucun chemin trouvé entre Sv et Sd")
                 return 0
             
-            # Chemins effectivement utilisés par les fourmis
-            ant_paths = FourmiGUI.extract_ant_paths(colony)
-            used_paths = set()
-            for ant_id, path in ant_paths.items():
-                used_paths.add(tuple(path))
+            # Chemins effectivement utilisés par les fourmis (ensemble calculé une fois)
+            used_paths = FourmiGUI._used_paths(colony)
+            is_used = np.array([tuple(path) in used_paths for path in all_paths])
+            used_count = int(is_used.sum())
+            unused_count = len(all_paths) - used_count
             
-            # Générer des couleurs uniques pour chaque chemin
+            # Style de chaque chemin : couleur unique, trait continu si emprunté, pointillés sinon
             colors = FourmiGUI.generate_path_colors(len(all_paths))
-            
-            # Dessiner chaque chemin possible avec décalage et couleur unique
+            alphas = np.where(is_used, 0.9, 0.6)
+            widths = np.where(is_used, 2.8, 2.0)
+            styles = ['-' if used else '--' for used in is_used]
+            rgba = to_rgba_array(colors)
+            rgba[:, 3] = alphas
+            
+            # Décalage variable, alternativement à gauche et à droite
+            indices = np.arange(len(all_paths))
+            offsets = (0.08 + (indices % 6) * 0.015) * np.where(indices % 2 == 0, 1, -1)
+            
+            starts, ends, owner = path_segments(all_paths, pos)
+            if len(owner):
+                starts, ends = offset_segments(starts, ends, offsets[owner])
+                ax.add_collection(LineCollection(np.stack([starts, ends], axis=1),
+                                                 colors=rgba[owner], linewidths=widths[owner],
+                                                 linestyles=[styles[i] for i in owner], zorder=2))
+                
+                # Flèche de sens sur le premier segment de chaque chemin (entre 20 % et 35 %)
+                first = np.flatnonzero(np.r_[True, owner[1:] != owner[:-1]])
+                first = first[[all_paths[owner[i]][0] in pos and all_paths[owner[i]][1] in pos for i in first]]
+                delta = ends[first] - starts[first]
+                arrows = arrow_segments(starts[first] + delta * 0.2, starts[first] + delta * 0.35,
+                                        offset=0, head=0.4)
+                arrow_owner = np.repeat(owner[first], 3)
+                ax.add_collection(LineCollection(arrows, colors=rgba[arrow_owner],
+                                                 linewidths=widths[arrow_owner] * 0.7, zorder=2))
+            
+            # Entrées de légende
             legend_handles = []
-            from matplotlib.lines import Line2D
-            used_count = 0
-            unused_count = 0
-            
             for path_idx, path in enumerate(all_paths):
-                path_tuple = tuple(path)
-                is_used = path_tuple in used_paths
-                
-                # Couleur unique pour ce chemin
-                color = colors[path_idx]
-                alpha = 0.9 if is_used else 0.6
-                line_width = 2.8 if is_used else 2.0
-                style = '-' if is_used else '--'  # Ligne continue si emprunté, pointillés sinon
-                
-                if is_used:
-                    used_count += 1
-                else:
-                    unused_count += 1
-                
-                # Calculer le décalage pour ce chemin (différent pour chaque chemin)
-                offset_distance = 0.08 + (path_idx % 6) * 0.015  # Décalage variable
-                offset_side = 1 if (path_idx % 2) == 0 else -1  # Alternance gauche/droite
-                
-                # Dessiner le chemin avec décalage
-                for i in range(len(path) - 1):
-                    room1, room2 = path[i], path[i + 1]
-                    if room1 in pos and room2 in pos:
-                        x1, y1 = pos[room1]
-                        x2, y2 = pos[room2]
-                        
-                        # Calculer le vecteur perpendiculaire pour le décalage
-                        dx = x2 - x1
-                        dy = y2 - y1
-                        length = (dx*dx + dy*dy)**0.5
-                        
-                        if length > 0:
-                            # Vecteur perpendiculaire normalisé
-                            perp_x = -dy / length * offset_distance * offset_side
-                            perp_y = dx / length * offset_distance * offset_side
-                            
-                            # Positions décalées
-                            x1_offset = x1 + perp_x
-                            y1_offset = y1 + perp_y
-                            x2_offset = x2 + perp_x
-                            y2_offset = y2 + perp_y
-                            
-                            # Dessiner la ligne décalée avec style approprié
-                            ax.plot([x1_offset, x2_offset], [y1_offset, y2_offset], 
-                                   color=color, alpha=alpha, linewidth=line_width, 
-                                   linestyle=style, zorder=2)
-                
-                # Ajouter une flèche au début du chemin pour indiquer le sens
-                if len(path) >= 2 and path[0] in pos and path[1] in pos:
-                    x1, y1 = pos[path[0]]
-                    x2, y2 = pos[path[1]]
-                    
-                    # Calculer le décalage pour la flèche
-                    dx = x2 - x1
-                    dy = y2 - y1
-                    length = (dx*dx + dy*dy)**0.5
-                    
-                    if length > 0:
-                        perp_x = -dy / length * offset_distance * offset_side
-                        perp_y = dx / length * offset_distance * offset_side
-                        
-                        x1_offset = x1 + perp_x
-                        y1_offset = y1 + perp_y
-                        x2_offset = x2 + perp_x
-                        y2_offset = y2 + perp_y
-                        
-                        # Position de la flèche (vers le début du chemin)
-                        arrow_start_x = x1_offset + (x2_offset - x1_offset) * 0.2
-                        arrow_start_y = y1_offset + (y2_offset - y1_offset) * 0.2
-                        arrow_end_x = x1_offset + (x2_offset - x1_offset) * 0.35
-                        arrow_end_y = y1_offset + (y2_offset - y1_offset) * 0.35
-                        
-                        ax.annotate('', xy=(arrow_end_x, arrow_end_y), 
-                                   xytext=(arrow_start_x, arrow_start_y),
-                                   arrowprops=dict(arrowstyle='->', color=color, 
-                                                 lw=line_width*0.7, alpha=alpha))
-                
-                # Créer l'entrée de légende pour ce chemin
                 path_str = " → ".join(path)
                 if len(path_str) > 25:
                     path_str = f"{path[0]} → ... → {path[-1]}"
                 
-                status_text = "emprunté" if is_used else "non utilisé"
+                status_text = "emprunté" if is_used[path_idx] else "non utilisé"
                 legend_label = f"{path_str} ({status_text})"
                 
-                legend_handles.append(Line2D([0], [0], color=color, lw=line_width, 
-                                           linestyle=style, alpha=alpha, label=legend_label))
+                legend_handles.append(Line2D([0], [0], color=colors[path_idx], lw=widths[path_idx], 
+                                           linestyle=styles[path_idx], alpha=alphas[path_idx],
+                                           label=legend_label))
+            
+            # Indicateur des chemins non affichés
+            if hidden_count > 0:
+                more = f"{hidden_count}" if exhaustive else f"{hidden_count}+"
+                legend_handles.append(Line2D([0], [0], linestyle='none',
+                                           label=f"… {more} autres chemins non affichés"))
+            elif not exhaustive:
+                legend_handles.append(Line2D([0], [0], linestyle='none',
+                                           label="… recherche interrompue (budget de temps)"))
             
             # Ajouter la légende
             if legend_handles:
@@ -598,7 +831,8 @@ class FourmiGUI:
                          fontsize=8, framealpha=0.9, title="Chemins possibles",
                          ncol=1 if len(legend_handles) <= 8 else 2)
             
-            print(f"📍 Affichage de {len(all_paths)} chemins possibles ({used_count} empruntés, {unused_count} non utilisés)")
+            print(f"📍 Affichage de {len(all_paths)} chemins possibles ({used_count} empruntés, {unused_count} non utilisés)"
+                  + (f", {hidden_count}{'' if exhaustive else '+'} non affichés" if hidden_count else ""))
             return len(all_paths)
             
         except Exception as e:
@@ -1025,8 +1259,18 @@ class FourmiGUI:
         ttk.Label(self.analysis_frame, text="Analyse complète des fourmilières", 
                  style='Title.TLabel').pack(pady=10)
         
-        ttk.Button(self.analysis_frame, text="Analyser toutes les fourmilières", 
-                  command=self.analyze_all, style='Action.TButton').pack(pady=10)
+        buttons_frame = ttk.Frame(self.analysis_frame)
+        buttons_frame.pack(pady=10)
+        self.analyze_button = ttk.Button(buttons_frame, text="Analyser toutes les fourmilières", 
+                                         command=self.analyze_all, style='Action.TButton')
+        self.analyze_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_analysis_button = ttk.Button(buttons_frame, text="Annuler", 
+                                                 command=self.cancel_analysis, state='disabled')
+        self.cancel_analysis_button.pack(side=tk.LEFT, padx=5)
+        
+        # Progression de l'analyse (une unité par fourmilière)
+        self.analysis_progress = ttk.Progressbar(self.analysis_frame, mode='determinate', length=400)
+        self.analysis_progress.pack(pady=(0, 5))
         
         # Tableau des résultats
         columns = ("Fourmilière", "Fourmis", "Salles", "Tunnels", "Étapes", "Temps (ms)", "Complexité Réseau")
@@ -1464,6 +1708,7 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         thread.daemon = True
         thread.start()
     
+    @tracing.traced("FourmiGUI.animation_thread", cat="gui")
     def animation_thread(self, filename, delay):
         """Thread d'animation"""
         try:
@@ -1471,9 +1716,23 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
             self.message_queue.put(("status", f"Animation de {filename}..."))
             self.message_queue.put(("append_result", f"🎬 Démarrage de l'animation {filename}\nVitesse: {delay}s par étape\n\n"))
             
-            # Charger et résoudre
+            # Charger et résoudre dans un processus séparé (interface fluide, annulation réelle)
             antnest = load_antnest_from_txt(f"fourmilieres/{filename}")
-            colony = solve_antnest(antnest)
+            solve_process = self.solve_process = SolveProcess(antnest).start()
+            try:
+                colony = solve_process.wait(
+                    on_steps=lambda steps: self.message_queue.put(
+                        ("status", f"Résolution de {filename}... {steps} étapes")))
+            finally:
+                self.solve_process = None
+            if colony is None:
+                self.message_queue.put(("append_result", "⏹️ Résolution annulée\n"))
+                return
+            if not colony.all_ants_arrived():
+                # Résolution arrêtée (blocage, oscillation...) : l'animation est partielle
+                message = describe_solve_stop(solve_process.diagnostic)
+                self.message_queue.put(("append_result", f"⚠️ {message}\n"))
+                self.message_queue.put(("status", message))
             
             # Animation dans l'interface
             self.animate_in_gui(colony, delay)
@@ -1486,39 +1745,30 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
     
     def animate_in_gui(self, colony, delay):
         """Anime la solution dans l'interface - SANS THREADING"""
-        # Créer figure matplotlib dans le thread principal
-        self.message_queue.put(("create_plot", colony))
+        # Images publiées dans un emplacement unique : la boucle Tk dessine toujours
+        # la plus récente et abandonne les étapes intermédiaires si elle est en retard
+        scheduler = FrameScheduler(target_fps=1 / delay if delay > 0 else None)
+        
+        # Créer figure matplotlib dans le thread principal ; la boucle Tk n'adopte
+        # l'ordonnanceur qu'une fois la figure créée (aucune image dessinée avant)
+        self.message_queue.put(("create_plot", (colony, scheduler)))
         
-        # Position des nœuds avec algorithme adapté à la complexité
-        nb_nodes = len(colony.graph.nodes())
+        # Position des nœuds avec algorithme adapté à la complexité (mises en cache par fourmilière)
+        nb_nodes = len(colony.adjacency)
         
         if nb_nodes <= 4:
             # Fourmilières simples : spring layout avec plus d'espace
-            pos = nx.spring_layout(colony.graph, seed=42, k=3, iterations=50)
+            pos = get_layout(colony.antnest, "spring", seed=42, k=3, iterations=50)
         elif nb_nodes <= 8:
-            # Fourmilières moyennes : combinaison spring + circular
-            try:
-                pos = nx.spring_layout(colony.graph, seed=42, k=2.5, iterations=100)
-                # Forcer Sv et Sd aux extrémités si possible
-                if 'Sv' in pos and 'Sd' in pos:
-                    pos['Sv'] = (-1.2, 0)
-                    pos['Sd'] = (1.2, 0)
-            except:
-                pos = nx.circular_layout(colony.graph)
+            # Fourmilières moyennes : spring layout avec Sv et Sd aux extrémités
+            pos = get_layout(colony.antnest, "spring", seed=42, k=2.5, iterations=100)
+            if 'Sv' in pos and 'Sd' in pos:
+                pos['Sv'] = (-1.2, 0)
+                pos['Sd'] = (1.2, 0)
         else:
-            # Fourmilières complexes : algorithme multicouches
-            try:
-                # Essayer d'abord un layout par couches (hiérarchique)
-                pos = nx.shell_layout(colony.graph, nlist=[['Sv'], 
-                    [n for n in colony.graph.nodes() if n not in ['Sv', 'Sd']], 
-                    ['Sd']] if 'Sv' in colony.graph.nodes() and 'Sd' in colony.graph.nodes() else None)
-            except:
-                try:
-                    # Fallback: spring layout avec plus d'espace et d'itérations
-                    pos = nx.spring_layout(colony.graph, seed=42, k=4, iterations=200)
-                except:
-                    # Dernier recours: circular layout
-                    pos = nx.circular_layout(colony.graph)
+            # Fourmilières complexes : couches par distance au dortoir (Sv à gauche, Sd à droite)
+            pos = get_layout(colony.antnest, "layered")
+        pos = MappingProxyType(pos)  # Partagé en lecture seule par toutes les images
         
         # État initial
         occupancy = {room: [] for room in colony.antnest.rooms.keys()}
@@ -1526,7 +1776,7 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         occupancy["Sd"] = []
         
         # Animation initiale
-        self.message_queue.put(("draw_step", (0, occupancy, colony, pos)))
+        scheduler.publish(0, occupancy, colony, pos)
         time.sleep(delay)
         
         # Animation étape par étape
@@ -1544,7 +1794,7 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
                 occupancy[new_room].append(ant_id)
             
             # Dessiner l'étape
-            self.message_queue.put(("draw_step", (step_num, occupancy, colony, pos)))
+            scheduler.publish(step_num, occupancy, colony, pos)
             
             # Afficher les mouvements
             result_text = f"+++ ÉTAPE {step_num} +++\n"
@@ -1555,10 +1805,12 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
             self.message_queue.put(("append_result", result_text))
             time.sleep(delay)
         
-        # Étape finale : affichage propre sans flèches
+        # Étape finale : affichage propre sans flèches. Les chemins possibles sont
+        # énumérés ici, hors de la boucle Tk (superposition « tous les chemins »)
         if self.animation_running:
+            FourmiGUI.possible_paths(colony)
             final_step = len(colony.movements_history) + 1
-            self.message_queue.put(("draw_step", (final_step, occupancy, colony, pos)))
+            scheduler.publish(final_step, occupancy, colony, pos)
             time.sleep(delay)
         
         # Résultat final
@@ -1567,8 +1819,11 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         self.message_queue.put(("status", "Animation terminée"))
     
     def stop_animation(self):
-        """Arrête l'animation"""
+        """Arrête l'animation (et la résolution en cours, le cas échéant)"""
         self.animation_running = False
+        solve_process = self.solve_process
+        if solve_process is not None:
+            solve_process.cancel()
         self.status_var.set("Animation arrêtée")
     
     def reset_animation(self):
@@ -1592,76 +1847,50 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
                                    self.last_colony, self.last_pos)
     
     def analyze_all(self):
-        """Analyse toutes les fourmilières"""
-        self.status_var.set("Analyse en cours...")
+        """Analyse toutes les fourmilières dans un pool de processus (interface non bloquée)"""
+        if self.analysis_batch is not None:
+            return
         
         # Vider le tableau
         for item in self.analysis_tree.get_children():
             self.analysis_tree.delete(item)
+        self.analysis_indices = []
         
         # Utiliser la même logique que pour charger les fourmilières dans le menu
         fourmilieres_info = self._load_fourmilieres_info()
+        filepaths = [f"fourmilieres/{filename}" for filename, _ in fourmilieres_info]
         
-        try:
-            for filename, nb_fourmis in fourmilieres_info:
-                filepath = f"fourmilieres/{filename}"
-                print(f"Analyse de {filepath}...")  # Debug
-                
-                try:
-                    antnest = load_antnest_from_txt(filepath)
-                    
-                    # Mesure du temps de résolution
-                    import time
-                    start_time = time.perf_counter()
-                    colony = solve_antnest(antnest)
-                    end_time = time.perf_counter()
-                    
-                    # Temps en millisecondes
-                    execution_time_ms = round((end_time - start_time) * 1000, 2)
-                    
-                    # Calcul de la complexité du réseau avec raisons et protection
-                    try:
-                        network_complexity = BottleneckAnalyzer.evaluate_network_complexity_with_reasons(antnest)
-                        if network_complexity is None:
-                            network_complexity = "Erreur"
-                    except Exception as e:
-                        print(f"Erreur complexité pour {filename}: {e}")  # Debug
-                        network_complexity = "Erreur"
-                    
-                    steps = len(colony.movements_history)
-                    nb_salles = len(antnest.rooms)
-                    nb_tunnels = len(antnest.tubes)
-                    
-                    self.analysis_tree.insert("", tk.END, values=(
-                        antnest.name,
-                        antnest.ants,
-                        nb_salles,
-                        nb_tunnels,
-                        steps,
-                        f"{execution_time_ms:.2f}",
-                        network_complexity
-                    ))
-                    
-                except Exception as e:
-                    print(f"Erreur lors de l'analyse de {filename}: {e}")  # Debug
-                    # Insérer une ligne d'erreur pour identifier le problème
-                    self.analysis_tree.insert("", tk.END, values=(
-                        filename,
-                        "Erreur",
-                        "Erreur", 
-                        "Erreur",
-                        "Erreur",
-                        "Erreur",
-                        "Erreur"
-                    ))
-            
-            self.status_var.set(f"Analyse terminée - {len(fourmilieres_info)} fourmilières analysées")
-            
-        except Exception as e:
-            print(f"Erreur globale: {e}")  # Debug
-            messagebox.showerror("Erreur", f"Erreur lors de l'analyse: {e}")
-            self.status_var.set("Erreur d'analyse")
+        self.analysis_progress.configure(maximum=len(filepaths), value=0)
+        self.analyze_button.config(state='disabled')
+        self.cancel_analysis_button.config(state='normal')
+        self.status_var.set(f"Analyse en cours... 0/{len(filepaths)}")
+        
+        self.analysis_batch = AnalysisBatch(filepaths, self.message_queue.put,
+                                            timeout=self.ANALYSIS_TIMEOUT).start()
+    
+    def cancel_analysis(self):
+        """Annule l'analyse en cours"""
+        if self.analysis_batch is not None:
+            self.analysis_batch.cancel()
+            self.status_var.set("Annulation de l'analyse...")
+    
+    def _insert_analysis_row(self, index, values):
+        """Insère une ligne à sa place (ordre des fichiers) quel que soit l'ordre de fin"""
+        position = bisect_left(self.analysis_indices, index)
+        self.analysis_indices.insert(position, index)
+        self.analysis_tree.insert("", position, values=values)
+    
+    def _finish_analysis(self, done, total, cancelled):
+        """Fin de l'analyse : boutons et statut"""
+        self.analysis_batch = None
+        self.analyze_button.config(state='normal')
+        self.cancel_analysis_button.config(state='disabled')
+        if cancelled:
+            self.status_var.set(f"Analyse annulée - {done}/{total} fourmilières analysées")
+        else:
+            self.status_var.set(f"Analyse terminée - {done} fourmilières analysées")
     
+    @tracing.traced("FourmiGUI.process_queue", cat="gui")
     def process_queue(self):
         """Traite les messages de la queue (thread-safe)"""
         # Protection robuste contre l'exécution après fermeture
@@ -1684,11 +1913,20 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
                     self.result_text.see(tk.END)
                 
                 elif msg_type == "create_plot":
-                    self.create_matplotlib_plot(data)
+                    colony, scheduler = data
+                    self.create_matplotlib_plot(colony)
+                    self.frame_scheduler = scheduler
+                
+                elif msg_type == "analysis_row":
+                    self._insert_analysis_row(*data)
+                
+                elif msg_type == "analysis_progress":
+                    done, total = data
+                    self.analysis_progress.configure(value=done)
+                    self.status_var.set(f"Analyse en cours... {done}/{total}")
                 
-                elif msg_type == "draw_step":
-                    step_num, occupancy, colony, pos = data
-                    self.draw_animation_step(step_num, occupancy, colony, pos)
+                elif msg_type == "analysis_done":
+                    self._finish_analysis(*data)
                 
         except queue.Empty:
             pass
@@ -1697,14 +1935,48 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
             self.gui_active = False
             return
         
-        # Reprogrammer le traitement seulement si GUI active
+        # Dessiner la dernière image publiée (ordonnanceur adopté par "create_plot")
+        try:
+            self.render_pending_frame()
+        except tk.TclError:
+            self.gui_active = False
+            return
+        
+        # Reprogrammer le traitement seulement si GUI active (plus souvent pendant une animation)
         try:
             if self.gui_active and hasattr(self, 'root') and self.root.winfo_exists():
-                self.process_queue_id = self.root.after(100, self.process_queue)
+                animating = self.animation_running or (
+                    self.frame_scheduler is not None and self.frame_scheduler.has_pending())
+                interval = self.FRAME_POLL_MS if animating else self.QUEUE_POLL_MS
+                self.process_queue_id = self.root.after(interval, self.process_queue)
         except tk.TclError:
             # La fenêtre n'existe plus
             self.gui_active = False
     
+    def render_pending_frame(self):
+        """Dessine l'image la plus récente du thread d'animation, s'il y en a une"""
+        scheduler = self.frame_scheduler
+        if scheduler is None:
+            return
+        snapshot = scheduler.take()
+        if snapshot is None:
+            return
+        
+        self.draw_animation_step(snapshot.step_num, snapshot.occupancy, snapshot.colony, snapshot.pos)
+        scheduler.frame_rendered()
+        
+        nb_steps = len(snapshot.colony.movements_history)
+        target = f" (cible {scheduler.target_fps:.1f})" if scheduler.target_fps else ""
+        if snapshot.is_final:
+            stats = scheduler.stats()
+            self.result_text.insert(tk.END,
+                f"🎞️  Images rendues : {stats['rendered']}/{stats['published']} "
+                f"({stats['dropped']} abandonnées) - {stats['effective_fps']:.1f} img/s{target}\n")
+            self.result_text.see(tk.END)
+        else:
+            self.status_var.set(f"Étape {snapshot.step_num}/{nb_steps} - "
+                                f"{scheduler.effective_fps():.1f} img/s{target}")
+    
     def on_closing(self):
         """Gestion propre de la fermeture de la fenêtre"""
         print("Fermeture de l'interface...")
@@ -1712,6 +1984,11 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         # Arrêter immédiatement tous les processus
         self.gui_active = False
         self.animation_running = False
+        solve_process = self.solve_process
+        if solve_process is not None:
+            solve_process.cancel()
+        if self.analysis_batch is not None:
+            self.analysis_batch.cancel()
         
         # Annuler le callback process_queue s'il est programmé
         if hasattr(self, 'process_queue_id') and self.process_queue_id:
@@ -1741,7 +2018,10 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         for widget in self.plot_frame.winfo_children():
             widget.destroy()
         
-        # Créer nouvelle figure
+        # Créer nouvelle figure (le rendu persistant de l'ancienne n'est plus valide)
+        if self.renderer is not None:
+            self.renderer.detach()
+            self.renderer = None
         self.fig, self.ax = plt.subplots(figsize=(10, 8))
         
         # Intégrer dans tkinter
@@ -1751,6 +2031,7 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         self.canvas = canvas
         self.colony = colony
     
+    @tracing.traced("FourmiGUI.draw_animation_step", cat="render")
     def draw_animation_step(self, step_num, occupancy, colony, pos):
         """Dessine une étape de l'animation"""
         if not hasattr(self, 'ax'):
@@ -1762,6 +2043,22 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         self.last_colony = colony
         self.last_pos = pos
         
+        # Étapes intermédiaires : artistes persistants mis à jour puis blittés (niveau
+        # de détail pour les grandes fourmilières, voir StepRenderer)
+        if step_num <= len(colony.movements_history):
+            if self.renderer is None or not self.renderer.matches(self.ax, colony, pos):
+                if self.renderer is not None:
+                    self.renderer.detach()
+                self.renderer = StepRenderer(self.ax, colony, pos)
+            with tracing.span("canvas.blit", cat="render", step=step_num):
+                self.renderer.update(step_num, occupancy)
+            return
+        
+        # Affichage final (superpositions de chemins et goulots) : redessin complet,
+        # quelle que soit la taille de la fourmilière
+        if self.renderer is not None:
+            self.renderer.detach()
+            self.renderer = None
         self.ax.clear()
         
         # Couleurs et tailles
@@ -1847,123 +2144,58 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         nx.draw_networkx_nodes(colony.graph, pos, ax=self.ax, 
                              node_color=node_colors, node_size=node_sizes, alpha=0.9)
         
-        # Flèches pour mouvements (seulement si on n'est pas à l'étape finale après tous les mouvements)
-        is_final_display = step_num > len(colony.movements_history)
-        
-        if step_num > 0 and step_num <= len(colony.movements_history) and not is_final_display:
-            current_movements = colony.movements_history[step_num - 1]
-            
-            # Grouper les mouvements par tunnel (même origine et destination)
-            tunnel_movements = {}
-            for ant_id, old_room, new_room in current_movements:
-                tunnel = (old_room, new_room)
-                if tunnel not in tunnel_movements:
-                    tunnel_movements[tunnel] = []
-                tunnel_movements[tunnel].append(ant_id)
-            
-            # Dessiner une flèche par tunnel avec indication du nombre de fourmis
-            for (old_room, new_room), ant_ids in tunnel_movements.items():
-                if old_room in pos and new_room in pos:
-                    x1, y1 = pos[old_room]
-                    x2, y2 = pos[new_room]
-                    dx, dy = x2 - x1, y2 - y1
-                    offset = 0.15
-                    x1_arrow = x1 + dx * offset
-                    y1_arrow = y1 + dy * offset
-                    x2_arrow = x2 - dx * offset
-                    y2_arrow = y2 - dy * offset
-                    
-                    # Flèche plus épaisse si plusieurs fourmis
-                    nb_fourmis = len(ant_ids)
-                    line_width = min(2 + nb_fourmis * 1.5, 8)  # Max 8 pixels
-                    alpha = min(0.6 + nb_fourmis * 0.1, 1.0)  # Plus opaque si plus de fourmis
-                    
-                    self.ax.annotate('', xy=(x2_arrow, y2_arrow), xytext=(x1_arrow, y1_arrow),
-                                   arrowprops=dict(arrowstyle='->', color='red', lw=line_width, alpha=alpha))
-                    
-                    # Label avec toutes les fourmis du tunnel
-                    mid_x, mid_y = (x1 + x2) / 2, (y1 + y2) / 2
-                    
-                    if nb_fourmis == 1:
-                        # Une seule fourmi : affichage classique
-                        label_text = f'f{ant_ids[0]}'
-                        bg_color = 'yellow'
-                    else:
-                        # Plusieurs fourmis : affichage groupé
-                        if nb_fourmis <= 3:
-                            # Peu de fourmis : lister toutes
-                            label_text = ', '.join([f'f{aid}' for aid in sorted(ant_ids)])
-                        else:
-                            # Beaucoup de fourmis : résumer
-                            label_text = f'{nb_fourmis} fourmis\n({", ".join([f"f{aid}" for aid in sorted(ant_ids[:2])])}...)'
-                        bg_color = 'orange'  # Couleur différente pour les mouvements multiples
-                    
-                    self.ax.text(mid_x, mid_y, label_text,
-                               bbox=dict(boxstyle="round,pad=0.3", facecolor=bg_color, alpha=0.9),
-                               ha='center', va='center', fontsize=9, fontweight='bold')
-        
-        elif is_final_display:
-            # 🎯 AFFICHAGE FINAL : Options d'affichage multiples
-            
-            # Affichage des chemins complets empruntés par les fourmis
-            if self.show_ant_paths.get():
-                try:
-                    # Extraire et sauvegarder les groupes de chemins pour la sélection
-                    ant_paths = FourmiGUI.extract_ant_paths(colony)
-                    path_groups = {}
-                    for ant_id, path in ant_paths.items():
-                        path_key = tuple(path)
-                        if path_key not in path_groups:
-                            path_groups[path_key] = []
-                        path_groups[path_key].append(ant_id)
-                    
-                    # Sauvegarder sous forme de liste pour la sélection
-                    self.path_groups = list(path_groups.items())
-                    
-                    # Déterminer quels chemins afficher
-                    selected_indices = None
-                    if hasattr(self, 'path_selection_vars') and self.path_selection_vars:
-                        selected_indices = [i for i, var in self.path_selection_vars.items() if var.get()]
-                    
-                    # Dessiner les chemins sélectionnés
-                    num_paths = FourmiGUI.draw_ant_paths(colony, pos, self.ax, selected_indices)
-                    
-                    total_paths = len(self.path_groups)
-                    if selected_indices is not None:
-                        print(f"✅ Affichage de {len(selected_indices)} chemins empruntés sélectionnés sur {total_paths} chemins disponibles")
-                    else:
-                        print(f"✅ Affichage de {num_paths} chemins empruntés distincts dans la visualisation finale")
-                    
-                    # Activer le bouton de sélection des chemins
-                    if hasattr(self, 'select_paths_button'):
-                        self.select_paths_button.config(state='normal')
-                    
-                except Exception as e:
-                    print(f"❌ Erreur lors de l'affichage des chemins empruntés: {e}")
-            else:
-                print("ℹ️  Chemins empruntés masqués par l'utilisateur")
-                # Désactiver le bouton de sélection des chemins si les chemins sont masqués
+        # 🎯 AFFICHAGE FINAL : Options d'affichage multiples
+        
+        # Affichage des chemins complets empruntés par les fourmis
+        if self.show_ant_paths.get():
+            try:
+                # Groupes de chemins (calculés une fois par solution) gardés pour la sélection
+                self.path_groups = FourmiGUI.get_path_groups(colony)
+                
+                # Déterminer quels chemins afficher
+                selected_indices = None
+                if hasattr(self, 'path_selection_vars') and self.path_selection_vars:
+                    selected_indices = [i for i, var in self.path_selection_vars.items() if var.get()]
+                
+                # Dessiner les chemins sélectionnés
+                num_paths = FourmiGUI.draw_ant_paths(colony, pos, self.ax, selected_indices)
+                
+                total_paths = len(self.path_groups)
+                if selected_indices is not None:
+                    print(f"✅ Affichage de {len(selected_indices)} chemins empruntés sélectionnés sur {total_paths} chemins disponibles")
+                else:
+                    print(f"✅ Affichage de {num_paths} chemins empruntés distincts dans la visualisation finale")
+                
+                # Activer le bouton de sélection des chemins
                 if hasattr(self, 'select_paths_button'):
-                    self.select_paths_button.config(state='disabled')
-            
-            # Affichage de tous les chemins possibles (utilisés/non utilisés)
-            if self.show_all_paths.get():
-                try:
-                    num_all_paths = FourmiGUI.draw_all_possible_paths(colony, pos, self.ax)
-                    if num_all_paths > 0:
-                        print(f"🗺️  Affichage de tous les chemins possibles activé")
-                except Exception as e:
-                    print(f"❌ Erreur lors de l'affichage de tous les chemins: {e}")
-            
-            # Affichage des goulots d'étranglement
-            if self.show_bottlenecks.get():
-                try:
-                    num_bottlenecks = FourmiGUI.draw_bottlenecks(colony, pos, self.ax)
-                    if num_bottlenecks > 0:
-                        print(f"⚠️  Goulots d'étranglement affichés")
-                except Exception as e:
-                    print(f"❌ Erreur lors de l'affichage des goulots d'étranglement: {e}")
+                    self.select_paths_button.config(state='normal')
+                
+            except Exception as e:
+                print(f"❌ Erreur lors de l'affichage des chemins empruntés: {e}")
+        else:
+            print("ℹ️  Chemins empruntés masqués par l'utilisateur")
+            # Désactiver le bouton de sélection des chemins si les chemins sont masqués
+            if hasattr(self, 'select_paths_button'):
+                self.select_paths_button.config(state='disabled')
+        
+        # Affichage de tous les chemins possibles (utilisés/non utilisés)
+        if self.show_all_paths.get():
+            try:
+                num_all_paths = FourmiGUI.draw_all_possible_paths(colony, pos, self.ax)
+                if num_all_paths > 0:
+                    print(f"🗺️  Affichage de tous les chemins possibles activé")
+            except Exception as e:
+                print(f"❌ Erreur lors de l'affichage de tous les chemins: {e}")
         
+        # Affichage des goulots d'étranglement
+        if self.show_bottlenecks.get():
+            try:
+                num_bottlenecks = FourmiGUI.draw_bottlenecks(colony, pos, self.ax)
+                if num_bottlenecks > 0:
+                    print(f"⚠️  Goulots d'étranglement affichés")
+            except Exception as e:
+                print(f"❌ Erreur lors de l'affichage des goulots d'étranglement: {e}")
+
         # 📊 Étiquettes de comptage de passages sur les tunnels
         pheromone_data = colony.get_pheromone_data_until_step(step_num)
         for edge, data in pheromone_data.items():
@@ -2022,7 +2254,8 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         self.ax.axis('off')
         
         # Actualiser l'affichage
-        self.canvas.draw()
+        with tracing.span("canvas.draw", cat="render", step=step_num):
+            self.canvas.draw()
     
     def generate_random_antnest(self):
         """Génère une fourmilière aléatoire selon les paramètres"""
@@ -2251,13 +2484,13 @@ La stratégie hybride permet de combiner la rapidité d'un algorithme simple ave
         G = nx.Graph()
         G.add_edges_from(self.generated_antnest.tubes)
         
-        # Layout adaptatif
+        # Layout adaptatif (mis en cache par fourmilière)
         if len(G.nodes()) <= 4:
-            pos = nx.spring_layout(G, k=3, iterations=50)
+            pos = get_layout(self.generated_antnest, "spring", seed=42, k=3, iterations=50)
         elif len(G.nodes()) <= 8:
-            pos = nx.spring_layout(G, k=2, iterations=100)
+            pos = get_layout(self.generated_antnest, "spring", seed=42, k=2, iterations=100)
         else:
-            pos = nx.circular_layout(G)
+            pos = get_layout(self.generated_antnest, "layered")
         
         # Couleurs des nœuds selon leur rôle
         node_colors = []
@@ -0,0 +1,237 @@
+'''
+Mode à horizon fixé : nombre maximal de fourmis au dortoir en T étapes.
+
+Le problème est un flot maximal dans le réseau espace-temps : un sommet par salle et
+par étape (dédoublé entrée -> sortie, arc de la capacité de la salle ; Sv : toutes
+les fourmis), un arc d'attente (salle, t) -> (salle, t + 1) et un arc par tunnel
+(salle, t) -> (voisine, t + 1). Une arrivée au dortoir à l'étape t est un arc vers
+le puits ; le dortoir n'est jamais développé. Seuls les sommets atteignables depuis
+Sv en t tunnels et à moins de T - t tunnels de Sd sont créés.
+
+Le réseau est construit couche par couche et le flot augmenté (Dinic) après chaque
+couche. Un chemin augmentant s'arrête à sa première arrivée : le nombre de fourmis
+arrivées avant chaque étape ne fait qu'augmenter. Après la couche t, le flot est
+maximal pour l'horizon t ; le flot final donne donc, pour chaque t <= T, le nombre
+maximal de fourmis arrivées en t étapes (flot à arrivées au plus tôt), et un
+ordonnancement qui les réalise toutes en même temps.
+'''
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from main import AntColony
+
+
+@dataclass
+class HorizonResult:
+    """Fourmis arrivées en `horizon` étapes, arrivées au plus tôt et ordonnancement"""
+    horizon: int
+    delivered: int
+    arrivals: List[int] = field(default_factory=list)  # arrivals[t] : fourmis au dortoir après t étapes
+    movements_history: List[List[Tuple[int, str, str]]] = field(default_factory=list)
+
+    def colony(self, antnest) -> AntColony:
+        """Colonie rejouant l'ordonnancement (les fourmis non livrées restent dans Sv)"""
+        return AntColony(antnest).load_history(self.movements_history)
+
+
+class TimeExpandedNetwork:
+    """Réseau espace-temps construit couche par couche, flot maximal incrémental (Dinic)"""
+
+    SOURCE, SINK = 0, 1
+
+    def __init__(self, antnest, horizon: int):
+        colony = AntColony(antnest)
+        self.antnest = antnest
+        self.horizon = horizon
+        self.adjacency = colony.adjacency
+        self.to_sd = colony.distance_to_sd
+        self.from_sv = colony._compute_distances_to("Sv")
+        self.capacity = {room: antnest.ants if room == "Sv" else antnest.rooms.get(room, 1)
+                         for room in self.adjacency if room != "Sd"}
+
+        # Arcs par paires (arc pair : aller, arc impair : retour résiduel)
+        self.head: List[List[int]] = [[], []]
+        self.to: List[int] = []
+        self.cap: List[int] = []
+        self.node_of: Dict[Tuple[str, int], int] = {}   # (salle, étape) -> sommet d'entrée
+        self.room_of: Dict[int, Tuple[str, int]] = {}   # sommet d'entrée -> (salle, étape)
+        self.arrival_edges: List[List[int]] = [[]]      # arcs vers le puits, par étape d'arrivée
+        self.layer_rooms: List[List[str]] = [[]]        # salles présentes à chaque étape
+        self.layers = 0
+        self.flow = 0
+
+        if "Sd" not in self.to_sd or "Sv" not in self.to_sd or horizon < self.to_sd["Sv"]:
+            return
+        self._add_room("Sv", 0)
+        self.layer_rooms[0].append("Sv")
+        self._edge(self.SOURCE, self.node_of[("Sv", 0)], antnest.ants)
+
+    # ------------------------------------------------------------------ construction
+
+    def _node(self) -> int:
+        self.head.append([])
+        return len(self.head) - 1
+
+    def _edge(self, a: int, b: int, capacity: int) -> int:
+        edge = len(self.to)
+        self.to += [b, a]
+        self.cap += [capacity, 0]
+        self.head[a].append(edge)
+        self.head[b].append(edge + 1)
+        return edge
+
+    def _add_room(self, room: str, t: int):
+        """Sommets (entrée, sortie) d'une salle à une étape, reliés par sa capacité"""
+        entry = self._node()
+        self._node()
+        self._edge(entry, entry + 1, self.capacity[room])
+        self.node_of[(room, t)] = entry
+        self.room_of[entry] = (room, t)
+
+    def _useful(self, room: str, t: int) -> bool:
+        return (room != "Sd" and self.from_sv.get(room, self.horizon + 1) <= t
+                and self.to_sd.get(room, self.horizon + 1) <= self.horizon - t)
+
+    def add_layer(self):
+        """Ajoute l'étape suivante : attentes, tunnels et arrivées au dortoir"""
+        t = self.layers + 1
+        arrivals = []
+        current = [room for room in self.adjacency if self._useful(room, t)]
+        for room in current:
+            self._add_room(room, t)
+        for room in self.layer_rooms[t - 1]:
+            out = self.node_of[(room, t - 1)] + 1
+            for target in [room, *self.adjacency[room]]:
+                if target == "Sd":
+                    arrivals.append(self._edge(out, self.SINK, self.antnest.ants))
+                elif (target, t) in self.node_of:
+                    self._edge(out, self.node_of[(target, t)], self.antnest.ants)
+        self.arrival_edges.append(arrivals)
+        self.layer_rooms.append(current)
+        self.layers = t
+
+    # ------------------------------------------------------------------------ flot
+
+    def _levels(self) -> Optional[List[int]]:
+        """Niveaux du graphe résiduel depuis la source (le puits n'est jamais développé)"""
+        level = [-1] * len(self.head)
+        level[self.SOURCE] = 0
+        queue = deque([self.SOURCE])
+        while queue:
+            node = queue.popleft()
+            for edge in self.head[node]:
+                nxt = self.to[edge]
+                if self.cap[edge] > 0 and level[nxt] < 0:
+                    level[nxt] = level[node] + 1
+                    if nxt != self.SINK:
+                        queue.append(nxt)
+        return level if level[self.SINK] >= 0 else None
+
+    def _blocking_flow(self, level: List[int]) -> int:
+        """Flot bloquant du graphe de niveaux (parcours en profondeur itératif)"""
+        pointer = [0] * len(self.head)
+        head, to, cap = self.head, self.to, self.cap
+        total = 0
+        limit = self.antnest.ants - self.flow
+        while total < limit:
+            path: List[int] = []   # arcs du chemin en cours
+            node = self.SOURCE
+            while node != self.SINK:
+                edges = head[node]
+                while pointer[node] < len(edges):
+                    edge = edges[pointer[node]]
+                    if cap[edge] > 0 and level[to[edge]] == level[node] + 1:
+                        break
+                    pointer[node] += 1
+                if pointer[node] == len(edges):
+                    if not path:
+                        return total
+                    # Impasse : on recule et on écarte l'arc qui y menait
+                    level[node] = -1
+                    edge = path.pop()
+                    node = to[edge ^ 1]
+                    pointer[node] += 1
+                    continue
+                path.append(edges[pointer[node]])
+                node = to[path[-1]]
+            amount = min(limit - total, *(cap[edge] for edge in path))
+            for edge in path:
+                cap[edge] -= amount
+                cap[edge ^ 1] += amount
+            total += amount
+        return total
+
+    def augment(self) -> int:
+        """Augmente le flot jusqu'au maximum pour les couches construites"""
+        while self.flow < self.antnest.ants:
+            level = self._levels()
+            if level is None:
+                break
+            pushed = self._blocking_flow(level)
+            if pushed == 0:
+                break
+            self.flow += pushed
+        return self.flow
+
+    def arrivals_by_step(self) -> List[int]:
+        """Fourmis arrivées (cumulées) après chaque étape 0..couches construites"""
+        counts, total = [], 0
+        for edges in self.arrival_edges:
+            total += sum(self.cap[edge ^ 1] for edge in edges)
+            counts.append(total)
+        return counts
+
+    # -------------------------------------------------------------- ordonnancement
+
+    def schedule(self) -> List[List[Tuple[int, str, str]]]:
+        """Décompose le flot en itinéraires de fourmis et en étapes de mouvements"""
+        if self.flow == 0:
+            return []
+        flow = {edge: self.cap[edge ^ 1] for edge in range(0, len(self.to), 2) if self.cap[edge ^ 1] > 0}
+        pointer = [0] * len(self.head)
+        routes = []
+        for _ in range(self.flow):
+            node = self.to[self.head[self.SOURCE][0]]
+            route = []
+            while node != self.SINK:
+                if node in self.room_of:
+                    route.append(self.room_of[node][0])
+                edges = self.head[node]
+                while flow.get(edges[pointer[node]], 0) == 0:
+                    pointer[node] += 1
+                edge = edges[pointer[node]]
+                flow[edge] -= 1
+                node = self.to[edge]
+            routes.append(route + ["Sd"])
+
+        # Départ de Sv = première étape hors de Sv ; fourmis numérotées par départ
+        departure = [next(t for t, room in enumerate(route) if room != "Sv") for route in routes]
+        order = sorted(range(len(routes)), key=lambda i: (departure[i], len(routes[i])))
+        steps: List[List[Tuple[int, str, str]]] = [[] for _ in range(max(map(len, routes)) - 1)]
+        for ant_id, i in enumerate(order, 1):
+            route = routes[i]
+            for t in range(1, len(route)):
+                if route[t] != route[t - 1]:
+                    steps[t - 1].append((ant_id, route[t - 1], route[t]))
+        return steps
+
+
+def max_ants_within(antnest, horizon: int) -> HorizonResult:
+    """
+    Nombre maximal de fourmis qui atteignent Sd en `horizon` étapes.
+
+    Returns:
+        HorizonResult : fourmis livrées, arrivées au plus tôt pour chaque t <= horizon
+        (arrivals[t]) et ordonnancement les réalisant, au format movements_history
+    """
+    network = TimeExpandedNetwork(antnest, horizon)
+    arrivals = [0]
+    if network.node_of:
+        for _ in range(horizon):
+            network.add_layer()
+            network.augment()
+        arrivals = network.arrivals_by_step()
+    arrivals += [arrivals[-1]] * (horizon + 1 - len(arrivals))
+    return HorizonResult(horizon, network.flow, arrivals, network.schedule())
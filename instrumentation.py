@@ -0,0 +1,98 @@
+'''
+Instrumentation par phase de la simulation (AntColony.simulate_step).
+
+Activée avec AntColony(antnest, instrument=True) ; désactivée, elle ne coûte
+qu'un test `is not None` par phase et par étape.
+'''
+
+import time
+from typing import Dict, List
+
+
+# Chronomètres par phase (secondes)
+TIMERS = ("copy_s", "phase1_s", "phase2_s", "path_lookup_s")
+
+# Compteurs par étape
+COUNTERS = ("ants_examined", "ants_deferred", "capacity_rejections",
+            "copies", "path_lookups", "moves")
+
+
+class SolverProfiler:
+    """Chronomètres et compteurs par phase, collectés à chaque étape puis résumés"""
+
+    def __init__(self):
+        self.steps: List[Dict[str, float]] = []
+        self._current = None
+        self._last = 0.0
+
+    def attach(self, colony):
+        """Chronomètre les recherches du meilleur mouvement (plus court chemin) de la colonie"""
+        for name in ("_choose_best_move", "_choose_best_move_with_temp"):
+            setattr(colony, name, self._timed_lookup(getattr(colony, name)))
+        return self
+
+    def _timed_lookup(self, method):
+        """Enveloppe une méthode de choix de mouvement avec un chronomètre"""
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            current = self._current
+            if current is not None:
+                current["path_lookup_s"] += time.perf_counter() - start
+                current["path_lookups"] += 1
+            return result
+        return timed
+
+    def start_step(self, step_num: int):
+        """Ouvre l'enregistrement d'une étape"""
+        self._current = dict.fromkeys(TIMERS, 0.0)
+        self._current.update(dict.fromkeys(COUNTERS, 0))
+        self._current["step"] = step_num
+        self._last = time.perf_counter()
+
+    def lap(self, timer: str):
+        """Attribue le temps écoulé depuis le dernier tour au chronomètre donné"""
+        now = time.perf_counter()
+        self._current[timer] += now - self._last
+        self._last = now
+
+    def count(self, counter: str, value: int = 1):
+        """Incrémente un compteur de l'étape courante"""
+        self._current[counter] += value
+
+    def end_step(self, moves: int):
+        """Ferme l'enregistrement de l'étape courante"""
+        self._current["moves"] = moves
+        self.steps.append(self._current)
+        self._current = None
+
+    def summary(self) -> dict:
+        """Totaux, moyennes par étape et part de chaque phase dans le temps mesuré"""
+        totals = {key: sum(step[key] for step in self.steps) for key in TIMERS + COUNTERS}
+        nb_steps = len(self.steps)
+        measured = totals["copy_s"] + totals["phase1_s"] + totals["phase2_s"]
+        return {
+            "steps": nb_steps,
+            "totals": totals,
+            "per_step": {key: value / nb_steps for key, value in totals.items()} if nb_steps else {},
+            # Les recherches de chemin sont incluses dans les phases 1 et 2
+            "shares": {timer: (totals[timer] / measured if measured else 0.0) for timer in TIMERS},
+        }
+
+    def print_summary(self):
+        """Affiche le résumé de l'instrumentation"""
+        summary = self.summary()
+        totals = summary["totals"]
+        shares = summary["shares"]
+
+        print(f"\n⏱️  === INSTRUMENTATION ({summary['steps']} étapes) ===")
+        print(f"   • Copie de l'occupation : {totals['copy_s'] * 1000:9.3f} ms ({shares['copy_s']:.0%})")
+        print(f"   • Phase 1 (séquentielle) : {totals['phase1_s'] * 1000:9.3f} ms ({shares['phase1_s']:.0%})")
+        print(f"   • Phase 2 (conflits)     : {totals['phase2_s'] * 1000:9.3f} ms ({shares['phase2_s']:.0%})")
+        print(f"     dont plus courts chemins : {totals['path_lookup_s'] * 1000:7.3f} ms "
+              f"({totals['path_lookups']} recherches)")
+        print(f"   • Fourmis examinées : {totals['ants_examined']}")
+        print(f"   • Fourmis reportées en phase 2 : {totals['ants_deferred']}")
+        print(f"   • Mouvements refusés (capacité) : {totals['capacity_rejections']}")
+        print(f"   • Listes d'occupation copiées : {totals['copies']}")
+        print(f"   • Mouvements : {totals['moves']}")
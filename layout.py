@@ -0,0 +1,221 @@
+'''
+Dispositions (positions des salles) des fourmilières, avec cache mémoire et disque.
+
+- layered_layout : disposition en couches par distance au dortoir (Sv à gauche,
+  Sd à droite), ordonnée par barycentre dans chaque couche ; un parcours en
+  largeur et un nombre fixe de balayages, utilisable sur 10k salles.
+- get_layout : disposition mise en cache, indexée par l'empreinte de la
+  fourmilière (salles + tunnels), le type de disposition et ses paramètres.
+
+Le cache disque se trouve dans FOURMI_LAYOUT_CACHE ou ~/.cache/uneviedefourmi/layouts.
+'''
+
+import hashlib
+import json
+import os
+from collections import OrderedDict, deque
+from typing import Dict, Tuple
+
+
+Position = Tuple[float, float]
+
+SPRING_MAX_NODES = 50     # Au-delà, default_layout passe à la disposition en couches
+MEMORY_CACHE_SIZE = 64    # Dispositions gardées en mémoire (LRU)
+BARYCENTER_SWEEPS = 2     # Balayages aller-retour de l'ordonnancement par barycentre
+
+
+def nest_hash(antnest) -> str:
+    """Empreinte de la topologie d'une fourmilière (indépendante du nombre de fourmis)"""
+    tubes = sorted(tuple(sorted(tube)) for tube in antnest.tubes)
+    payload = json.dumps({"rooms": sorted(antnest.rooms), "tubes": tubes}, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _adjacency(antnest) -> Dict[str, list]:
+    """Listes d'adjacence dans l'ordre des tunnels (même ordre de sommets que NetworkX)"""
+    adjacency = {}
+    for a, b in antnest.tubes:
+        adjacency.setdefault(a, []).append(b)
+        adjacency.setdefault(b, []).append(a)
+    return adjacency
+
+
+def _bfs_distances(adjacency, source) -> Dict[str, int]:
+    distances = {source: 0}
+    to_visit = deque([source])
+    while to_visit:
+        room = to_visit.popleft()
+        for neighbor in adjacency[room]:
+            if neighbor not in distances:
+                distances[neighbor] = distances[room] + 1
+                to_visit.append(neighbor)
+    return distances
+
+
+def layered_layout(antnest, source: str = "Sv", target: str = "Sd") -> Dict[str, Position]:
+    """
+    Disposition en couches : une colonne par distance au dortoir, Sv seul à gauche, Sd à droite.
+
+    Dans chaque couche, les salles sont ordonnées par barycentre des rangs de leurs
+    voisines dans les couches adjacentes (balayages gauche→droite puis droite→gauche).
+    Les salles sans chemin vers le dortoir sont placées dans la couche la plus à gauche
+    après Sv. Coordonnées normalisées dans [-1, 1].
+    """
+    adjacency = _adjacency(antnest)
+    if not adjacency:
+        return {}
+
+    distances = _bfs_distances(adjacency, target) if target in adjacency else {}
+    unreachable = max(distances.values(), default=0) + 1
+    depth = {node: distances.get(node, unreachable) for node in adjacency}
+    max_depth = max(depth[node] for node in adjacency if node != source) if len(adjacency) > 1 else 0
+
+    # Couche 0 : Sv seul ; dernière couche : les salles à distance 0 (Sd)
+    layer_of = {}
+    for node in adjacency:
+        layer_of[node] = 0 if node == source else max_depth - depth[node] + 1
+    nb_layers = max(layer_of.values()) + 1
+    layers = [[] for _ in range(nb_layers)]
+    for node in adjacency:
+        layers[layer_of[node]].append(node)
+    layers = [layer for layer in layers if layer]
+    layer_of = {node: i for i, layer in enumerate(layers) for node in layer}
+
+    rank = {node: i for layer in layers for i, node in enumerate(layer)}
+
+    def reorder(layer_index, neighbor_layer):
+        layer = layers[layer_index]
+        keys = {}
+        for node in layer:
+            ranks = [rank[n] for n in adjacency[node] if layer_of[n] == neighbor_layer]
+            # Sans voisine dans la couche de référence : garder le rang actuel
+            keys[node] = sum(ranks) / len(ranks) if ranks else rank[node]
+        layer.sort(key=lambda node: keys[node])
+        for i, node in enumerate(layer):
+            rank[node] = i
+
+    for _ in range(BARYCENTER_SWEEPS):
+        for i in range(1, len(layers)):
+            reorder(i, i - 1)
+        for i in range(len(layers) - 2, -1, -1):
+            reorder(i, i + 1)
+
+    widest = max(len(layer) for layer in layers)
+    y_step = 2 / (widest - 1) if widest > 1 else 0
+    x_step = 2 / (len(layers) - 1) if len(layers) > 1 else 0
+
+    pos = {}
+    for i, layer in enumerate(layers):
+        offset = (len(layer) - 1) / 2
+        for j, node in enumerate(layer):
+            pos[node] = (i * x_step - 1 if x_step else 0.0, (offset - j) * y_step)
+    return pos
+
+
+def _networkx_layout(antnest, kind, **params) -> Dict[str, Position]:
+    import networkx as nx
+
+    G = nx.Graph()
+    G.add_edges_from(antnest.tubes)
+    if kind == "spring":
+        pos = nx.spring_layout(G, **params)
+    elif kind == "circular":
+        pos = nx.circular_layout(G, **params)
+    else:
+        raise ValueError(f"Disposition inconnue : {kind}")
+    return {node: (float(x), float(y)) for node, (x, y) in pos.items()}
+
+
+class LayoutCache:
+    """Cache des dispositions : LRU en mémoire puis fichiers JSON sur disque"""
+
+    def __init__(self, directory=None, memory_size: int = MEMORY_CACHE_SIZE):
+        self.directory = directory
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+
+    def _path(self, key: str):
+        if not self.directory:
+            return None
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key: str):
+        """Disposition en cache ou None"""
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+
+        path = self._path(key)
+        if path and os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    pos = {node: tuple(xy) for node, xy in json.load(f).items()}
+            except (OSError, ValueError):
+                return None
+            self._remember(key, pos)
+            return pos
+        return None
+
+    def put(self, key: str, pos: Dict[str, Position]):
+        """Enregistre une disposition (le disque est facultatif : erreurs ignorées)"""
+        self._remember(key, pos)
+        path = self._path(key)
+        if path:
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(pos, f)
+                os.replace(tmp_path, path)
+            except OSError:
+                pass
+
+    def _remember(self, key, pos):
+        self._memory[key] = pos
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def clear(self):
+        """Vide le cache mémoire"""
+        self._memory.clear()
+
+
+def _default_directory():
+    return os.environ.get("FOURMI_LAYOUT_CACHE") or os.path.join(
+        os.path.expanduser("~"), ".cache", "uneviedefourmi", "layouts")
+
+
+default_cache = LayoutCache(_default_directory())
+
+
+def get_layout(antnest, kind: str = "layered", cache: LayoutCache = None, **params) -> Dict[str, Position]:
+    """
+    Disposition d'une fourmilière, calculée une seule fois par topologie et paramètres.
+
+    Args:
+        kind: "layered", "spring" ou "circular"
+        cache: cache à utiliser (défaut: cache mémoire + disque du module)
+        **params: paramètres de la disposition NetworkX (seed, k, iterations...)
+    Returns:
+        Nouveau dictionnaire {salle: (x, y)} (modifiable sans altérer le cache)
+    """
+    cache = default_cache if cache is None else cache
+    key = f"{kind}:{json.dumps(params, sort_keys=True)}:{nest_hash(antnest)}"
+
+    pos = cache.get(key)
+    if pos is None:
+        if kind == "layered":
+            pos = layered_layout(antnest, **params)
+        else:
+            pos = _networkx_layout(antnest, kind, **params)
+        cache.put(key, pos)
+    return dict(pos)
+
+
+def default_layout(antnest, seed: int = 42, k: float = 2) -> Dict[str, Position]:
+    """Disposition par ressorts (en cache) pour les petites fourmilières, en couches au-delà"""
+    nb_nodes = len({room for tube in antnest.tubes for room in tube})
+    if nb_nodes <= SPRING_MAX_NODES:
+        return get_layout(antnest, "spring", seed=seed, k=k)
+    return get_layout(antnest, "layered")
@@ -2,12 +2,16 @@
 résolution des fourmilières.
 '''
 
-import networkx as nx
-import matplotlib.pyplot as plt
+import math
 import os
+import random
 import re
-from typing import List, Dict, Tuple, Optional
+import sys
+import time
+from collections import deque
+from typing import Iterator, List, Dict, Tuple, Optional
 from dataclasses import dataclass
+from tracing import traced
 
 
 class AntNest:
@@ -46,35 +50,210 @@ class Ant:
         return f"f{self.id}"
 
 
+STALL_WINDOW = 1000   # Étapes sans rapprochement du dortoir avant abandon (None = jamais)
+MAX_REPEATS = None    # Occurrences d'un même état d'occupation avant abandon (None = jamais)
+
+
+class SolveMonitor:
+    """
+    Détection des blocages pendant une résolution.
+    
+    L'état d'occupation (salle de chaque fourmi) est résumé par un hachage de
+    Zobrist mis à jour à partir des seuls mouvements de l'étape : XOR d'une clé par
+    couple (fourmi, salle). La somme des distances au dortoir est suivie de la même
+    façon. Raisons d'arrêt : "solved", "blocked" (aucun mouvement), "cycle" (état
+    répété), "stalled" (pas de progrès), "max_steps", "timeout".
+    
+    La détection des cycles est facultative (max_repeats) : l'état haché ne contient
+    que l'occupation, pas l'état des politiques de routage (pointeurs de l'ECMP, salle
+    précédente de la congestion...), et une occupation répétée n'y est pas
+    forcément une boucle.
+    """
+    
+    def __init__(self, colony, max_steps: Optional[int] = None, time_budget: Optional[float] = None,
+                 stall_window: Optional[int] = STALL_WINDOW, max_repeats: Optional[int] = MAX_REPEATS):
+        self.colony = colony
+        self.max_steps = max_steps
+        self.deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        self.stall_window = stall_window
+        self.max_repeats = max_repeats
+        self.reason: Optional[str] = None
+        self.repeated_step: Optional[int] = None
+        
+        # Clés de Zobrist par salle ; clé d'un couple (fourmi, salle) mélangée à la volée
+        rng = random.Random(0)
+        self._room_keys = {room: rng.getrandbits(64) for room in colony.adjacency}
+        self.state_hash = 0
+        distance = colony.distance_to_sd
+        self.potential = 0
+        for ant in colony.ants:
+            self.state_hash ^= self._key(ant.id, ant.current_room)
+            self.potential += distance.get(ant.current_room, 0)
+        self.best_potential = self.potential
+        self.best_step = colony.step_count
+        self.seen: Dict[int, Tuple[int, int]] = {self.state_hash: (colony.step_count, 1)}
+    
+    def _key(self, ant_id: int, room: str) -> int:
+        """Clé pseudo-aléatoire 64 bits d'une fourmi dans une salle"""
+        key = (self._room_keys.get(room, 0) ^ (ant_id * 0x9E3779B97F4A7C15)) & 0xFFFFFFFFFFFFFFFF
+        key = ((key ^ (key >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+        key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+        return key ^ (key >> 31)
+    
+    def stop(self, reason: str) -> str:
+        self.reason = reason
+        return reason
+    
+    def update(self, movements) -> Optional[str]:
+        """Prend en compte les mouvements d'une étape ; retourne la raison d'arrêt éventuelle"""
+        colony = self.colony
+        distance = colony.distance_to_sd
+        for ant_id, old_room, new_room in movements:
+            self.state_hash ^= self._key(ant_id, old_room) ^ self._key(ant_id, new_room)
+            self.potential += distance.get(new_room, 0) - distance.get(old_room, 0)
+        step = colony.step_count
+        
+        if colony.all_ants_arrived():
+            return None
+        if self.potential < self.best_potential:
+            self.best_potential = self.potential
+            self.best_step = step
+        
+        if self.max_repeats is not None:
+            first_step, count = self.seen.get(self.state_hash, (step, 0))
+            self.seen[self.state_hash] = (first_step, count + 1)
+            if count + 1 >= self.max_repeats:
+                self.repeated_step = first_step
+                return self.stop("cycle")
+        if self.stall_window is not None and step - self.best_step >= self.stall_window:
+            return self.stop("stalled")
+        if self.max_steps is not None and step >= self.max_steps:
+            return self.stop("max_steps")
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            return self.stop("timeout")
+        return None
+    
+    def diagnostic(self) -> dict:
+        """Raison de l'arrêt, étape, fourmis arrivées et restantes, progrès"""
+        colony = self.colony
+        arrived = len(colony.room_occupancy.get("Sd", []))
+        return {
+            'reason': self.reason,
+            'step': colony.step_count,
+            'arrived': arrived,
+            'ants': colony.antnest.ants,
+            'remaining': colony.antnest.ants - arrived,
+            'distance_left': self.potential,
+            'last_progress_step': self.best_step,
+            'repeated_step': self.repeated_step,
+            'state_hash': f"{self.state_hash:016x}",
+        }
+
+
+# Raisons d'arrêt d'une résolution incomplète (messages affichés)
+STOP_REASONS = {
+    "blocked": "aucun mouvement possible",
+    "cycle": "état d'occupation répété (oscillation)",
+    "stalled": "aucun rapprochement du dortoir",
+    "max_steps": "nombre maximal d'étapes atteint",
+    "timeout": "budget de temps épuisé",
+}
+
+
+def describe_solve_stop(diagnostic: dict) -> str:
+    """Message lisible d'une résolution arrêtée avant l'arrivée de toutes les fourmis"""
+    reason = STOP_REASONS.get(diagnostic.get('reason'), diagnostic.get('reason') or "raison inconnue")
+    remaining = diagnostic['ants'] - diagnostic['arrived']
+    return (f"Résolution incomplète à l'étape {diagnostic['step']} : {reason}, "
+            f"{remaining} fourmi(s) hors du dortoir")
+
+
 class AntColony:
     """Gère une colonie de fourmis et leur déplacement dans la fourmilière"""
     
-    def __init__(self, antnest):
+    def __init__(self, antnest, instrument: bool = False, routing: str = "distance"):
         self.antnest = antnest
-        self.graph = self._create_graph()
+        self.adjacency = self._create_adjacency()
+        self.edges = self._list_edges()
+        self.distance_to_sd = self._compute_distances_to("Sd")
+        self._graph = None  # Graphe NetworkX construit à la demande (affichage)
         self.ants = [Ant(i+1, "Sv") for i in range(antnest.ants)]
         self.room_occupancy = self._init_room_occupancy()
         self.step_count = 0
         self.movements_history = []
+        self.solve_monitor = None  # Surveillance de la dernière résolution (arrêts, diagnostic)
+        self.planning_time = None  # Durée de la planification coopérative en secondes (cooperative.plan_colony)
         
         # 🐜 Tracking des phéromones (passages sur les arêtes)
         self.edge_passages = self._init_edge_passages()
         
+        # 🧭 Politique de routage (None = salle la plus proche du dortoir)
+        self.router = None
+        if routing != "distance":
+            from routing import ROUTING_POLICIES
+            if routing not in ROUTING_POLICIES:
+                raise ValueError(f"Routage inconnu: {routing} (disponibles: {', '.join(ROUTING_POLICIES)})")
+            self.router = ROUTING_POLICIES[routing](self)
+        
+        # ⏱️ Instrumentation par phase (optionnelle, None = désactivée)
+        self.profiler = None
+        if instrument:
+            from instrumentation import SolverProfiler
+            self.profiler = SolverProfiler().attach(self)
+        
     def _init_edge_passages(self) -> Dict[tuple, int]:
         """Initialise le compteur de passages pour chaque arête"""
         passages = {}
         # Toutes les arêtes du graphe (tunnels)
-        for edge in self.graph.edges():
+        for edge in self.edges:
             # Normaliser l'ordre des sommets pour éviter (A,B) vs (B,A)
             normalized_edge = tuple(sorted(edge))
             passages[normalized_edge] = 0
         return passages
         
-    def _create_graph(self) -> nx.Graph:
-        """Crée un graphe NetworkX à partir des tunnels"""
-        G = nx.Graph()
-        G.add_edges_from(self.antnest.tubes)
-        return G
+    def _create_adjacency(self) -> Dict[str, Dict[str, None]]:
+        """Crée les listes d'adjacence à partir des tunnels (même ordre que NetworkX)"""
+        adjacency = {}
+        for a, b in self.antnest.tubes:
+            adjacency.setdefault(a, {})[b] = None
+            adjacency.setdefault(b, {})[a] = None
+        return adjacency
+    
+    def _list_edges(self) -> List[Tuple[str, str]]:
+        """Liste les tunnels sans doublon, dans l'ordre de parcours de nx.Graph.edges()"""
+        edges = []
+        seen = set()
+        for room, neighbors in self.adjacency.items():
+            for neighbor in neighbors:
+                if neighbor not in seen:
+                    edges.append((room, neighbor))
+            seen.add(room)
+        return edges
+    
+    def _compute_distances_to(self, target: str) -> Dict[str, int]:
+        """Distance (en tunnels) de chaque salle vers la cible, par parcours en largeur"""
+        if target not in self.adjacency:
+            return {}
+        distances = {target: 0}
+        to_visit = deque([target])
+        while to_visit:
+            room = to_visit.popleft()
+            for neighbor in self.adjacency[room]:
+                if neighbor not in distances:
+                    distances[neighbor] = distances[room] + 1
+                    to_visit.append(neighbor)
+        return distances
+    
+    @property
+    def graph(self):
+        """Graphe NetworkX de la fourmilière (importé et construit au premier accès)"""
+        if self._graph is None:
+            import networkx as nx
+            
+            G = nx.Graph()
+            G.add_edges_from(self.antnest.tubes)
+            self._graph = G
+        return self._graph
     
     def _init_room_occupancy(self) -> Dict[str, List[int]]:
         """Initialise l'occupation des salles"""
@@ -88,7 +267,7 @@ class AntColony:
         current_room = ant.current_room
         available_rooms = []
         
-        neighbors = list(self.graph.neighbors(current_room))
+        neighbors = self.adjacency.get(current_room, ())
         
         for room in neighbors:
             if room == "Sd":
@@ -119,9 +298,13 @@ class AntColony:
         ant.current_room = destination
         return True
     
+    @traced("AntColony.simulate_step", cat="solver")
     def simulate_step(self) -> List[Tuple[int, str, str]]:
         """Simule une étape de déplacement - Version hybride optimisée"""
         movements = []
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start_step(self.step_count + 1)
         
         # STRATÉGIE HYBRIDE:
         # 1. Essayer d'abord l'approche simple (séquentielle) efficace
@@ -131,6 +314,11 @@ class AntColony:
         ants_needing_conflict_resolution = []
         temp_occupancy = {k: v.copy() for k, v in self.room_occupancy.items()}  # Copie temporaire
         
+        if profiler is not None:
+            profiler.lap("copy_s")
+            profiler.count("copies", len(temp_occupancy))
+            profiler.count("ants_examined", len(self.ants) - len(self.room_occupancy.get("Sd", [])))
+        
         for ant in self.ants:
             if ant.current_room == "Sd":
                 continue
@@ -158,6 +346,10 @@ class AntColony:
                 elif best_move:
                     ants_needing_conflict_resolution.append(ant)
         
+        if profiler is not None:
+            profiler.lap("phase1_s")
+            profiler.count("ants_deferred", len(ants_needing_conflict_resolution))
+        
         # Phase 2: Résolution de conflits pour les fourmis restantes (si nécessaire)
         if ants_needing_conflict_resolution:
             planned_moves = []
@@ -171,6 +363,8 @@ class AntColony:
                         planned_moves.append((ant, ant.current_room, best_move))
             
             valid_moves = self._resolve_movement_conflicts(planned_moves)
+            if profiler is not None:
+                profiler.count("capacity_rejections", len(planned_moves) - len(valid_moves))
             
             for ant, old_room, new_room in valid_moves:
                 if self._execute_move(ant, old_room, new_room):
@@ -178,6 +372,12 @@ class AntColony:
         
         # Mettre à jour l'occupation réelle
         self.room_occupancy = temp_occupancy
+        if self.router is not None:
+            self.router.end_step(temp_occupancy)
+        
+        if profiler is not None:
+            profiler.lap("phase2_s")
+            profiler.end_step(len(movements))
         
         self.step_count += 1
         self.movements_history.append(movements)
@@ -201,13 +401,16 @@ class AntColony:
         if new_room not in temp_occupancy:
             temp_occupancy[new_room] = []
         temp_occupancy[new_room].append(ant.id)
+        
+        if self.router is not None:
+            self.router.moved(ant, old_room, new_room, temp_occupancy)
     
     def _get_available_moves_with_temp(self, ant, temp_occupancy: dict) -> List[str]:
         """Retourne les salles où une fourmi peut se déplacer (avec occupation temporaire)"""
         current_room = ant.current_room
         available_rooms = []
         
-        neighbors = list(self.graph.neighbors(current_room))
+        neighbors = self.adjacency.get(current_room, ())
         
         for room in neighbors:
             if room == "Sd":
@@ -226,18 +429,17 @@ class AntColony:
         """Choisit le meilleur mouvement pour se rapprocher du dortoir"""
         if not available_moves:
             return None
+        if self.router is not None:
+            return self.router.choose(ant, available_moves)
             
         best_move = None
         shortest_distance = float('inf')
         
         for move in available_moves:
-            try:
-                distance = nx.shortest_path_length(self.graph, move, "Sd")
-                if distance < shortest_distance:
-                    shortest_distance = distance
-                    best_move = move
-            except nx.NetworkXNoPath:
-                continue
+            distance = self.distance_to_sd.get(move)
+            if distance is not None and distance < shortest_distance:
+                shortest_distance = distance
+                best_move = move
                 
         return best_move
     
@@ -336,7 +538,7 @@ class AntColony:
         pheromone_data = self.get_pheromone_data_until_step(target_step)
         
         # Statistiques globales
-        total_tunnels = len(self.graph.edges())
+        total_tunnels = len(self.edges)
         active_tunnels = len(pheromone_data)
         unused_tunnels = total_tunnels - active_tunnels
         total_passages = sum(data['passages'] for data in pheromone_data.values())
@@ -354,7 +556,7 @@ class AntColony:
             }
         
         # Tunnels non utilisés
-        for edge in self.graph.edges():
+        for edge in self.edges:
             normalized_edge = tuple(sorted(edge))
             if normalized_edge not in pheromone_data:
                 tunnel_name = f"{edge[0]} ↔ {edge[1]}"
@@ -386,6 +588,9 @@ class AntColony:
         print(f"   • Tunnels actifs : {stats['global']['active_tunnels']} ({stats['global']['usage_rate']:.1f}%)")
         print(f"   • Tunnels inutilisés : {stats['global']['unused_tunnels']}")
         print(f"   • Passages totaux : {stats['global']['total_passages']}")
+        moves = self.get_move_statistics()
+        print(f"   • Étapes : {moves['steps']} ({moves['idle_ant_steps']} attentes, "
+              f"{moves['wasted_moves']} mouvements inutiles)")
         
         print(f"\n🟣 Tunnels actifs (avec phéromones) :")
         active_tunnels = {k: v for k, v in stats['details'].items() if v['status'] == 'actif'}
@@ -415,7 +620,7 @@ class AntColony:
         progressive_passages = {}
         
         # Initialiser tous les edges à 0
-        for edge in self.graph.edges():
+        for edge in self.edges:
             normalized_edge = tuple(sorted(edge))
             progressive_passages[normalized_edge] = 0
         
@@ -448,18 +653,17 @@ class AntColony:
         """Choisit le meilleur mouvement pour se rapprocher du dortoir"""
         if not available_moves:
             return None
+        if self.router is not None:
+            return self.router.choose(ant, available_moves)
             
         best_move = None
         shortest_distance = float('inf')
         
         for move in available_moves:
-            try:
-                distance = nx.shortest_path_length(self.graph, move, "Sd")
-                if distance < shortest_distance:
-                    shortest_distance = distance
-                    best_move = move
-            except nx.NetworkXNoPath:
-                continue
+            distance = self.distance_to_sd.get(move)
+            if distance is not None and distance < shortest_distance:
+                shortest_distance = distance
+                best_move = move
                 
         return best_move
     
@@ -467,15 +671,83 @@ class AntColony:
         """Vérifie si toutes les fourmis sont arrivées au dortoir"""
         return len(self.room_occupancy.get("Sd", [])) == self.antnest.ants
     
-    def solve(self) -> List[List[Tuple[int, str, str]]]:
-        """Résout complètement le déplacement des fourmis"""
+    def iter_solve(self, max_steps: Optional[int] = None, time_budget: Optional[float] = None,
+                   stall_window: Optional[int] = STALL_WINDOW,
+                   max_repeats: Optional[int] = MAX_REPEATS) -> Iterator[List[Tuple[int, str, str]]]:
+        """Résout pas à pas : produit les mouvements de chaque étape dès qu'elle est simulée
+        
+        La résolution s'arrête aussi, sans lever d'erreur, si la distance totale au
+        dortoir ne progresse plus sur `stall_window` étapes, si l'état d'occupation
+        se répète `max_repeats` fois (oscillation, désactivé par défaut), ou au-delà
+        de `max_steps` étapes / `time_budget` secondes. La raison est ensuite donnée
+        par get_solve_diagnostic().
+        """
+        monitor = SolveMonitor(self, max_steps, time_budget, stall_window, max_repeats)
+        self.solve_monitor = monitor
         while not self.all_ants_arrived():
             movements = self.simulate_step()
             if not movements:
+                monitor.stop("blocked")
+                break
+            yield movements
+            if monitor.update(movements):
                 break
+        else:
+            monitor.stop("solved")
+    
+    @traced("AntColony.solve", cat="solver")
+    def solve(self, max_steps: Optional[int] = None, time_budget: Optional[float] = None,
+              stall_window: Optional[int] = STALL_WINDOW,
+              max_repeats: Optional[int] = MAX_REPEATS) -> List[List[Tuple[int, str, str]]]:
+        """Résout complètement le déplacement des fourmis (mêmes arrêts que iter_solve)"""
+        for _ in self.iter_solve(max_steps, time_budget, stall_window, max_repeats):
+            pass
                 
         return self.movements_history
     
+    def get_solve_diagnostic(self) -> dict:
+        """Raison de l'arrêt de la dernière résolution et état de la colonie à cet instant"""
+        if self.solve_monitor is None:
+            return {'reason': None, 'step': self.step_count,
+                    'arrived': len(self.room_occupancy.get("Sd", [])), 'ants': self.antnest.ants}
+        return self.solve_monitor.diagnostic()
+    
+    def load_history(self, movements_history) -> "AntColony":
+        """Rejoue un historique déjà calculé (par exemple résolu dans un autre processus)
+        
+        Les positions, l'occupation des salles et les passages (phéromones) sont mis à
+        jour comme si la colonie avait simulé ces étapes elle-même.
+        """
+        ants = {ant.id: ant for ant in self.ants}
+        for movements in movements_history:
+            movements = list(movements)
+            for ant_id, old_room, new_room in movements:
+                self._execute_move(ants[ant_id], old_room, new_room)
+            self.step_count += 1
+            self.movements_history.append(movements)
+        return self
+    
+    def get_move_statistics(self) -> dict:
+        """Étapes, mouvements, attentes (fourmis hors du dortoir immobiles pendant une étape)
+        et mouvements inutiles (qui ne rapprochent pas du dortoir)"""
+        distance = self.distance_to_sd
+        moves = idle = wasted = 0
+        arrived = 0
+        for movements in self.movements_history:
+            idle += self.antnest.ants - arrived - len(movements)
+            moves += len(movements)
+            for ant_id, old_room, new_room in movements:
+                if new_room == "Sd":
+                    arrived += 1
+                if distance.get(new_room, 0) >= distance.get(old_room, 0):
+                    wasted += 1
+        return {
+            'steps': len(self.movements_history),
+            'moves': moves,
+            'idle_ant_steps': idle,
+            'wasted_moves': wasted,
+        }
+    
     def get_visited_rooms(self) -> set:
         """Retourne l'ensemble de toutes les salles visitées pendant la simulation"""
         visited = {'Sv'}  # Le vestibule est toujours visité (point de départ)
@@ -500,15 +772,22 @@ class AntColony:
                     print(f"f{ant_id} - {old_room} - {new_room}")
                 print()
         
-        print(f"Toutes les fourmis ont rejoint le dortoir en {len(self.movements_history)} étapes.")
+        stats = self.get_move_statistics()
+        print(f"Toutes les fourmis ont rejoint le dortoir en {stats['steps']} étapes.")
+        print(f"({stats['moves']} mouvements, {stats['idle_ant_steps']} attentes, "
+              f"{stats['wasted_moves']} mouvements inutiles)")
         print()
     
     def visualize_graph(self):
         """Visualise le graphe de la fourmilière avec les traces de phéromones"""
+        import matplotlib.pyplot as plt
+        import networkx as nx
+        from layout import default_layout
+        
         plt.figure(figsize=(14, 10))
         
         # Position des nœuds
-        pos = nx.spring_layout(self.graph, seed=42)
+        pos = default_layout(self.antnest, seed=42, k=None)
         
         # Couleurs et tailles des nœuds selon l'occupation finale
         final_occupancy = self._get_occupancy_at_step(len(self.movements_history))
@@ -606,6 +885,10 @@ class AntColony:
         if not self.movements_history:
             print("Aucune solution à animer. Résolvez d'abord la fourmilière.")
             return
+        
+        import matplotlib.pyplot as plt
+        import networkx as nx
+        from layout import default_layout
             
         for step_num, movements in enumerate(self.movements_history, 1):
             if not movements:
@@ -614,7 +897,7 @@ class AntColony:
             plt.figure(figsize=(12, 8))
             
             # Position des nœuds
-            pos = nx.spring_layout(self.graph, seed=42)
+            pos = default_layout(self.antnest, seed=42, k=None)
             
             # Couleurs des nœuds selon l'occupation actuelle
             node_colors = []
@@ -725,13 +1008,169 @@ def load_antnest_from_txt(filepath: str) -> AntNest:
     return AntNest(antnest_name, ants, rooms, tubes)
 
 
-def solve_antnest(antnest: AntNest) -> AntColony:
-    """Fonction utilitaire pour résoudre une fourmilière"""
+def _solve_hybrid(antnest: AntNest) -> AntColony:
+    """Stratégie par défaut : glouton hybride (séquentiel + résolution de conflits)"""
     colony = AntColony(antnest)
     colony.solve()
     return colony
 
 
+def _solve_congestion(antnest: AntNest) -> AntColony:
+    """Glouton hybride avec routage par coût distance + attente prévue (congestion)"""
+    colony = AntColony(antnest, routing="congestion")
+    colony.solve()
+    return colony
+
+
+def _solve_ecmp(antnest: AntNest) -> AntColony:
+    """Glouton hybride avec table de routage ECMP (tourniquet pondéré par salle)"""
+    colony = AntColony(antnest, routing="ecmp")
+    colony.solve()
+    return colony
+
+
+def _solve_monotone(antnest: AntNest) -> AntColony:
+    """Glouton hybride limité aux mouvements qui rapprochent strictement du dortoir"""
+    colony = AntColony(antnest, routing="monotone")
+    colony.solve()
+    return colony
+
+
+def _solve_reservation(antnest: AntNest) -> AntColony:
+    """Planification coopérative : itinéraires réservés dans une table espace-temps"""
+    from cooperative import plan_colony
+    return plan_colony(AntColony(antnest))
+
+
+def _solve_aco(antnest: AntNest) -> AntColony:
+    """Optimisation par colonies de fourmis : lots de colonies guidées par les phéromones"""
+    from aco import solve_aco
+    return solve_aco(antnest)
+
+
+def _solve_portfolio(antnest: AntNest) -> AntColony:
+    """Glouton hybride sous des ordres de fourmis et de voisins permutés : la plus courte"""
+    from portfolio import solve_portfolio
+    return solve_portfolio(antnest)
+
+
+# Stratégies de résolution disponibles (nom -> fonction AntNest -> AntColony)
+STRATEGIES = {
+    "hybrid": _solve_hybrid,
+    "congestion": _solve_congestion,
+    "ecmp": _solve_ecmp,
+    "monotone": _solve_monotone,
+    "reservation": _solve_reservation,
+    "aco": _solve_aco,
+    "portfolio": _solve_portfolio,
+}
+
+
+def solve_antnest(antnest: AntNest, strategy: str = "hybrid") -> AntColony:
+    """
+    Fonction utilitaire pour résoudre une fourmilière.
+
+    Une résolution arrêtée avant l'arrivée de toutes les fourmis (blocage, oscillation,
+    absence de progrès) est signalée sur la sortie d'erreur ; la colonie retournée
+    porte alors un historique partiel (all_ants_arrived() est faux) et
+    get_solve_diagnostic() en donne la raison.
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Stratégie inconnue: {strategy} (disponibles: {', '.join(STRATEGIES)})")
+    colony = STRATEGIES[strategy](antnest)
+    if not colony.all_ants_arrived():
+        print(f"⚠️  {antnest.name} [{strategy}] : {describe_solve_stop(colony.get_solve_diagnostic())}",
+              file=sys.stderr)
+    return colony
+
+
+def lower_bound_steps(antnest: AntNest) -> Optional[int]:
+    """
+    Borne inférieure du nombre d'étapes nécessaires.
+    
+    La dernière fourmi ne peut quitter le vestibule (ou entrer au dortoir) avant
+    ceil(fourmis / débit) étapes, où le débit est la somme des capacités des salles
+    voisines de Sv (resp. Sd) ; il lui reste ensuite au moins distance - 1 tunnels.
+    Retourne None si le dortoir est inaccessible.
+    """
+    if antnest.ants <= 0:
+        return 0
+    
+    neighbors = {}
+    for a, b in antnest.tubes:
+        neighbors.setdefault(a, set()).add(b)
+        neighbors.setdefault(b, set()).add(a)
+    
+    if "Sd" in neighbors.get("Sv", ()):
+        return 1
+    
+    # Distance Sv -> Sd (parcours en largeur)
+    distances = {"Sv": 0}
+    to_visit = deque(["Sv"])
+    while to_visit:
+        room = to_visit.popleft()
+        for neighbor in neighbors.get(room, ()):
+            if neighbor not in distances:
+                distances[neighbor] = distances[room] + 1
+                to_visit.append(neighbor)
+    if "Sd" not in distances:
+        return None
+    
+    def throughput(room):
+        return sum(antnest.rooms.get(n, 1) for n in neighbors[room] if n not in ("Sv", "Sd"))
+    
+    rate = max(1, min(throughput("Sv"), throughput("Sd")))
+    return distances["Sd"] - 1 + math.ceil(antnest.ants / rate)
+
+
+def validate_solution(antnest: AntNest, movements_history, max_errors: int = 20) -> List[str]:
+    """
+    Vérifie un historique de mouvements contre les règles de la fourmilière.
+
+    Règles : un mouvement par fourmi et par étape, le long d'un tunnel, depuis la
+    salle où se trouve la fourmi ; à la fin de chaque étape, aucune salle au-delà de
+    sa capacité (Sv et Sd illimitées) ; à la fin, toutes les fourmis au dortoir.
+
+    Returns:
+        Liste des erreurs (vide si la solution est valide), au plus max_errors
+    """
+    tunnels = {frozenset(tube) for tube in antnest.tubes}
+    positions = {ant_id: "Sv" for ant_id in range(1, antnest.ants + 1)}
+    occupancy = {room: 0 for room in antnest.rooms}
+    errors = []
+    for step_num, movements in enumerate(movements_history, 1):
+        moved = set()
+        touched = set()
+        for ant_id, old_room, new_room in movements:
+            if ant_id not in positions:
+                errors.append(f"E{step_num}: fourmi inconnue f{ant_id}")
+                continue
+            if ant_id in moved:
+                errors.append(f"E{step_num}: f{ant_id} se déplace plusieurs fois")
+            moved.add(ant_id)
+            if positions[ant_id] != old_room:
+                errors.append(f"E{step_num}: f{ant_id} est en {positions[ant_id]}, pas en {old_room}")
+            if frozenset((old_room, new_room)) not in tunnels:
+                errors.append(f"E{step_num}: pas de tunnel {old_room} - {new_room}")
+            if positions[ant_id] in occupancy:
+                occupancy[positions[ant_id]] -= 1
+            positions[ant_id] = new_room
+            if new_room in occupancy:
+                occupancy[new_room] += 1
+                touched.add(new_room)
+        for room in touched:
+            if occupancy[room] > antnest.rooms[room]:
+                errors.append(f"E{step_num}: {room} contient {occupancy[room]} fourmis "
+                              f"(capacité {antnest.rooms[room]})")
+        if len(errors) >= max_errors:
+            return errors[:max_errors]
+    
+    remaining = sum(1 for room in positions.values() if room != "Sd")
+    if remaining:
+        errors.append(f"{remaining} fourmi(s) hors du dortoir à la fin")
+    return errors[:max_errors]
+
+
 def test_all_fourmilieres():
     """Test toutes les fourmilières disponibles"""
     fourmilieres_files = [
@@ -0,0 +1,203 @@
+'''
+Évaluation directe (sans simulation) d'un plan par chemins.
+
+Un plan par chemins affecte à chaque chemin Sv -> Sd un nombre de fourmis, qui
+partent en file : un chemin de débit r laisse partir r fourmis par étape et chacune
+avance d'une salle par étape sans attendre. Avec L tunnels et n fourmis, la
+dernière fourmi arrive à l'étape
+
+    L - 1 + ceil(n / r)
+
+Le débit d'un chemin est la plus petite part de capacité de ses salles, calculée
+pour chaque répartition : la capacité d'une salle est partagée entre les seuls
+chemins qui reçoivent des fourmis (division entière, le reste aux premiers). Les
+parts ne dépassent jamais la capacité : l'ordonnancement en file est toujours
+valide, et pipeline_history() le produit. Si une salle a moins de places que de
+chemins actifs, ces chemins sont servis par vagues successives (la suivante part
+quand la précédente est arrivée).
+
+La valeur est exacte pour cet ordonnancement, mais c'est un majorant du meilleur
+ordonnancement de la répartition : une salle partagée pourrait aussi être utilisée
+en alternance (une étape sur deux pour chaque chemin, etc.), ce que la file à débit
+entier ne représente pas. D'où le nom makespan_bound(), et best_split() minimise ce
+majorant, pas le nombre d'étapes optimal.
+
+L'évaluation est vectorisée (NumPy) : une répartition ou un tableau de
+répartitions (une par ligne) s'évalue en quelques microsecondes.
+'''
+
+import math
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+class PathSet:
+    """Chemins candidats d'une fourmilière : longueurs et salles partagées précalculées"""
+
+    def __init__(self, antnest, paths: Sequence[Sequence[str]]):
+        self.antnest = antnest
+        self.paths = [list(path) for path in paths]
+        self.lengths = np.array([len(path) - 1 for path in self.paths], dtype=np.int64)
+
+        # Incidence chemin x salle intermédiaire (Sv et Sd : illimitées, non partagées)
+        rooms = list(dict.fromkeys(room for path in self.paths for room in path[1:-1]))
+        index = {room: i for i, room in enumerate(rooms)}
+        self.incidence = np.zeros((len(self.paths), len(rooms)), dtype=bool)
+        for p, path in enumerate(self.paths):
+            for room in path[1:-1]:
+                self.incidence[p, index[room]] = True
+        self.capacities = np.array([antnest.rooms.get(room, 1) for room in rooms], dtype=np.int64)
+
+        # Débits quand tous les chemins reçoivent des fourmis (information, best_split)
+        self.rates = self.shared_rates(np.ones(len(self.paths), dtype=bool))
+
+    def shared_rates(self, active) -> np.ndarray:
+        """
+        Débit de chaque chemin quand seuls les chemins `active` reçoivent des fourmis.
+
+        La capacité d'une salle est partagée entre ses chemins actifs (division entière,
+        le reste aux premiers) ; inf pour un chemin sans salle intermédiaire, 0 pour un
+        chemin sans part dans une de ses salles. Vectorisé sur les lignes de `active`.
+        """
+        active = np.asarray(active, dtype=bool)
+        uses = active[..., :, None] & self.incidence
+        users = np.maximum(uses.sum(axis=-2), 1)[..., None, :]
+        rank = np.cumsum(uses, axis=-2) - 1
+        shares = self.capacities // users + (rank < self.capacities % users)
+        return np.where(uses, shares, np.inf).min(axis=-1, initial=np.inf)
+
+    def _waves(self, ants, rates) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Débits et départs d'une répartition dont certains chemins n'ont aucune part.
+
+        Les chemins sont servis par vagues : une vague prend, dans l'ordre, les chemins
+        qui laissent au moins une place dans chacune de leurs salles, et partage les
+        capacités entre eux ; la vague suivante part quand toutes ses fourmis sont
+        arrivées (salles vides). Un chemin par une salle de capacité nulle : inf.
+        """
+        rates = rates.astype(float)
+        starts = np.zeros(len(self.paths))
+        remaining = [p for p in np.flatnonzero(ants > 0)
+                     if not (self.incidence[p] & (self.capacities <= 0)).any()]
+        for p in np.flatnonzero(ants > 0):
+            if p not in remaining:
+                rates[p], starts[p] = 0, np.inf
+        start = 0.0
+        while remaining:
+            load = np.zeros(len(self.capacities), dtype=np.int64)
+            wave = []
+            for p in remaining:
+                if (load[self.incidence[p]] < self.capacities[self.incidence[p]]).all():
+                    wave.append(p)
+                    load += self.incidence[p]
+            active = np.zeros(len(self.paths), dtype=bool)
+            active[wave] = True
+            wave_rates = self.shared_rates(active)
+            finish = start
+            for p in wave:
+                rates[p], starts[p] = wave_rates[p], start
+                finish = max(finish, start + self.lengths[p] - 1 + max(1, math.ceil(ants[p] / wave_rates[p])))
+            start = finish
+            remaining = [p for p in remaining if p not in wave]
+        return rates, starts
+
+    def plan(self, ants) -> Tuple[np.ndarray, np.ndarray]:
+        """Débit et étape du premier départ de chaque chemin pour une répartition (vecteur)"""
+        ants = np.asarray(ants)
+        rates = self.shared_rates(ants > 0)
+        if ((ants > 0) & (rates == 0)).any():
+            return self._waves(ants, rates)
+        return rates, np.zeros(len(self.paths))
+
+    def finish_times(self, ants) -> np.ndarray:
+        """
+        Étape d'arrivée de la dernière fourmi de chaque chemin (0 sans fourmi).
+
+        Args:
+            ants: fourmis par chemin (vecteur) ou une répartition par ligne (matrice)
+        Returns:
+            Tableau de même forme ; inf si un chemin passe par une salle de capacité nulle
+        """
+        ants = np.asarray(ants)
+        rates = self.shared_rates(ants > 0)
+        starts = np.zeros(rates.shape)
+        # Répartitions où un chemin n'a aucune part : ordonnancement par vagues
+        starved = ((ants > 0) & (rates == 0)).any(axis=-1)
+        if starved.any():
+            rates, starts = rates.copy(), starts.copy()
+            rows = np.flatnonzero(np.atleast_1d(starved))
+            for row in rows:
+                key = (row,) if ants.ndim > 1 else ()
+                rates[key], starts[key] = self._waves(ants[key], rates[key])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            batches = np.maximum(1, np.ceil(ants / rates))
+        finish = starts + self.lengths - 1 + batches
+        finish = np.where((ants > 0) & (rates == 0), np.inf, finish)
+        return np.where(ants > 0, finish, 0)
+
+    def makespan_bound(self, ants):
+        """
+        Nombre d'étapes de l'ordonnancement en file (par ligne pour une matrice).
+
+        Exact pour l'ordonnancement produit par pipeline_history() ; c'est un majorant
+        du meilleur ordonnancement de la même répartition (voir l'en-tête du module).
+        """
+        return self.finish_times(ants).max(axis=-1)
+
+    def best_split(self, total: int) -> np.ndarray:
+        """
+        Répartition de `total` fourmis qui minimise le majorant makespan_bound().
+
+        En T étapes, un chemin achemine au plus (T - L + 1) * r fourmis ; la plus petite
+        durée T suffisante est cherchée par dichotomie, puis le surplus est retiré en
+        priorité aux chemins les plus longs. Les débits sont ceux où tous les chemins
+        reçoivent des fourmis : un chemin laissé vide ne peut qu'augmenter les parts des
+        autres, le majorant de la répartition retenue est donc au plus T.
+        """
+        usable = self.rates > 0
+        if total <= 0 or not usable.any():
+            return np.zeros(len(self.paths), dtype=np.int64)
+        unlimited = np.isinf(self.rates)
+        finite_rates = np.where(unlimited, 0, self.rates)
+
+        def capacity(steps):
+            batches = np.maximum(0, steps - self.lengths + 1)
+            return np.where(unlimited, np.where(batches > 0, total, 0), batches * finite_rates)
+
+        low = int(self.lengths[usable].min())
+        high = low + total
+        while low < high:
+            middle = (low + high) // 2
+            if capacity(middle).sum() >= total:
+                high = middle
+            else:
+                low = middle + 1
+
+        split = capacity(low).astype(np.int64)
+        surplus = int(split.sum()) - total
+        # Retrait du surplus, en priorité sur les chemins les plus longs
+        for p in np.argsort(-self.lengths, kind='stable'):
+            if surplus <= 0:
+                break
+            removed = min(surplus, int(split[p]))
+            split[p] -= removed
+            surplus -= removed
+        return split
+
+    def pipeline_history(self, ants) -> List[List[Tuple[int, str, str]]]:
+        """Historique des mouvements de l'ordonnancement en file (fourmis numérotées chemin par chemin)"""
+        ants = np.asarray(ants, dtype=np.int64)
+        makespan = self.makespan_bound(ants)
+        if np.isinf(makespan):
+            raise ValueError("Fourmis affectées à un chemin sans débit")
+        steps: List[List[Tuple[int, str, str]]] = [[] for _ in range(int(makespan))]
+        ant_id = 0
+        rates, starts = self.plan(ants)
+        for path, rate, start, count in zip(self.paths, rates, starts, ants.tolist()):
+            for j in range(count):
+                ant_id += 1
+                departure = int(start) + (0 if np.isinf(rate) else j // int(rate))
+                for i in range(1, len(path)):
+                    steps[departure + i - 1].append((ant_id, path[i - 1], path[i]))
+        return steps
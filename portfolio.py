@@ -0,0 +1,111 @@
+'''
+Portefeuille de résolutions gloutonnes à départage aléatoire.
+
+Le glouton hybride est déterministe, mais son résultat dépend de l'ordre dans
+lequel les fourmis sont examinées (les premières servies prennent les places
+libres) et de l'ordre des voisins (à distance égale, le premier voisin l'emporte).
+Le portefeuille résout la même fourmilière sous de nombreuses permutations tirées
+de graines différentes, réparties sur un pool de processus, et garde la plus
+courte solution.
+
+La graine 0 conserve les ordres d'origine : le portefeuille n'est jamais moins bon
+que le glouton hybride. Chaque résolution est arrêtée au double de la longueur de
+la solution de référence (LIMIT_FACTOR), ce qui arrête aussi un ordre qui fait
+osciller des fourmis. Les processus ne renvoient que leur nombre d'étapes ; la
+meilleure graine est rejouée localement.
+'''
+
+import multiprocessing
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+from main import AntColony
+
+
+RUNS = 32          # Résolutions (graines) par défaut
+LIMIT_FACTOR = 2   # Abandon au-delà de LIMIT_FACTOR fois la longueur de référence
+
+
+@dataclass
+class PortfolioResult:
+    """Meilleure solution du portefeuille et distribution des nombres d'étapes"""
+    colony: AntColony
+    seed: int
+    steps: Dict[int, Optional[int]] = field(default_factory=dict)  # graine -> étapes (None = abandon)
+
+    @property
+    def distribution(self) -> Dict[int, int]:
+        """Nombre de graines par nombre d'étapes (résolutions abandonnées exclues)"""
+        return dict(sorted(Counter(s for s in self.steps.values() if s is not None).items()))
+
+    @property
+    def abandoned(self) -> int:
+        """Résolutions arrêtées (trop longues ou bloquées)"""
+        return sum(1 for s in self.steps.values() if s is None)
+
+
+def shuffled_colony(antnest, seed: int) -> AntColony:
+    """Colonie dont l'ordre des fourmis et des voisins est permuté (graine 0 : inchangé)"""
+    colony = AntColony(antnest)
+    if seed == 0:
+        return colony
+    rng = random.Random(seed)
+    rng.shuffle(colony.ants)
+    for room, neighbors in colony.adjacency.items():
+        order = list(neighbors)
+        rng.shuffle(order)
+        colony.adjacency[room] = dict.fromkeys(order)
+    return colony
+
+
+def run_seed(antnest, seed: int, limit: Optional[int] = None) -> Optional[int]:
+    """
+    Résout la fourmilière sous la permutation d'une graine.
+
+    Returns:
+        Nombre d'étapes, ou None si les fourmis ne sont pas toutes arrivées avant
+        `limit` étapes (ou si la résolution s'est bloquée)
+    """
+    colony = shuffled_colony(antnest, seed)
+    colony.solve(max_steps=limit)
+    return colony.step_count if colony.all_ants_arrived() else None
+
+
+def run_portfolio(antnest, runs: int = RUNS, jobs: Optional[int] = None,
+                  seed: int = 0) -> PortfolioResult:
+    """
+    Résout la fourmilière sous `runs` graines (seed, seed + 1, ...) et garde la plus courte.
+
+    La graine 0 (ordres d'origine) est toujours incluse et sert de référence.
+    """
+    others = [s for s in range(seed, seed + runs) if s != 0][:max(0, runs - 1)]
+    reference = run_seed(antnest, 0)
+    steps: Dict[int, Optional[int]] = {0: reference}
+    limit = LIMIT_FACTOR * reference if reference is not None else None
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(others) <= 1:
+        for s in others:
+            steps[s] = run_seed(antnest, s, limit)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(others))) as executor:
+            results = executor.map(run_seed, [antnest] * len(others), others,
+                                   [limit] * len(others), chunksize=max(1, len(others) // (4 * jobs)))
+            steps.update(zip(others, results))
+
+    finished = [s for s in steps if steps[s] is not None]
+    best = min(finished, key=lambda s: (steps[s], s)) if finished else 0
+    colony = shuffled_colony(antnest, best)
+    colony.solve()
+    return PortfolioResult(AntColony(antnest).load_history(colony.movements_history), best, steps)
+
+
+def solve_portfolio(antnest, runs: int = RUNS, jobs: Optional[int] = None) -> AntColony:
+    """Plus courte solution du portefeuille (séquentiel dans un processus fils du pool)"""
+    if jobs is None and multiprocessing.parent_process() is not None:
+        jobs = 1
+    return run_portfolio(antnest, runs, jobs).colony
@@ -0,0 +1,212 @@
+'''
+Post-optimisation d'une solution : recherche locale sous budget de temps.
+
+La solution (movements_history) est découpée en plans par fourmi : étape de départ
+de Sv et salle occupée à chaque étape jusqu'au dortoir. Les plans sont réservés
+dans une table espace-temps (cooperative.ReservationTable) puis améliorés :
+
+- les fourmis qui arrivent à la dernière étape sont replanifiées pour arriver au
+  moins une étape plus tôt : autre itinéraire (y compris ceux que la solution
+  n'emprunte pas : chemins du flot maximal), autre départ, sans attente ;
+- si l'une d'elles n'y parvient pas, une passe de tassement replanifie chaque
+  fourmi au plus tôt, ce qui libère de la place en fin de solution.
+
+Une fourmi n'est déplacée que si son nouveau plan tient dans la table : chaque
+solution intermédiaire respecte les capacités. Une fourmi n'est replanifiée que
+pour arriver plus tôt : le nombre d'étapes ne fait que baisser et la solution
+courante est toujours la meilleure trouvée. Elle est vérifiée par
+validate_solution() avant d'être retournée.
+
+Le budget couvre la construction des plans (sauf la vérification initiale de la
+solution, d'un seul tenant), la recherche, vérifiée à chaque fourmi replanifiée,
+et la reconstruction de l'historique, dont la durée est estimée par celle du
+découpage en plans.
+'''
+
+import random
+import time
+from typing import Dict, List, Optional, Tuple
+
+from main import AntColony, validate_solution
+from cooperative import ReservationPlanner
+
+
+DEFAULT_BUDGET = 1.0   # Secondes de recherche par défaut
+
+
+def ant_plans(movements_history) -> Dict[int, Tuple[int, List[str]]]:
+    """
+    Plan de chaque fourmi d'une solution : (départ, salles).
+
+    La fourmi est en salles[0] (Sv) à l'étape `départ` (son premier mouvement a lieu
+    à l'étape départ + 1), puis en salles[i] à la fin de l'étape départ + i.
+    """
+    plans: Dict[int, Tuple[int, List[str]]] = {}
+    for step_num, movements in enumerate(movements_history, 1):
+        for ant_id, old_room, new_room in movements:
+            if ant_id not in plans:
+                plans[ant_id] = (step_num - 1, [old_room])
+            departure, rooms = plans[ant_id]
+            # Attentes depuis le mouvement précédent
+            rooms.extend([rooms[-1]] * (step_num - 1 - departure - (len(rooms) - 1)))
+            rooms.append(new_room)
+    return plans
+
+
+def simple_route(rooms: List) -> List:
+    """Itinéraire sans attente ni boucle (une salle revisitée coupe le détour)"""
+    route = []
+    position = {}
+    for room in rooms:
+        if room in position:
+            del route[position[room] + 1:]
+            position = {r: i for i, r in enumerate(route)}
+        else:
+            position[room] = len(route)
+            route.append(room)
+    return route
+
+
+class LocalSearch:
+    """Recherche locale sur les plans des fourmis d'une solution valide"""
+
+    def __init__(self, antnest, movements_history, seed: int = 0,
+                 deadline: Optional[float] = None):
+        errors = validate_solution(antnest, movements_history, max_errors=1)
+        if errors:
+            raise ValueError(f"Solution invalide: {errors[0]}")
+        self.antnest = antnest
+        self.movements_history = movements_history
+        self.rng = random.Random(seed)
+        # Planificateur coopératif : numérotation des salles, table et chemins du flot
+        self.planner = ReservationPlanner(AntColony(antnest))
+        self.table = self.planner.table
+        index = {room: i for i, room in enumerate(self.planner.names)}
+
+        self.plans: Dict[int, Tuple[int, List[int]]] = {}
+        routes = {tuple(route) for route in self.planner.templates}
+        start = time.perf_counter()
+        plans = ant_plans(movements_history)
+        # history() parcourt autant de mouvements que ant_plans()
+        self.history_cost = time.perf_counter() - start
+        for count, (ant_id, (departure, rooms)) in enumerate(plans.items()):
+            if deadline is not None and count % 1024 == 0 and time.perf_counter() > deadline:
+                raise TimeoutError("Budget écoulé pendant la construction des plans")
+            plan = [index[room] for room in rooms]
+            self.plans[ant_id] = (departure, plan)
+            self.table.reserve_plan(plan, departure)
+            routes.add(tuple(simple_route(plan)))
+        # Itinéraires candidats, du plus court au plus long
+        self.routes = sorted((list(route) for route in routes), key=len)
+
+    def arrival(self, ant_id: int) -> int:
+        departure, plan = self.plans[ant_id]
+        return departure + len(plan) - 1
+
+    @property
+    def steps(self) -> int:
+        return max((self.arrival(ant_id) for ant_id in self.plans), default=0)
+
+    def _earliest(self, bound: int, deadline: Optional[float] = None) -> Optional[Tuple[int, List[int]]]:
+        """Plan sans attente (itinéraire, départ) arrivant avant l'étape `bound`, au plus tôt"""
+        best = None
+        for route in self.routes:
+            span = len(route) - 1
+            if span >= bound:
+                break
+            for departure in range(0, bound - span):
+                if self.table.fits(route, departure):
+                    best = (departure, route)
+                    bound = departure + span
+                    break
+                if deadline is not None and departure % 256 == 255 and time.perf_counter() > deadline:
+                    return best
+        return best
+
+    def replan(self, ant_id: int, bound: int, deadline: Optional[float] = None) -> bool:
+        """Replanifie une fourmi pour arriver avant l'étape `bound` ; sinon plan inchangé"""
+        departure, plan = self.plans[ant_id]
+        self.table.release_plan(plan, departure)
+        better = self._earliest(bound, deadline)
+        if better is not None:
+            self.plans[ant_id] = better
+            departure, plan = better
+        self.table.reserve_plan(plan, departure)
+        return better is not None
+
+    def compact(self, deadline: float) -> bool:
+        """Replanifie chaque fourmi au plus tôt ; indique si une fourmi a avancé"""
+        order = sorted(self.plans, key=lambda ant_id: (self.arrival(ant_id), self.rng.random()))
+        improved = False
+        for ant_id in order:
+            if time.perf_counter() > deadline:
+                break
+            improved |= self.replan(ant_id, self.arrival(ant_id), deadline)
+        return improved
+
+    def run(self, budget: float = DEFAULT_BUDGET) -> List[List[Tuple[int, str, str]]]:
+        """
+        Améliore la solution pendant `budget` secondes ; retourne la meilleure trouvée.
+
+        La recherche s'arrête assez tôt pour reconstruire l'historique dans le budget ;
+        sans amélioration, l'historique d'origine est retourné tel quel.
+        """
+        deadline = time.perf_counter() + budget - self.history_cost
+        initial_steps = self.steps
+        while time.perf_counter() < deadline:
+            target = self.steps - 1
+            late = [ant_id for ant_id in self.plans if self.arrival(ant_id) > target]
+            if not late:
+                break
+            self.rng.shuffle(late)
+            for ant_id in late:
+                if time.perf_counter() > deadline or not self.replan(ant_id, target + 1, deadline):
+                    break
+            else:
+                continue
+            if time.perf_counter() > deadline or not self.compact(deadline):
+                break   # Budget écoulé, ou optimum local : plus aucune fourmi ne peut avancer
+        if self.steps >= initial_steps:
+            return self.movements_history
+        return self.history()
+
+    def history(self) -> List[List[Tuple[int, str, str]]]:
+        """Historique des mouvements des plans courants"""
+        names = self.planner.names
+        steps: List[List[Tuple[int, str, str]]] = [[] for _ in range(self.steps)]
+        for ant_id in sorted(self.plans):
+            departure, plan = self.plans[ant_id]
+            for i in range(1, len(plan)):
+                if plan[i] != plan[i - 1]:
+                    steps[departure + i - 1].append((ant_id, names[plan[i - 1]], names[plan[i]]))
+        return steps
+
+
+def optimize_solution(antnest, movements_history, budget: float = DEFAULT_BUDGET,
+                      seed: int = 0) -> List[List[Tuple[int, str, str]]]:
+    """
+    Raccourcit une solution par recherche locale (au plus `budget` secondes, construction
+    des plans comprise ; les vérifications de l'entrée et du résultat s'y ajoutent).
+
+    Returns:
+        Historique au plus aussi long que l'original (l'original s'il n'est pas amélioré)
+    """
+    if not movements_history:
+        return movements_history
+    deadline = time.perf_counter() + budget
+    try:
+        search = LocalSearch(antnest, movements_history, seed, deadline)
+    except TimeoutError:
+        return movements_history
+    history = search.run(deadline - time.perf_counter())
+    if len(history) >= len(movements_history) or validate_solution(antnest, history, max_errors=1):
+        return movements_history
+    return history
+
+
+def optimize_colony(colony: AntColony, budget: float = DEFAULT_BUDGET, seed: int = 0) -> AntColony:
+    """Colonie rejouant la solution post-optimisée (la colonie d'origine si inchangée)"""
+    history = optimize_solution(colony.antnest, colony.movements_history, budget, seed)
+    if history is colony.movements_history:
+        return colony
+    return AntColony(colony.antnest).load_history(history)
@@ -0,0 +1,574 @@
+'''
+Rendu des étapes d'animation par artistes persistants et blitting.
+
+Le graphe statique (tunnels de base) est dessiné une seule fois dans un fond mis en
+cache ; à chaque étape, seuls les artistes persistants (PathCollection des salles,
+LineCollection des phéromones et des flèches, Text des étiquettes) sont mis à jour
+puis redessinés sur ce fond.
+
+Niveau de détail (grandes fourmilières, activé automatiquement au-delà de
+LOD_MIN_NODES salles) :
+- les chaînes de salles de degré 2 sont dessinées comme un seul segment ;
+- les étiquettes (salles, passages) sont masquées tant que le zoom est insuffisant
+  et limitées à la zone visible ;
+- les flèches de mouvement sont agrégées par région (grille) et par direction,
+  ce qui borne le nombre d'artistes dessinés quelle que soit la taille.
+'''
+
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba, to_rgba_array
+
+from tracing import traced
+
+
+# Couleurs des salles (même code couleur que FourmiGUI)
+VESTIBULE_COLOR = 'lightgreen'
+DORTOIR_COLOR = 'salmon'
+UNVISITED_COLOR = 'darkgray'
+OCCUPANCY_COLORS = ('steelblue', 'gold', 'darkorange', 'darkred')  # vide, < 50 %, < 100 %, plein
+
+# Couleurs des phéromones et des compteurs de passages selon l'intensité (< 0.3, < 0.7, sinon)
+PHEROMONE_COLORS = ('mediumpurple', 'purple', 'darkviolet')
+PASSAGE_LABEL_COLORS = ('lightblue', 'lightgreen', 'gold')
+
+ARROW_OFFSET = 0.15      # Raccourcissement des flèches aux extrémités (fraction du tunnel)
+ARROW_HEAD = 0.12        # Longueur de la pointe (fraction du tunnel)
+
+# Niveau de détail
+LOD_MIN_NODES = 100      # Nombre de salles à partir duquel le niveau de détail s'active
+LABEL_MIN_PIXELS = 40    # Espacement typique des salles (pixels) en dessous duquel les étiquettes sont masquées
+NODE_SPACING_PIXELS = 80 # Espacement (pixels) à partir duquel les salles ont leur taille normale
+MIN_SIZE_SCALE = 0.01    # Réduction maximale de la taille des salles
+REGION_GRID = 8          # Grille d'agrégation des flèches (REGION_GRID x REGION_GRID régions)
+REGION_LABELS = 12       # Nombre maximal d'étiquettes de flèches agrégées (les plus chargées)
+
+
+def intensity_bins(intensity):
+    """Classe d'intensité (0, 1 ou 2) selon les seuils 0.3 et 0.7"""
+    return np.digitize(intensity, (0.3, 0.7))
+
+
+def arrow_segments(starts, ends, offset=ARROW_OFFSET, head=ARROW_HEAD):
+    """
+    Segments (corps + deux branches de pointe) de flèches, calculés en une passe NumPy.
+
+    Args:
+        starts, ends: tableaux (n, 2) des extrémités
+    Returns:
+        tableau (3n, 2, 2) de segments, dans l'ordre corps, branche, branche par flèche
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    delta = ends - starts
+    tail = starts + delta * offset
+    tip = ends - delta * offset
+
+    back = delta * head
+    normal = np.stack([-back[:, 1], back[:, 0]], axis=1) * 0.5
+    left = tip - back + normal
+    right = tip - back - normal
+
+    segments = np.empty((len(starts), 3, 2, 2))
+    segments[:, 0] = np.stack([tail, tip], axis=1)
+    segments[:, 1] = np.stack([left, tip], axis=1)
+    segments[:, 2] = np.stack([right, tip], axis=1)
+    return segments.reshape(-1, 2, 2)
+
+
+def collapse_chains(adjacency, keep=("Sv", "Sd")):
+    """
+    Regroupe les chaînes de salles de degré 2 (en temps linéaire).
+
+    Returns:
+        liste de chaînes [u, x1, ..., xk, v] : u et v sont des jonctions (degré différent
+        de 2, ou salles de `keep`), les xi des salles de degré 2 ; un tunnel entre deux
+        jonctions forme une chaîne [u, v]. Chaque tunnel appartient à une seule chaîne.
+    """
+    junctions = {node for node, neighbors in adjacency.items() if len(neighbors) != 2 or node in keep}
+    seen_edges = set()
+    chains = []
+
+    def walk(start, first):
+        chain = [start]
+        previous, current = start, first
+        seen_edges.add(frozenset((start, first)))
+        while current not in junctions:
+            chain.append(current)
+            following = next(n for n in adjacency[current] if n != previous)
+            seen_edges.add(frozenset((current, following)))
+            previous, current = current, following
+        chain.append(current)
+        return chain
+
+    def add(chain):
+        # Boucle revenant sur sa jonction : coupée en deux au milieu pour rester visible
+        if chain[0] == chain[-1] and len(chain) > 2:
+            middle = len(chain) // 2
+            junctions.add(chain[middle])
+            chains.append(chain[:middle + 1])
+            chains.append(chain[middle:])
+        else:
+            chains.append(chain)
+
+    for node in list(adjacency):
+        if node in junctions:
+            for neighbor in adjacency[node]:
+                if frozenset((node, neighbor)) not in seen_edges:
+                    add(walk(node, neighbor))
+
+    # Cycles isolés composés uniquement de salles de degré 2
+    for node in adjacency:
+        if node not in junctions and any(frozenset((node, n)) not in seen_edges for n in adjacency[node]):
+            junctions.add(node)
+            for neighbor in adjacency[node]:
+                if frozenset((node, neighbor)) not in seen_edges:
+                    add(walk(node, neighbor))
+    return chains
+
+
+def region_arrows(starts, ends, weights, bounds, grid=REGION_GRID):
+    """
+    Agrège des flèches par région de la grille et par direction (quadrant).
+
+    Returns:
+        (débuts, fins, poids) des flèches agrégées : moyennes pondérées par le nombre de
+        fourmis ; au plus grid * grid * 4 flèches.
+    """
+    starts = np.asarray(starts, dtype=float)
+    ends = np.asarray(ends, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    (x_min, y_min), (x_max, y_max) = bounds
+    span = np.array([max(x_max - x_min, 1e-12), max(y_max - y_min, 1e-12)])
+
+    mids = (starts + ends) / 2
+    cells = np.clip(((mids - (x_min, y_min)) / span * grid).astype(int), 0, grid - 1)
+    delta = ends - starts
+    quadrant = (delta[:, 0] < 0).astype(int) * 2 + (delta[:, 1] < 0).astype(int)
+    keys = (cells[:, 0] * grid + cells[:, 1]) * 4 + quadrant
+
+    unique_keys, group = np.unique(keys, return_inverse=True)
+    total = np.bincount(group, weights=weights, minlength=len(unique_keys))
+    start_sum = np.stack([np.bincount(group, weights=starts[:, k] * weights) for k in (0, 1)], axis=1)
+    end_sum = np.stack([np.bincount(group, weights=ends[:, k] * weights) for k in (0, 1)], axis=1)
+    return start_sum / total[:, None], end_sum / total[:, None], total
+
+
+def path_segments(paths, pos):
+    """
+    Segments consécutifs de plusieurs chemins (salles sans position ignorées).
+
+    Returns:
+        (débuts, fins, indice du chemin) : tableaux (m, 2), (m, 2) et (m,)
+    """
+    pairs = [(a, b, i) for i, path in enumerate(paths)
+             for a, b in zip(path, path[1:]) if a in pos and b in pos]
+    if not pairs:
+        return np.empty((0, 2)), np.empty((0, 2)), np.empty(0, dtype=int)
+    starts = np.array([pos[a] for a, _, _ in pairs], dtype=float)
+    ends = np.array([pos[b] for _, b, _ in pairs], dtype=float)
+    owner = np.array([i for _, _, i in pairs], dtype=int)
+    return starts, ends, owner
+
+
+def offset_segments(starts, ends, offsets):
+    """
+    Décale des segments perpendiculairement à leur direction, en une passe NumPy.
+
+    Args:
+        offsets: décalage de chaque segment (signé, vers la gauche du sens de parcours)
+    Returns:
+        (débuts, fins) décalés ; les segments de longueur nulle ne sont pas décalés
+    """
+    starts = np.asarray(starts, dtype=float).reshape(-1, 2)
+    ends = np.asarray(ends, dtype=float).reshape(-1, 2)
+    delta = ends - starts
+    length = np.hypot(delta[:, 0], delta[:, 1])
+    scale = np.divide(np.asarray(offsets, dtype=float), length,
+                      out=np.zeros_like(length), where=length > 0)
+    shift = np.stack([-delta[:, 1], delta[:, 0]], axis=1) * scale[:, None]
+    return starts + shift, ends + shift
+
+
+class LabelPool:
+    """Réservoir d'étiquettes Text réutilisées : créées à la demande, masquées sinon"""
+
+    def __init__(self, ax, **text_kwargs):
+        self.ax = ax
+        self.text_kwargs = text_kwargs
+        self.labels = []
+
+    def place(self, items):
+        """Affiche une étiquette par élément (x, y, texte, couleur de fond ou None)"""
+        count = 0
+        for x, y, text, facecolor in items:
+            if count == len(self.labels):
+                self.labels.append(self.ax.text(0, 0, "", visible=False, animated=True,
+                                                **self.text_kwargs))
+            label = self.labels[count]
+            label.set_position((x, y))
+            label.set_text(text)
+            if facecolor is not None:
+                label.get_bbox_patch().set_facecolor(facecolor)
+            label.set_visible(True)
+            count += 1
+        for label in self.labels[count:]:
+            label.set_visible(False)
+
+
+class StepRenderer:
+    """Rendu persistant d'une colonie sur des axes matplotlib, avec blitting"""
+
+    def __init__(self, ax, colony, pos, lod=None, solution=None):
+        """
+        Args:
+            lod: niveau de détail (None : automatique au-delà de LOD_MIN_NODES salles)
+            solution: SharedSolution lue directement (mouvements et passages) au lieu de
+                colony.movements_history, qui peut alors rester vide
+        """
+        self.ax = ax
+        self.figure = ax.figure
+        self.canvas = ax.figure.canvas
+        self.colony = colony
+        self.pos = pos
+        self.solution = solution
+        self.lod = len(colony.adjacency) >= LOD_MIN_NODES if lod is None else lod
+        self.background = None
+        self._visited_rooms = None  # Salles visitées (historique complet), calculées une fois
+        self._last_frame = None
+
+        self.edges = [tuple(sorted(edge)) for edge in colony.edges]
+        self.edge_index = {edge: i for i, edge in enumerate(self.edges)}
+
+        # Segments dessinés : un par tunnel, ou un par chaîne de degré 2 en niveau de détail
+        if self.lod:
+            chains = collapse_chains(colony.adjacency)
+            self.segments = [(chain[0], chain[-1]) for chain in chains]
+            self.edge_segment = np.empty(len(self.edges), dtype=np.intp)
+            for i, chain in enumerate(chains):
+                for a, b in zip(chain, chain[1:]):
+                    self.edge_segment[self.edge_index[(a, b) if a < b else (b, a)]] = i
+            drawn = {node for segment in self.segments for node in segment}
+            self.nodes = [node for node in colony.adjacency if node in drawn]
+        else:
+            self.segments = self.edges
+            self.edge_segment = np.arange(len(self.edges))
+            self.nodes = list(colony.adjacency)
+
+        self.node_xy = np.array([pos[node] for node in self.nodes], dtype=float).reshape(-1, 2)
+        rooms = colony.antnest.rooms
+        self.capacities = np.array([rooms.get(node, 1) for node in self.nodes], dtype=float)
+        self.is_vestibule = np.array([node == "Sv" for node in self.nodes], dtype=bool)
+        self.is_dortoir = np.array([node == "Sd" for node in self.nodes], dtype=bool)
+        self.segment_xy = np.array([[pos[a], pos[b]] for a, b in self.segments],
+                                   dtype=float).reshape(-1, 2, 2)
+        self.bounds = (self.node_xy.min(axis=0), self.node_xy.max(axis=0)) if len(self.nodes) else ((0, 0), (1, 1))
+        # Espacement typique entre salles (données) : sert à mesurer le zoom en pixels
+        extent = np.ptp(self.node_xy, axis=0) if len(self.nodes) else np.ones(2)
+        area = extent[0] * extent[1]
+        self._spacing = float(np.sqrt(area / len(self.nodes)) if area > 0
+                              else max(extent.max(), 1e-12) / max(len(self.nodes), 1))
+
+        # Cumul des passages par tunnel, avancé progressivement d'étape en étape
+        self._passages = np.zeros(len(self.edges), dtype=np.int64)
+        self._passages_step = 0
+
+        self._build_artists()
+        self._update_detail()
+        self._draw_event_id = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _build_artists(self):
+        """Crée une fois pour toutes les artistes statiques et persistants"""
+        ax = self.ax
+        ax.clear()
+        ax.axis('off')
+
+        # Statique (dans le fond en cache) : tous les tunnels en noir fin
+        self.base_edges = LineCollection(self.segment_xy, colors='black', linewidths=0.8,
+                                         alpha=0.4, zorder=1)
+        ax.add_collection(self.base_edges)
+
+        # Dynamique : traces de phéromones, salles, flèches et étiquettes
+        self.pheromone_edges = LineCollection(self.segment_xy, linewidths=0, zorder=1.5)
+        ax.add_collection(self.pheromone_edges)
+
+        self.node_collection = ax.scatter(self.node_xy[:, 0], self.node_xy[:, 1],
+                                          s=np.full(len(self.nodes), 800.0),
+                                          c=[UNVISITED_COLOR] * len(self.nodes),
+                                          alpha=0.9, edgecolors='none', zorder=2)
+
+        self.arrows = LineCollection(np.empty((0, 2, 2)), colors='red', zorder=3,
+                                     capstyle='round')
+        ax.add_collection(self.arrows)
+
+        self.move_pool = LabelPool(ax, ha='center', va='center', fontsize=9, fontweight='bold', zorder=4,
+                                   bbox=dict(boxstyle="round,pad=0.3", facecolor='yellow', alpha=0.9))
+        self.passage_pool = LabelPool(ax, ha='center', va='center', fontsize=8, fontweight='bold',
+                                      color='darkblue', zorder=4,
+                                      bbox=dict(boxstyle="circle,pad=0.2", facecolor='lightblue', alpha=0.8))
+        self.node_pool = LabelPool(ax, ha='center', va='center', fontsize=11, zorder=5)
+
+        ax.update_datalim(self.node_xy)
+        ax.margins(0.1)
+        ax.autoscale_view()
+
+        for artist in (self.pheromone_edges, self.node_collection, self.arrows, ax.title):
+            artist.set_animated(True)
+
+    @property
+    def move_labels(self):
+        """Étiquettes de mouvement (réservoir)"""
+        return self.move_pool.labels
+
+    @property
+    def dynamic_artists(self):
+        """Artistes redessinés à chaque image, dans l'ordre de dessin"""
+        return [self.pheromone_edges, self.node_collection, self.arrows,
+                *self.move_pool.labels, *self.passage_pool.labels, *self.node_pool.labels,
+                self.ax.title]
+
+    def detach(self):
+        """Déconnecte le renderer (avant un redessin complet des axes)"""
+        if self._draw_event_id is not None:
+            self.canvas.mpl_disconnect(self._draw_event_id)
+            self._draw_event_id = None
+        for artist in self.dynamic_artists:
+            artist.set_animated(False)
+
+    def matches(self, ax, colony, pos) -> bool:
+        """Indique si le renderer peut être réutilisé pour ces axes, cette colonie et ces positions"""
+        return self.ax is ax and self.colony is colony and self.pos is pos
+
+    def _update_detail(self):
+        """Zoom courant : visibilité des étiquettes, taille des salles et zone visible"""
+        transform = self.ax.transData
+        origin, unit = transform.transform([(0, 0), (self._spacing, self._spacing)])
+        self.spacing_pixels = float(np.min(np.abs(unit - origin)))
+        self.show_labels = not self.lod or self.spacing_pixels >= LABEL_MIN_PIXELS
+        self.size_scale = (min(1.0, max(MIN_SIZE_SCALE, (self.spacing_pixels / NODE_SPACING_PIXELS) ** 2))
+                           if self.lod else 1.0)
+        self.view = (self.ax.get_xlim(), self.ax.get_ylim())
+
+    def _in_view(self, xy):
+        """Masque des points situés dans la zone visible des axes"""
+        (x0, x1), (y0, y1) = self.view
+        return ((xy[:, 0] >= min(x0, x1)) & (xy[:, 0] <= max(x0, x1))
+                & (xy[:, 1] >= min(y0, y1)) & (xy[:, 1] <= max(y0, y1)))
+
+    @property
+    def nb_steps(self) -> int:
+        """Nombre d'étapes de la solution affichée"""
+        if self.solution is not None:
+            return self.solution.steps
+        return len(self.colony.movements_history)
+
+    def step_movements(self, step_num: int):
+        """Mouvements d'une étape (1 = première étape), vides hors de la solution"""
+        if not 0 < step_num <= self.nb_steps:
+            return []
+        if self.solution is not None:
+            return self.solution.movements(step_num)
+        return self.colony.movements_history[step_num - 1]
+
+    def passages_until(self, step_num: int) -> np.ndarray:
+        """Passages cumulés par tunnel jusqu'à l'étape donnée (avance incrémentale)"""
+        if self.solution is not None:
+            # Image clé partagée précédente + mouvements suivants (mêmes tunnels, même ordre)
+            self._passages[:] = self.solution.passages_until(step_num)
+            self._passages_step = min(step_num, self.nb_steps)
+            return self._passages
+        history = self.colony.movements_history
+        step_num = min(step_num, len(history))
+        if step_num < self._passages_step:
+            self._passages[:] = 0
+            self._passages_step = 0
+
+        edge_index = self.edge_index
+        for movements in history[self._passages_step:step_num]:
+            for _, old_room, new_room in movements:
+                i = edge_index.get((old_room, new_room) if old_room < new_room else (new_room, old_room))
+                if i is not None:
+                    self._passages[i] += 1
+        self._passages_step = step_num
+        return self._passages
+
+    def seek_passages(self, step_num: int, passages):
+        """Positionne le cumul des passages à une étape déjà connue (ex. image clé partagée)"""
+        self._passages[:] = passages
+        self._passages_step = min(step_num, self.nb_steps)
+
+    def segment_passages(self, passages: np.ndarray) -> np.ndarray:
+        """Passages par segment dessiné (maximum sur les tunnels d'une chaîne)"""
+        if not self.lod:
+            return passages
+        result = np.zeros(len(self.segments), dtype=passages.dtype)
+        np.maximum.at(result, self.edge_segment, passages)
+        return result
+
+    def _update_nodes(self, occupancy, visited_rooms):
+        counts = np.array([len(occupancy.get(node, ())) for node in self.nodes], dtype=float)
+        capacities = self.capacities
+
+        sizes = 800 + capacities * 400 + counts * 100
+        sizes[self.is_vestibule] = 2500 + counts[self.is_vestibule] * 80
+        sizes[self.is_dortoir] = 2500 + counts[self.is_dortoir] * 40
+
+        intensity = np.minimum(1.0, counts / np.where(capacities > 0, capacities, 1))
+        level = np.where(intensity == 0, 0, np.where(intensity < 0.5, 1, np.where(intensity < 1.0, 2, 3)))
+        colors = [OCCUPANCY_COLORS[lvl] if node in visited_rooms else UNVISITED_COLOR
+                  for node, lvl in zip(self.nodes, level)]
+        colors = to_rgba_array(colors) if colors else np.empty((0, 4))
+        colors[self.is_vestibule] = to_rgba(VESTIBULE_COLOR)
+        colors[self.is_dortoir] = to_rgba(DORTOIR_COLOR)
+
+        self.node_collection.set_sizes(sizes * self.size_scale)
+        self.node_collection.set_facecolors(colors)
+
+        if not self.show_labels:
+            self.node_pool.place(())
+            return
+        rooms = self.colony.antnest.rooms
+        visible = np.flatnonzero(self._in_view(self.node_xy))
+        self.node_pool.place(
+            (self.node_xy[i, 0], self.node_xy[i, 1],
+             f"{self.nodes[i]}\n{int(counts[i])}/{rooms[self.nodes[i]]}" if self.nodes[i] in rooms
+             else f"{self.nodes[i]}\n{int(counts[i])}", None)
+            for i in visible)
+
+    def _update_pheromones(self, passages):
+        passages = self.segment_passages(passages)
+        max_passages = passages.max() if len(passages) else 0
+        intensity = passages / max_passages if max_passages > 0 else np.zeros(len(passages))
+        used = passages > 0
+        bins = intensity_bins(intensity)
+
+        colors = to_rgba_array([PHEROMONE_COLORS[b] for b in bins]) if len(bins) else np.empty((0, 4))
+        colors[:, 3] = np.where(used, (0.3 + intensity * 0.7) * 0.9, 0.0)
+        self.pheromone_edges.set_color(colors)
+        self.pheromone_edges.set_linewidths(np.where(used, (1 + intensity * 4) * 0.9, 0.0))
+
+        if not self.show_labels:
+            self.passage_pool.place(())
+            return
+        mids = self.segment_xy.mean(axis=1)
+        shown = np.flatnonzero(used & self._in_view(mids))
+        self.passage_pool.place(
+            (mids[i, 0], mids[i, 1] + 0.05, str(passages[i]), PASSAGE_LABEL_COLORS[bins[i]])
+            for i in shown)
+
+    def _set_arrows(self, starts, ends, nb_ants, widths=None):
+        if len(nb_ants):
+            if widths is None:
+                widths = np.minimum(2 + nb_ants * 1.5, 8)
+            widths = np.repeat(widths, 3)
+            alphas = np.repeat(np.minimum(0.6 + nb_ants * 0.1, 1.0), 3)
+            colors = np.tile(to_rgba('red'), (len(widths), 1))
+            colors[:, 3] = alphas
+            self.arrows.set_segments(arrow_segments(starts, ends))
+            self.arrows.set_linewidths(widths)
+            self.arrows.set_color(colors)
+        else:
+            self.arrows.set_segments([])
+
+    def _update_movements(self, step_num):
+        tunnel_movements = {}
+        for ant_id, old_room, new_room in self.step_movements(step_num):
+            tunnel_movements.setdefault((old_room, new_room), []).append(ant_id)
+        tunnels = [t for t in tunnel_movements if t[0] in self.pos and t[1] in self.pos]
+
+        starts = np.array([self.pos[a] for a, _ in tunnels], dtype=float).reshape(-1, 2)
+        ends = np.array([self.pos[b] for _, b in tunnels], dtype=float).reshape(-1, 2)
+        nb_ants = np.array([len(tunnel_movements[t]) for t in tunnels], dtype=float)
+
+        if self.lod:
+            # Une flèche par région et par direction, avec le nombre de fourmis
+            if tunnels:
+                starts, ends, nb_ants = region_arrows(starts, ends, nb_ants, self.bounds)
+            # Épaisseur relative à la région la plus chargée
+            widths = 1.5 + 4.5 * nb_ants / nb_ants.max() if len(nb_ants) else None
+            self._set_arrows(starts, ends, nb_ants, widths)
+            mids = (starts + ends) / 2
+            shown = np.flatnonzero(self._in_view(mids))
+            shown = shown[np.argsort(-nb_ants[shown], kind='stable')[:REGION_LABELS]]
+            self.move_pool.place(
+                (mids[i, 0], mids[i, 1], f"{int(nb_ants[i])} fourmis" if nb_ants[i] > 1 else "1 fourmi",
+                 'orange' if nb_ants[i] > 1 else 'yellow')
+                for i in shown)
+            return
+
+        self._set_arrows(starts, ends, nb_ants)
+
+        def labels():
+            for tunnel in tunnels:
+                ant_ids = tunnel_movements[tunnel]
+                (x1, y1), (x2, y2) = self.pos[tunnel[0]], self.pos[tunnel[1]]
+                if len(ant_ids) == 1:
+                    text, bg_color = f'f{ant_ids[0]}', 'yellow'
+                elif len(ant_ids) <= 3:
+                    text, bg_color = ', '.join(f'f{aid}' for aid in sorted(ant_ids)), 'orange'
+                else:
+                    first = ", ".join(f"f{aid}" for aid in sorted(ant_ids[:2]))
+                    text, bg_color = f'{len(ant_ids)} fourmis\n({first}...)', 'orange'
+                yield (x1 + x2) / 2, (y1 + y2) / 2, text, bg_color
+
+        self.move_pool.place(labels())
+
+    def _update_title(self, step_num, passages):
+        antnest = self.colony.antnest
+        if step_num == 0:
+            title = f"État Initial - {antnest.name} ({antnest.ants} fourmis)"
+        else:
+            total_tunnels = len(self.edges)
+            active = int((passages > 0).sum())
+            usage_rate = active / total_tunnels * 100 if total_tunnels else 0
+            title = (f"Étape {step_num} - {antnest.name}\n"
+                     f"Tunnels actifs: {active}/{total_tunnels} ({usage_rate:.0f}%) | "
+                     f"Passages totaux: {int(passages.sum())}")
+        self.ax.set_title(title, fontsize=12, fontweight='bold')
+
+    def _apply(self, step_num, occupancy, visited_rooms):
+        passages = self.passages_until(step_num)
+        self._update_nodes(occupancy, visited_rooms)
+        self._update_pheromones(passages)
+        self._update_movements(step_num)
+        self._update_title(step_num, passages)
+
+    @traced("StepRenderer.update", cat="render")
+    def update(self, step_num, occupancy, visited_rooms=None):
+        """Met à jour les artistes persistants pour une étape puis les redessine par blitting"""
+        if visited_rooms is None:
+            if self._visited_rooms is None:
+                self._visited_rooms = (self.solution.visited_rooms() if self.solution is not None
+                                       else self.colony.get_visited_rooms())
+            visited_rooms = self._visited_rooms
+        self._last_frame = (step_num, occupancy, visited_rooms)
+        self._apply(step_num, occupancy, visited_rooms)
+        self.blit()
+
+    def _on_draw(self, event):
+        """Après un dessin complet (création, zoom, redimensionnement) : recapturer le fond"""
+        self.background = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self.lod and self._last_frame is not None:
+            # Le zoom a pu changer : étiquettes et tailles réévaluées pour l'image courante
+            self._update_detail()
+            self._apply(*self._last_frame)
+        self._draw_dynamic()
+
+    def _draw_dynamic(self):
+        renderer = self.canvas.get_renderer() if hasattr(self.canvas, 'get_renderer') else None
+        for artist in self.dynamic_artists:
+            if artist.get_visible():
+                if renderer is not None:
+                    artist.draw(renderer)
+                else:
+                    self.figure.draw_artist(artist)
+
+    def blit(self):
+        """Restaure le fond en cache, redessine les artistes dynamiques et transfère la zone"""
+        if self.background is None:
+            # Premier affichage : le dessin complet déclenche _on_draw (capture du fond)
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.background)
+            self._draw_dynamic()
+        self.canvas.blit(self.figure.bbox)
@@ -0,0 +1,281 @@
+'''
+Politiques de routage du solveur glouton (choix de la salle suivante d'une fourmi).
+
+- "distance" : salle disponible la plus proche du dortoir (politique historique,
+  implémentée directement dans AntColony) ;
+- "congestion" : coût = distance au dortoir + attente prévue le long de la chaîne
+  de prochains sauts (CongestionRouter) ;
+- "ecmp" : table de routage précalculée des prochains sauts de même coût, répartis
+  en tourniquet pondéré par la capacité en aval (EcmpRouter) ;
+- "monotone" : uniquement des mouvements qui rapprochent strictement du dortoir,
+  attente sinon (MonotoneRouter).
+
+L'attente d'une salle est estimée par occupation / capacité (nombre d'étapes pour
+la vider) ; l'attente prévue d'une salle cumule la sienne et la plus faible de ses
+successeurs sur les plus courts chemins vers Sd. Chaque mouvement met à jour les
+deux salles concernées ; en fin d'étape, seuls les changements sont propagés vers
+l'amont (pas de recalcul complet).
+'''
+
+import heapq
+from abc import ABC, abstractmethod
+from functools import reduce
+from math import gcd
+from typing import Dict, List, Optional
+
+
+def shortest_path_dag(colony):
+    """
+    Graphe orienté des plus courts chemins vers Sd.
+
+    Returns:
+        (successeurs, prédécesseurs) : pour chaque salle, les voisines un saut plus près
+        de Sd (prochains sauts de même coût) et celles dont elle est un prochain saut
+    """
+    distance = colony.distance_to_sd
+    downstream: Dict[str, List[str]] = {}
+    upstream: Dict[str, List[str]] = {room: [] for room in colony.adjacency}
+    for room, neighbors in colony.adjacency.items():
+        d = distance.get(room)
+        downstream[room] = [n for n in neighbors if d is not None and distance.get(n) == d - 1]
+        for n in downstream[room]:
+            upstream[n].append(room)
+    return downstream, upstream
+
+
+def closest_move(distance, available_moves: List[str]) -> Optional[str]:
+    """Salle disponible la plus proche du dortoir (première en cas d'égalité)"""
+    known = [move for move in available_moves if move in distance]
+    return min(known, key=distance.get) if known else None
+
+
+class Router(ABC):
+    """Politique de routage : choix de la salle suivante, informée des mouvements"""
+
+    name = None
+
+    @abstractmethod
+    def choose(self, ant, available_moves: List[str]) -> Optional[str]:
+        """Salle suivante de la fourmi parmi les salles disponibles (None : elle attend)"""
+
+    def moved(self, ant, old_room: str, new_room: str, occupancy):
+        """Mouvement effectué (occupation temporaire déjà mise à jour)"""
+
+    def end_step(self, occupancy):
+        """Fin d'une étape de simulation"""
+
+
+class CongestionRouter(Router):
+    """Routage par coût distance + attente prévue, mis à jour incrémentalement"""
+
+    name = "congestion"
+
+    def __init__(self, colony):
+        self.colony = colony
+        distance = colony.distance_to_sd
+        self.distance = distance
+        rooms = colony.antnest.rooms
+
+        # Graphe orienté des plus courts chemins : successeurs (un saut plus près de Sd)
+        # et prédécesseurs (à qui propager un changement d'attente)
+        self.downstream, self.upstream = shortest_path_dag(colony)
+
+        # Débit de sortie des salles intermédiaires : au plus la capacité cumulée de leurs
+        # successeurs par étape (Sv et Sd : illimitées, sans attente ; voisine de Sd : vidée
+        # à chaque étape)
+        self.throughput = {}
+        for room in colony.adjacency:
+            if room in rooms and room not in ("Sv", "Sd") and "Sd" not in self.downstream[room]:
+                self.throughput[room] = max(1, sum(rooms.get(n, 1) for n in self.downstream[room]))
+        self.wait = {room: 0.0 for room in colony.adjacency}
+        self.expected_wait = {room: 0.0 for room in colony.adjacency}
+        self.previous_room: Dict[int, str] = {}  # Dernière salle quittée par chaque fourmi
+        self._dirty = set()  # Salles modifiées pendant l'étape en cours
+
+        self.update(self.throughput, colony.room_occupancy)
+
+    def cost(self, room: str) -> float:
+        """Coût d'une salle : distance au dortoir + attente prévue"""
+        return self.distance[room] + self.expected_wait[room]
+
+    def _refresh(self, room, occupancy) -> bool:
+        """Recalcule l'attente d'une salle et son attente prévue ; indique un changement"""
+        throughput = self.throughput.get(room)
+        if throughput is not None:
+            self.wait[room] = len(occupancy.get(room, ())) / throughput
+        downstream = self.downstream.get(room)
+        expected = self.wait[room] + (min(self.expected_wait[n] for n in downstream)
+                                      if downstream else 0.0)
+        changed = expected != self.expected_wait[room]
+        self.expected_wait[room] = expected
+        return changed
+
+    def update(self, rooms, occupancy):
+        """Met à jour les salles données et propage leurs changements vers l'amont"""
+        # Par distance croissante : chaque salle est recalculée après ses successeurs
+        heap = [(self.distance[room], room) for room in set(rooms) if room in self.distance]
+        heapq.heapify(heap)
+        seeds = {room for _, room in heap}
+        done = set()
+        while heap:
+            _, room = heapq.heappop(heap)
+            if room in done:
+                continue
+            done.add(room)
+            if self._refresh(room, occupancy) or room in seeds:
+                for predecessor in self.upstream[room]:
+                    heapq.heappush(heap, (self.distance[predecessor], predecessor))
+
+    def moved(self, ant, old_room: str, new_room: str, occupancy):
+        """Enregistre un mouvement : salles concernées mises à jour, propagation en fin d'étape"""
+        self.previous_room[ant.id] = old_room
+        for room in (old_room, new_room):
+            if room in self.distance:
+                self._refresh(room, occupancy)
+                self._dirty.add(room)
+
+    def end_step(self, occupancy):
+        """Propage vers l'amont les changements de l'étape (une seule fois par étape)"""
+        if self._dirty:
+            self.update(self._dirty, occupancy)
+            self._dirty.clear()
+
+    def choose(self, ant, available_moves: List[str]) -> Optional[str]:
+        """
+        Salle de coût minimal parmi les salles qui ne s'éloignent pas du dortoir.
+
+        Une salle à la même distance (branche parallèle d'un saut plus longue) n'est
+        choisie que si elle est strictement moins coûteuse que la meilleure salle plus
+        proche et n'est pas celle que la fourmi vient de quitter. Sans salle qui
+        rapproche ni de détour avantageux, retour à la politique par distance.
+        """
+        current = self.distance.get(ant.current_room)
+        forward, lateral = [], []
+        for move in available_moves:
+            d = self.distance.get(move)
+            if d is None or current is None:
+                continue
+            if d < current:
+                forward.append(move)
+            elif d == current and move != self.previous_room.get(ant.id):
+                lateral.append(move)
+
+        best = min(forward, key=self.cost) if forward else None
+        if lateral:
+            detour = min(lateral, key=self.cost)
+            if best is None or self.cost(detour) < self.cost(best):
+                best = detour
+        if best is not None:
+            return best
+
+        # Aucune salle qui rapproche : plus petite distance (comme la politique historique)
+        return closest_move(self.distance, available_moves)
+
+
+def weighted_round_robin(weights: List[int]) -> List[int]:
+    """
+    Cycle du tourniquet pondéré lissé : indice i présent weights[i] fois, entrelacé.
+
+    Les poids sont réduits par leur PGCD ; exemple [2, 1] -> [0, 1, 0].
+    """
+    divisor = reduce(gcd, weights)
+    weights = [w // divisor for w in weights]
+    total = sum(weights)
+    current = [0] * len(weights)
+    cycle = []
+    for _ in range(total):
+        for i, w in enumerate(weights):
+            current[i] += w
+        chosen = max(range(len(weights)), key=current.__getitem__)
+        current[chosen] -= total
+        cycle.append(chosen)
+    return cycle
+
+
+class EcmpRouter(Router):
+    """
+    Table de routage à prochains sauts multiples de même coût (ECMP).
+
+    Pour chaque salle, les voisines un saut plus près de Sd sont servies en tourniquet
+    pondéré par leur capacité en aval (capacité du goulot de la branche vers Sd). Le
+    cycle est précalculé : une décision = une lecture et l'avance d'un pointeur.
+    """
+
+    name = "ecmp"
+    MAX_CYCLE = 64   # Longueur maximale d'un cycle (poids mis à l'échelle au-delà)
+
+    def __init__(self, colony):
+        self.distance = colony.distance_to_sd
+        rooms = colony.antnest.rooms
+        downstream, _ = shortest_path_dag(colony)
+
+        # Capacité en aval : min(capacité de la salle, somme des capacités en aval des
+        # prochains sauts), calculée par distance croissante (Sd : illimitée)
+        self.branch_capacity = {}
+        for room in sorted(self.distance, key=self.distance.get):
+            if room == "Sd":
+                self.branch_capacity[room] = float('inf')
+                continue
+            below = sum(self.branch_capacity[n] for n in downstream[room])
+            own = float('inf') if room == "Sv" else rooms.get(room, 1)
+            self.branch_capacity[room] = min(own, below)
+
+        # Table : salle -> (prochains sauts, cycle du tourniquet), et pointeur par salle
+        self.table: Dict[str, tuple] = {}
+        for room, hops in downstream.items():
+            if not hops:
+                continue
+            weights = [self.branch_capacity[n] for n in hops]
+            if any(w == float('inf') for w in weights):
+                weights = [1 if w == float('inf') else 0 for w in weights]
+            weights = [max(1, int(w)) for w in weights]
+            if sum(weights) > self.MAX_CYCLE:
+                scale = self.MAX_CYCLE / sum(weights)
+                weights = [max(1, round(w * scale)) for w in weights]
+            cycle = weighted_round_robin(weights)
+            self.table[room] = (hops, [hops[i] for i in cycle])
+        self.pointer = {room: 0 for room in self.table}
+
+    def choose(self, ant, available_moves: List[str]) -> Optional[str]:
+        """Prochain saut du tourniquet de la salle ; le suivant disponible si la salle est pleine"""
+        entry = self.table.get(ant.current_room)
+        if entry is not None:
+            hops, cycle = entry
+            start = self.pointer[ant.current_room]
+            # Au plus un tour de cycle (en pratique : la première entrée est disponible)
+            for offset in range(len(cycle)):
+                hop = cycle[(start + offset) % len(cycle)]
+                if hop in available_moves:
+                    self.pointer[ant.current_room] = (start + offset + 1) % len(cycle)
+                    return hop
+        # Aucun prochain saut disponible : plus petite distance (politique historique)
+        return closest_move(self.distance, available_moves)
+
+
+class MonotoneRouter(Router):
+    """
+    Progrès monotone : une fourmi ne se déplace que vers une salle strictement plus
+    proche du dortoir, sinon elle attend (jamais de retour vers Sv ni de pas de côté).
+    """
+
+    name = "monotone"
+
+    def __init__(self, colony):
+        self.distance = colony.distance_to_sd
+
+    def choose(self, ant, available_moves: List[str]) -> Optional[str]:
+        """Salle disponible la plus proche du dortoir si elle rapproche la fourmi, sinon None (attente)"""
+        move = closest_move(self.distance, available_moves)
+        current = self.distance.get(ant.current_room)
+        if move is None or current is None or self.distance[move] >= current:
+            return None
+        return move
+
+
+# Politiques disponibles (nom -> classe du routeur ; None = politique par distance intégrée)
+ROUTING_POLICIES = {
+    "distance": None,
+    "congestion": CongestionRouter,
+    "ecmp": EcmpRouter,
+    "monotone": MonotoneRouter,
+}
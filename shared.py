@@ -0,0 +1,234 @@
+'''
+Publication des solutions en mémoire partagée (multiprocessing.shared_memory).
+
+Une solution est copiée une fois dans un bloc de mémoire partagée ; les autres
+processus s'y attachent à partir d'un petit descripteur (nom du bloc, position et
+forme de chaque tableau), sans sérialiser des millions de tuples de mouvements.
+
+Contenu du bloc (tableaux NumPy) :
+- mouvements en colonnes : nombre par étape, début de chaque étape, fourmi,
+  salle de départ, salle d'arrivée (indices dans la table des salles) ;
+- images clés de l'occupation : salle de chaque fourmi toutes les
+  `keyframe_interval` étapes ;
+- sommes préfixes des passages (phéromones) par tunnel aux mêmes étapes.
+
+L'occupation ou les passages à une étape quelconque partent de l'image clé
+précédente et n'appliquent que les mouvements suivants (au plus
+keyframe_interval - 1 étapes).
+
+Les images clés sont denses (une ligne par fourmi) : l'intervalle est élargi avec
+fourmis x étapes pour qu'elles ne dépassent pas KEYFRAME_MEMORY_RATIO fois la taille
+des tableaux de mouvements (1M fourmis x 10k étapes : 1,25 Go toutes les 32 étapes).
+Une reconstitution rejoue alors en moyenne de l'ordre de fourmis / KEYFRAME_MEMORY_RATIO
+mouvements, autant que la copie d'une image clé.
+
+Le processus qui publie est propriétaire du bloc et le libère (unlink).
+'''
+
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from main import AntColony
+from solver_process import encode_steps, room_table
+
+
+KEYFRAME_INTERVAL = 32       # Étapes minimales entre deux images clés (occupation et passages)
+KEYFRAME_MEMORY_RATIO = 1    # Taille maximale des images clés / taille des tableaux de mouvements
+_ALIGNMENT = 8
+
+
+@dataclass(frozen=True)
+class SolutionDescriptor:
+    """Description (légère et sérialisable) d'une solution publiée en mémoire partagée"""
+    name: str
+    arrays: Tuple[Tuple[str, int, str, Tuple[int, ...]], ...]  # (clé, position, dtype, forme)
+    rooms: Tuple[str, ...]
+    edges: Tuple[Tuple[str, str], ...]
+    ants: int
+    keyframe_interval: int
+
+
+def _last_positions(positions, ants, targets):
+    """Applique des mouvements consécutifs : seule la dernière arrivée de chaque fourmi compte"""
+    if len(ants):
+        ids, last = np.unique(ants[::-1], return_index=True)
+        positions[ids - 1] = targets[::-1][last]
+
+
+def keyframe_interval_for(steps: int, row_bytes: int, move_bytes: int,
+                          minimum: int = KEYFRAME_INTERVAL) -> int:
+    """Intervalle entre images clés (au moins `minimum`) qui borne leur taille par celle des mouvements"""
+    max_rows = max(1, int(move_bytes * KEYFRAME_MEMORY_RATIO) // max(row_bytes, 1))
+    return max(minimum, -(-steps // max_rows))
+
+
+def publish_solution(colony, keyframe_interval: int = KEYFRAME_INTERVAL) -> "SharedSolution":
+    """
+    Copie la solution d'une colonie résolue dans un bloc de mémoire partagée.
+
+    Args:
+        keyframe_interval: intervalle minimal entre images clés, élargi si besoin
+            (keyframe_interval_for) ; l'intervalle retenu est dans le descripteur
+    Returns:
+        SharedSolution propriétaire du bloc (close() le libère)
+    """
+    rooms = room_table(colony.antnest)
+    room_index = {room: i for i, room in enumerate(rooms)}
+    edges = [tuple(sorted(edge)) for edge in colony.edges]
+    nb_rooms = len(rooms)
+
+    counts, ants, sources, targets = encode_steps(colony.movements_history, room_index)
+    starts = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=starts[1:])
+
+    # Tunnel de chaque mouvement (-1 si le mouvement ne suit pas un tunnel connu) :
+    # clé (plus petit indice, plus grand indice) recherchée dans les clés triées des tunnels
+    pairs = np.array([(room_index[a], room_index[b]) for a, b in edges], dtype=np.int64).reshape(-1, 2)
+    tunnel_keys = pairs.min(axis=1) * nb_rooms + pairs.max(axis=1)
+    order = np.argsort(tunnel_keys, kind='stable')
+    sorted_keys = tunnel_keys[order]
+    move_keys = (np.minimum(sources, targets).astype(np.int64) * nb_rooms
+                 + np.maximum(sources, targets))
+    found = np.minimum(np.searchsorted(sorted_keys, move_keys), max(len(sorted_keys) - 1, 0))
+    if len(sorted_keys):
+        move_edges = np.where(sorted_keys[found] == move_keys, order[found], -1).astype(np.int32)
+    else:
+        move_edges = np.full(len(move_keys), -1, dtype=np.int32)
+
+    # Images clés : occupation (salle de chaque fourmi) et passages cumulés
+    move_bytes = sum(array.nbytes for array in (counts, starts, ants, sources, targets, move_edges))
+    row_bytes = 4 * colony.antnest.ants + 8 * len(edges)
+    keyframe_interval = keyframe_interval_for(len(counts), row_bytes, move_bytes, keyframe_interval)
+    keyframe_steps = range(0, len(counts) + 1, keyframe_interval)
+    keyframe_rooms = np.empty((len(keyframe_steps), colony.antnest.ants), dtype=np.int32)
+    keyframe_passages = np.empty((len(keyframe_steps), len(edges)), dtype=np.int64)
+    positions = np.full(colony.antnest.ants, room_index["Sv"], dtype=np.int32)
+    passages = np.zeros(len(edges), dtype=np.int64)
+    previous = 0
+    for k, step in enumerate(keyframe_steps):
+        moves = slice(starts[previous], starts[step])
+        _last_positions(positions, ants[moves], targets[moves])
+        known = move_edges[moves]
+        passages += np.bincount(known[known >= 0], minlength=len(edges))
+        keyframe_rooms[k] = positions
+        keyframe_passages[k] = passages
+        previous = step
+
+    arrays = {
+        'counts': counts, 'starts': starts, 'ants': ants, 'sources': sources,
+        'targets': targets, 'move_edges': move_edges,
+        'keyframe_rooms': keyframe_rooms, 'keyframe_passages': keyframe_passages,
+    }
+
+    layout = []
+    size = 0
+    for key, array in arrays.items():
+        size = -(-size // _ALIGNMENT) * _ALIGNMENT
+        layout.append((key, size, array.dtype.str, array.shape))
+        size += array.nbytes
+
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    for key, offset, dtype, shape in layout:
+        np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)[...] = arrays[key]
+
+    descriptor = SolutionDescriptor(shm.name, tuple(layout), tuple(rooms), tuple(edges),
+                                    colony.antnest.ants, keyframe_interval)
+    return SharedSolution(shm, descriptor, owner=True)
+
+
+class SharedSolution:
+    """Solution en mémoire partagée : tableaux en lecture seule et reconstitutions à la demande"""
+
+    def __init__(self, shm, descriptor: SolutionDescriptor, owner: bool = False):
+        self.shm = shm
+        self.descriptor = descriptor
+        self.owner = owner
+        self.rooms = list(descriptor.rooms)
+        self.edges = list(descriptor.edges)
+        self.arrays = {}
+        for key, offset, dtype, shape in descriptor.arrays:
+            array = np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+            array.flags.writeable = False
+            self.arrays[key] = array
+
+    @classmethod
+    def attach(cls, descriptor: SolutionDescriptor) -> "SharedSolution":
+        """S'attache (sans copie) à une solution publiée par un autre processus"""
+        return cls(shared_memory.SharedMemory(name=descriptor.name), descriptor)
+
+    @property
+    def steps(self) -> int:
+        """Nombre d'étapes de la solution"""
+        return len(self.arrays['counts'])
+
+    def _moves(self, first_step: int, last_step: int) -> slice:
+        """Mouvements des étapes first_step + 1 à last_step"""
+        starts = self.arrays['starts']
+        return slice(int(starts[first_step]), int(starts[last_step]))
+
+    def movements(self, step_num: int) -> List[Tuple[int, str, str]]:
+        """Mouvements de l'étape donnée (1 = première étape), comme movements_history[step_num - 1]"""
+        moves = self._moves(step_num - 1, step_num)
+        rooms = self.rooms
+        return [(ant, rooms[a], rooms[b]) for ant, a, b in zip(
+            self.arrays['ants'][moves].tolist(), self.arrays['sources'][moves].tolist(),
+            self.arrays['targets'][moves].tolist())]
+
+    def history(self) -> List[List[Tuple[int, str, str]]]:
+        """Historique complet des mouvements (listes de tuples, construites localement)"""
+        return [self.movements(step) for step in range(1, self.steps + 1)]
+
+    def _keyframe(self, step_num: int) -> Tuple[int, int]:
+        step_num = max(0, min(step_num, self.steps))
+        return step_num, step_num // self.descriptor.keyframe_interval
+
+    def positions_at(self, step_num: int) -> np.ndarray:
+        """Indice de la salle de chaque fourmi (fourmi i en position i - 1) à une étape"""
+        step_num, k = self._keyframe(step_num)
+        positions = self.arrays['keyframe_rooms'][k].copy()
+        moves = self._moves(k * self.descriptor.keyframe_interval, step_num)
+        _last_positions(positions, self.arrays['ants'][moves], self.arrays['targets'][moves])
+        return positions
+
+    def occupancy_at(self, step_num: int) -> Dict[str, List[int]]:
+        """Occupation des salles à une étape (fourmis triées par identifiant)"""
+        positions = self.positions_at(step_num)
+        order = np.argsort(positions, kind='stable')
+        bounds = np.searchsorted(positions[order], np.arange(len(self.rooms) + 1))
+        ant_ids = (order + 1).tolist()
+        return {room: ant_ids[bounds[i]:bounds[i + 1]] for i, room in enumerate(self.rooms)}
+
+    def passages_until(self, step_num: int) -> np.ndarray:
+        """Passages cumulés par tunnel (ordre de self.edges) jusqu'à l'étape donnée"""
+        step_num, k = self._keyframe(step_num)
+        passages = self.arrays['keyframe_passages'][k].copy()
+        moves = self.arrays['move_edges'][self._moves(k * self.descriptor.keyframe_interval, step_num)]
+        passages += np.bincount(moves[moves >= 0], minlength=len(self.edges))
+        return passages
+
+    def visited_rooms(self) -> set:
+        """Salles visitées pendant la simulation (Sv compris)"""
+        indices = np.union1d(self.arrays['sources'], self.arrays['targets'])
+        return {"Sv"} | {self.rooms[i] for i in indices.tolist()}
+
+    def to_colony(self, antnest) -> AntColony:
+        """Colonie reconstituée (historique rejoué) pour les usages qui en ont besoin"""
+        return AntColony(antnest).load_history(self.history())
+
+    def close(self):
+        """Détache le bloc de ce processus (les tableaux ne sont plus utilisables)"""
+        if self.shm is not None:
+            self.arrays.clear()
+            self.shm.close()
+            if self.owner:
+                self.shm.unlink()
+            self.shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
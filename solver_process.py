@@ -0,0 +1,214 @@
+'''
+Résolution dans un processus séparé, la solution étant publiée en mémoire partagée.
+
+Le processus de résolution ne partage pas le GIL avec la boucle Tk : l'interface
+reste fluide pendant une longue résolution. Pendant la résolution, seul le nombre
+d'étapes calculées remonte par le tube (progression). La solution terminée est
+publiée dans un bloc de mémoire partagée (shared.py) : seul son descripteur passe
+par le tube, le processus principal s'y attache sans désérialiser l'historique et
+devient propriétaire du bloc (il le libère), y compris lorsque la résolution est
+annulée après l'envoi de la solution. L'annulation termine réellement le processus,
+lancé par « spawn » (jamais de fork depuis l'interface Tk et ses threads).
+
+Messages du processus : ("progress", étapes), puis ("done", (descripteur, durée,
+diagnostic)) ou ("error", message). Le diagnostic (get_solve_diagnostic()) indique
+pourquoi une résolution incomplète s'est arrêtée.
+'''
+
+import multiprocessing
+import time
+
+import numpy as np
+
+from main import AntColony, solve_antnest
+
+
+CHUNK_STEPS = 64        # Nombre maximal d'étapes par bloc
+CHUNK_SECONDS = 0.05    # Délai maximal avant l'envoi d'un bloc incomplet
+
+
+def room_table(antnest):
+    """Liste ordonnée des salles (indices des blocs), identique des deux côtés du tube"""
+    rooms = ["Sv", "Sd", *antnest.rooms]
+    rooms.extend(room for tube in antnest.tubes for room in tube)
+    return list(dict.fromkeys(rooms))
+
+
+def encode_steps(steps, room_index):
+    """Bloc colonnaire (mouvements par étape, fourmis, départs, arrivées) de plusieurs étapes"""
+    counts = np.fromiter((len(movements) for movements in steps), dtype=np.int32, count=len(steps))
+    total = int(counts.sum())
+    ants = np.empty(total, dtype=np.int32)
+    sources = np.empty(total, dtype=np.int32)
+    targets = np.empty(total, dtype=np.int32)
+    i = 0
+    for movements in steps:
+        for ant_id, old_room, new_room in movements:
+            ants[i] = ant_id
+            sources[i] = room_index[old_room]
+            targets[i] = room_index[new_room]
+            i += 1
+    return counts, ants, sources, targets
+
+
+def decode_steps(chunk, rooms):
+    """Liste des mouvements de chaque étape d'un bloc"""
+    counts, ants, sources, targets = chunk
+    movements = list(zip(ants.tolist(), [rooms[i] for i in sources.tolist()],
+                         [rooms[i] for i in targets.tolist()]))
+    steps = []
+    start = 0
+    for count in counts.tolist():
+        steps.append(movements[start:start + count])
+        start += count
+    return steps
+
+
+def _solve_worker(conn, antnest, strategy, chunk_steps):
+    """Résout la fourmilière, signale la progression puis publie la solution (processus fils)"""
+    from shared import publish_solution
+
+    start = time.perf_counter()
+    try:
+        if strategy == "hybrid":
+            # Stratégie pas à pas : la progression est signalée pendant la résolution
+            colony = AntColony(antnest)
+            steps = colony.iter_solve()
+        else:
+            colony = solve_antnest(antnest, strategy)
+            steps = iter(colony.movements_history)
+
+        sent = 0
+        last_send = time.perf_counter()
+        for produced, _ in enumerate(steps, 1):
+            now = time.perf_counter()
+            if produced - sent >= chunk_steps or now - last_send >= CHUNK_SECONDS:
+                conn.send(("progress", produced))
+                sent = produced
+                last_send = now
+        if len(colony.movements_history) > sent:
+            conn.send(("progress", len(colony.movements_history)))
+
+        # Le bloc survit à ce processus : le processus principal le libère après lecture
+        solution = publish_solution(colony)
+        solution.owner = False
+        conn.send(("done", (solution.descriptor, time.perf_counter() - start,
+                            colony.get_solve_diagnostic())))
+        solution.close()
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class SolveProcess:
+    """
+    Résolution d'une fourmilière dans un processus fils annulable.
+
+    Utilisation : SolveProcess(antnest).start(), puis wait() (bloquant, depuis un
+    thread de travail) qui retourne la colonie reconstituée ; cancel() termine le
+    processus depuis n'importe quel thread.
+    """
+
+    def __init__(self, antnest, strategy: str = "hybrid", chunk_steps: int = CHUNK_STEPS):
+        self.antnest = antnest
+        self.strategy = strategy
+        self.chunk_steps = chunk_steps
+        self.rooms = room_table(antnest)
+        self.steps = 0            # Étapes calculées (progression)
+        self.elapsed = None       # Durée de résolution mesurée dans le processus fils
+        self.diagnostic = None    # Raison de l'arrêt de la résolution (get_solve_diagnostic)
+        self.cancelled = False
+        self.process = None
+        self._conn = None
+
+    def start(self):
+        """Lance le processus de résolution (non bloquant)"""
+        # « spawn » : un fork depuis l'interface copierait l'état de Tk et des threads
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        self.process = context.Process(
+            target=_solve_worker, args=(sender, self.antnest, self.strategy, self.chunk_steps),
+            name="resolution", daemon=True)
+        self.process.start()
+        sender.close()  # Seul le processus fils écrit : EOF dès qu'il se termine
+        self._conn = receiver
+        return self
+
+    def cancel(self):
+        """Annule la résolution : le processus fils est terminé immédiatement"""
+        self.cancelled = True
+        if self.process is not None and self.process.is_alive():
+            self.process.terminate()
+
+    def wait(self, on_steps=None, poll_interval: float = 0.1):
+        """
+        Suit la progression jusqu'à la fin de la résolution.
+
+        Args:
+            on_steps: fonction appelée avec le nombre d'étapes calculées à chaque progression
+            poll_interval: attente maximale entre deux vérifications de l'annulation
+        Returns:
+            La colonie reconstituée depuis la mémoire partagée, ou None si la résolution
+            a été annulée. La reconstitution matérialise tout l'historique : l'interface
+            en a besoin (animation, statistiques, chemins, exports passent par AntColony) ;
+            les exports hors processus lisent directement la SharedSolution
+        Raises:
+            RuntimeError: erreur dans le processus de résolution
+        """
+        from shared import SharedSolution
+
+        try:
+            while not self.cancelled:
+                if not self._conn.poll(poll_interval):
+                    continue
+                kind, payload = self._conn.recv()
+                if kind == "progress":
+                    self.steps = payload
+                    if on_steps is not None:
+                        on_steps(payload)
+                elif kind == "done":
+                    descriptor, self.elapsed, self.diagnostic = payload
+                    # Propriétaire du bloc publié par le processus fils : libéré après lecture
+                    with SharedSolution.attach(descriptor) as solution:
+                        solution.owner = True
+                        return solution.to_colony(self.antnest)
+                else:
+                    raise RuntimeError(payload)
+        except (EOFError, OSError):
+            # Processus terminé (annulation) sans message de fin
+            if not self.cancelled:
+                raise RuntimeError("Processus de résolution interrompu")
+        finally:
+            if self.cancelled:
+                self._discard_solution()
+            self.close()
+        return None
+
+    def _discard_solution(self):
+        """Annulation : libère une solution déjà publiée mais pas encore lue (sinon le bloc fuit)"""
+        from shared import SharedSolution
+
+        # Le processus fils n'est plus propriétaire du bloc dès l'envoi de "done" :
+        # on attend sa fin (il a été terminé) puis on lit les messages restants
+        if self.process is not None:
+            self.process.join()
+        try:
+            while self._conn is not None and self._conn.poll():
+                kind, payload = self._conn.recv()
+                if kind == "done":
+                    solution = SharedSolution.attach(payload[0])
+                    solution.owner = True
+                    solution.close()
+        except (EOFError, OSError):
+            pass
+
+    def close(self):
+        """Libère le tube et attend la fin du processus fils"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self.process is not None:
+            if self.cancelled and self.process.is_alive():
+                self.process.terminate()
+            self.process.join()
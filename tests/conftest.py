@@ -0,0 +1,16 @@
+"""
+Configuration commune des tests
+"""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def layout_cache_in_tmp(tmp_path, monkeypatch):
+    """Cache disque des dispositions dans un dossier temporaire (jamais dans ~/.cache)"""
+    directory = str(tmp_path / "layouts")
+    # Processus fils (pools de rendu) : le cache par défaut est relu dans l'environnement
+    monkeypatch.setenv("FOURMI_LAYOUT_CACHE", directory)
+    import layout
+    monkeypatch.setattr(layout.default_cache, "directory", directory)
+    return directory
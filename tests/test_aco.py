@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test de l'optimisation par colonies de fourmis (ACO)
+"""
+
+import glob
+
+from main import AntNest, load_antnest_from_txt, solve_antnest, validate_solution
+from benchmark import generate_antnest
+from aco import AcoSolver
+
+
+def test_aco_solutions_are_valid_on_bundled_nests():
+    """Solutions valides, jamais plus longues que le glouton hybride sur les exemples"""
+    for filepath in sorted(glob.glob("fourmilieres/*.txt")):
+        antnest = load_antnest_from_txt(filepath)
+        colony = solve_antnest(antnest, "aco")
+        assert validate_solution(antnest, colony.movements_history) == [], filepath
+        assert colony.all_ants_arrived(), filepath
+        assert len(colony.movements_history) <= len(solve_antnest(antnest).movements_history)
+
+
+def test_pheromones_reinforce_the_short_branch():
+    """Après quelques lots, la branche courte porte plus de phéromones que la longue"""
+    antnest = AntNest("test", 10, {"A": 1, "B": 1, "C": 1, "D": 1},
+                      [("Sv", "A"), ("A", "Sd"), ("Sv", "B"), ("B", "C"), ("C", "D"), ("D", "Sd")])
+    solver = AcoSolver(antnest, batch=16, seed=1)
+    history = solver.run(iterations=5)
+    assert validate_solution(antnest, history) == []
+    assert solver.rollouts == 5 * 16
+    pheromones = solver.pheromones()
+    assert pheromones[("A", "Sv")] > pheromones[("B", "Sv")]
+
+
+def test_aco_improves_on_generated_nest():
+    """Le meilleur des lots est valide et au moins aussi bon que le glouton"""
+    antnest = generate_antnest(30, 200)
+    solver = AcoSolver(antnest, batch=16)
+    history = solver.run(iterations=3)
+    assert validate_solution(antnest, history) == []
+    assert solver.best_steps == len(history)
+    assert len(history) <= len(solve_antnest(antnest).movements_history)
+
+
+def test_unreachable_nest_returns_empty_history():
+    """Dortoir inaccessible : aucune solution, pas d'erreur"""
+    antnest = AntNest("test", 3, {"A": 1}, [("Sv", "A")])
+    assert AcoSolver(antnest).run() == []
+
+
+def test_rollout_step_cap_reports_failure():
+    """Une simulation qui dépasse le plafond d'étapes échoue sans boucler"""
+    antnest = AntNest("test", 10, {"A": 1, "B": 1}, [("Sv", "A"), ("A", "B"), ("B", "Sd")])
+    solver = AcoSolver(antnest, batch=4)
+    assert solver.max_steps > 0
+    solver.max_steps = 5   # Il en faut 12
+    steps, _ = solver.rollout()
+    assert steps.tolist() == [-1] * 4
+    assert solver.failures == 4
+    assert solver.run(iterations=2) == []
+    assert solver.best_steps is None
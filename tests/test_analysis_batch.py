@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test de l'analyse en lot dans un pool de processus (sans fenêtre Tk)
+"""
+
+import os
+
+from main import load_antnest_from_txt
+from gui import AnalysisBatch, analyze_nest_file
+
+
+NESTS = sorted(os.path.join("fourmilieres", f) for f in os.listdir("fourmilieres") if f.endswith(".txt"))
+
+
+def test_analyze_nest_file_row():
+    """Une ligne complète du tableau d'analyse par fourmilière"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt")
+    row = analyze_nest_file("fourmilieres/fourmiliere_cinq.txt")
+    assert row[:5] == ("fourmiliere_cinq", 50, len(antnest.rooms), len(antnest.tubes), 11)
+    assert float(row[5]) >= 0
+
+
+def test_analyze_nest_file_timeout():
+    """Un délai dépassé produit une ligne explicite au lieu de bloquer"""
+    row = analyze_nest_file("fourmilieres/fourmiliere_cinq.txt", timeout=1e-6)
+    assert row[0] == "fourmiliere_cinq.txt"
+    assert row[4] == "Délai dépassé"
+
+
+def test_batch_posts_every_row_and_progress():
+    """Chaque fourmilière publie sa ligne et la progression, puis la fin du lot"""
+    messages = []
+    AnalysisBatch(NESTS, messages.append, jobs=2).run()
+
+    rows = [data for kind, data in messages if kind == "analysis_row"]
+    progress = [data for kind, data in messages if kind == "analysis_progress"]
+    assert sorted(index for index, _ in rows) == list(range(len(NESTS)))
+    assert progress[-1] == (len(NESTS), len(NESTS))
+    assert messages[-1] == ("analysis_done", (len(NESTS), len(NESTS), False))
+
+
+def test_batch_cancel():
+    """Un lot annulé avant de commencer se termine immédiatement"""
+    messages = []
+    batch = AnalysisBatch(NESTS, messages.append, jobs=1)
+    batch.cancel()
+    batch.run()
+    assert messages[-1][0] == "analysis_done"
+    assert messages[-1][1][2] is True
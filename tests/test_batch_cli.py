@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test de la commande sans affichage : python -m uneviedefourmi solve DIR
+"""
+
+import json
+import subprocess
+import sys
+import tracemalloc
+
+import uneviedefourmi
+
+
+def test_solve_directory_streams_records(tmp_path):
+    """Un enregistrement JSON par fourmilière, sans importer matplotlib ni tkinter"""
+    out = tmp_path / "results.jsonl"
+    code = (
+        "import sys, uneviedefourmi\n"
+        f"rc = uneviedefourmi.main(['solve', 'fourmilieres', '--jobs', '2', '--out', {str(out)!r}])\n"
+        "assert 'matplotlib' not in sys.modules, 'matplotlib importé'\n"
+        "assert 'tkinter' not in sys.modules, 'tkinter importé'\n"
+        "sys.exit(rc)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    
+    records = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    by_name = {record['nest']: record for record in records}
+    
+    assert len(records) == 6
+    assert by_name['fourmiliere_un']['steps'] == 7
+    for record in records:
+        assert record['solved']
+        assert record['lower_bound'] <= record['steps']
+        assert record['peak_memory_kb'] > 0
+
+
+def test_solve_time_measured_without_tracemalloc(monkeypatch):
+    """Résolution chronométrée sans tracemalloc, pic mémoire mesuré sur une seconde résolution"""
+    tracing = []
+    solve = uneviedefourmi.solve_antnest
+
+    def spy(antnest, strategy):
+        tracing.append(tracemalloc.is_tracing())
+        return solve(antnest, strategy)
+
+    monkeypatch.setattr(uneviedefourmi, "solve_antnest", spy)
+    record = uneviedefourmi.solve_nest_file("fourmilieres/fourmiliere_cinq.txt")
+
+    assert tracing == [False, True]
+    assert record['peak_memory_kb'] > 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_module_entry_point():
+    """La commande python -m uneviedefourmi écrit sur la sortie standard"""
+    result = subprocess.run(
+        [sys.executable, "-m", "uneviedefourmi", "solve", "fourmilieres/fourmiliere_zero.txt",
+         "--jobs", "1", "--no-memory"],
+        capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    
+    record = json.loads(result.stdout.splitlines()[0])
+    assert record['nest'] == "fourmiliere_zero"
+    assert record['steps'] == 2
+
+
+if __name__ == "__main__":
+    import pathlib, tempfile
+    test_solve_directory_streams_records(pathlib.Path(tempfile.mkdtemp()))
+    test_module_entry_point()
+    print("✅ Tests terminés!")
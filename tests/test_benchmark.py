@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test du banc d'essai : générateur de fourmilières et détection des régressions
+"""
+
+import copy
+from benchmark import generate_antnest, run_benchmark, compare_reports
+from main import solve_antnest, lower_bound_steps
+
+
+def test_generated_nests_are_solvable():
+    """Les fourmilières générées sont connexes, reproductibles et résolues"""
+    for num_rooms in (10, 100, 1000):
+        antnest = generate_antnest(num_rooms, 20, seed=1)
+        assert len(antnest.rooms) == num_rooms
+        assert antnest.tubes == generate_antnest(num_rooms, 20, seed=1).tubes
+        
+        colony = solve_antnest(antnest)
+        assert colony.all_ants_arrived()
+        assert len(colony.movements_history) >= lower_bound_steps(antnest)
+
+
+def test_compare_detects_regressions():
+    """compare signale les régressions de temps et d'étapes au-delà du seuil"""
+    report = run_benchmark([generate_antnest(10, 10)], ["hybrid"], warmup=0, repeats=1, verbose=False)
+    assert compare_reports(report, report) == []
+    
+    slower = copy.deepcopy(report)
+    slower['results'][0]['time_median_s'] = report['results'][0]['time_median_s'] * 2 + 0.01
+    slower['results'][0]['steps'] += 1
+    metrics = {r['metric'] for r in compare_reports(report, slower, time_threshold=0.5)}
+    assert metrics == {'time_median_s', 'steps'}
+    
+    # Une amélioration n'est pas une régression
+    assert compare_reports(slower, report) == []
+
+    # Un cas résolu qui ne l'est plus est signalé, même plus rapide et plus court
+    broken = copy.deepcopy(report)
+    broken['results'][0].update(solved=False, steps=1, time_median_s=0.0)
+    assert [r['metric'] for r in compare_reports(report, broken)] == ['solved']
+
+    # Un cas présent d'un seul côté est signalé dans les deux sens
+    dropped = copy.deepcopy(report)
+    dropped['results'] = []
+    assert [r['metric'] for r in compare_reports(report, dropped)] == ['missing']
+    assert [r['metric'] for r in compare_reports(dropped, report)] == ['missing']
+
+
+if __name__ == "__main__":
+    test_generated_nests_are_solvable()
+    test_compare_detects_regressions()
+    print("✅ Tests terminés!")
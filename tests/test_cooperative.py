@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Test de la planification coopérative (table de réservations espace-temps)
+"""
+
+import glob
+import time
+
+from main import AntColony, AntNest, load_antnest_from_txt, solve_antnest, validate_solution
+from benchmark import generate_antnest
+from cooperative import ReservationPlanner, flow_routes
+
+
+def test_reservation_plans_are_valid_on_bundled_nests():
+    """Plans sans conflit, jamais plus longs que le glouton hybride"""
+    for filepath in sorted(glob.glob("fourmilieres/*.txt")):
+        antnest = load_antnest_from_txt(filepath)
+        colony = solve_antnest(antnest, "reservation")
+        assert validate_solution(antnest, colony.movements_history) == [], filepath
+        assert colony.all_ants_arrived(), filepath
+        assert len(colony.movements_history) <= len(solve_antnest(antnest).movements_history)
+        # Passages (phéromones) identiques à un rejeu de l'historique
+        replayed = AntColony(antnest).load_history(colony.movements_history)
+        assert colony.edge_passages == replayed.edge_passages
+        assert replayed.planning_time is None and colony.planning_time >= 0
+
+
+def test_validator_reports_violations():
+    """Capacité dépassée, tunnel inexistant, double mouvement, fourmis restantes"""
+    antnest = AntNest("test", 3, {"S1": 1, "S2": 1}, [("Sv", "S1"), ("S1", "S2"), ("S2", "Sd")])
+    history = [
+        [(1, "Sv", "S1"), (2, "Sv", "S1")],
+        [(1, "S1", "Sd")],
+        [(2, "S1", "S2"), (2, "S2", "Sd")],
+    ]
+    errors = validate_solution(antnest, history)
+    assert any("capacité" in error for error in errors)
+    assert any("tunnel S1 - Sd" in error for error in errors)
+    assert any("plusieurs fois" in error for error in errors)
+    assert errors[-1].startswith("1 fourmi")
+
+
+def test_flow_routes_use_parallel_branches():
+    """Les gabarits initiaux couvrent le flot maximal, pas seulement le plus court chemin"""
+    antnest = AntNest("test", 10, {"A": 1, "B": 1, "C": 1},
+                      [("Sv", "A"), ("A", "Sd"), ("Sv", "B"), ("B", "C"), ("C", "Sd")])
+    planner = ReservationPlanner(AntColony(antnest))
+    routes = [[planner.names[i] for i in route] for route in planner.templates]
+    assert sorted(routes) == [["Sv", "A", "Sd"], ["Sv", "B", "C", "Sd"]]
+    assert flow_routes(planner.neighbors, planner.table.capacities, 0, planner.sd, 1) == \
+        planner.templates[:1]
+    colony = solve_antnest(antnest, "reservation")
+    assert len(colony.movements_history) == 7  # 2T - 3 >= 10 fourmis
+
+
+def test_many_ants_plan_quickly():
+    """100 000 fourmis planifiées en quelques secondes, sans conflit"""
+    antnest = generate_antnest(100, 100_000)
+    start = time.perf_counter()
+    colony = solve_antnest(antnest, "reservation")
+    assert time.perf_counter() - start < 30
+    assert colony.all_ants_arrived()
+    assert validate_solution(antnest, colony.movements_history) == []
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Test de l'export hors écran des animations (backend Agg, pool de processus)
+"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from main import load_antnest_from_txt, solve_antnest
+from export import export_animation, frame_ranges, open_writer
+
+
+def _frames(path):
+    image = Image.open(path)
+    frames = []
+    for i in range(image.n_frames):
+        image.seek(i)
+        frames.append(np.asarray(image.convert("RGB")))
+    return frames
+
+
+def test_frame_ranges_cover_all_steps():
+    """Les plages sont contiguës et couvrent toutes les images"""
+    for nb_frames, chunks in [(1, 4), (12, 4), (12, 5), (100, 7)]:
+        ranges = frame_ranges(nb_frames, chunks)
+        assert ranges[0][0] == 0 and ranges[-1][1] == nb_frames
+        assert all(a[1] == b[0] for a, b in zip(ranges, ranges[1:]))
+        assert len(ranges) <= chunks
+
+
+def test_parallel_export_matches_sequential(tmp_path):
+    """Les processus se positionnent sur leur étape : même GIF qu'en séquentiel"""
+    colony = solve_antnest(load_antnest_from_txt("fourmilieres/fourmiliere_trois.txt"))
+
+    sequential = tmp_path / "seq.gif"
+    parallel = tmp_path / "par.gif"
+    count = export_animation(colony, str(sequential), jobs=1, dpi=30, backend="pillow", verbose=False)
+    export_animation(colony, str(parallel), jobs=2, dpi=30, backend="pillow", verbose=False)
+
+    assert count == len(colony.movements_history) + 1
+    frames_seq, frames_par = _frames(sequential), _frames(parallel)
+    assert len(frames_seq) == len(frames_par) == count
+    assert all((a == b).all() for a, b in zip(frames_seq, frames_par))
+
+
+def test_pillow_writer_only_writes_gif(tmp_path):
+    """Sans ffmpeg, l'export MP4 est refusé explicitement"""
+    with pytest.raises(ValueError):
+        open_writer(str(tmp_path / "video.mp4"), (10, 10), 2, backend="pillow")
+
+
+def test_ffmpeg_stderr_does_not_block(tmp_path, monkeypatch):
+    """Un ffmpeg très bavard sur sa sortie d'erreur ne bloque pas l'écriture des images"""
+    fake = tmp_path / "ffmpeg"
+    fake.write_text("#!/bin/sh\nhead -c 300000 /dev/zero | tr '\\0' x >&2\n"
+                    "cat > /dev/null\necho fin >&2\nexit 3\n")
+    fake.chmod(0o755)
+    monkeypatch.setattr("shutil.which", lambda name: str(fake))
+
+    writer = open_writer(str(tmp_path / "video.mp4"), (100, 100), 2, backend="ffmpeg")
+    for _ in range(20):
+        writer.write(bytes(100 * 100 * 3))
+    with pytest.raises(RuntimeError, match="fin"):
+        writer.close()
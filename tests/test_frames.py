@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Test de l'ordonnanceur d'images (la plus récente gagne, instantanés immuables)
+"""
+
+import pytest
+
+from main import load_antnest_from_txt, solve_antnest
+from frames import FrameScheduler
+
+
+def test_newest_frame_wins():
+    """Les images non rendues sont remplacées par la plus récente et comptées comme abandonnées"""
+    colony = solve_antnest(load_antnest_from_txt("fourmilieres/fourmiliere_un.txt"))
+    scheduler = FrameScheduler(target_fps=10)
+
+    for step in range(4):
+        scheduler.publish(step, colony._get_occupancy_at_step(step), colony, {})
+    snapshot = scheduler.take()
+
+    assert snapshot.step_num == 3
+    assert scheduler.take() is None
+    assert (scheduler.published, scheduler.dropped) == (4, 3)
+
+
+def test_snapshots_are_immutable_copies():
+    """L'occupation publiée ne suit plus les modifications du producteur"""
+    colony = solve_antnest(load_antnest_from_txt("fourmilieres/fourmiliere_un.txt"))
+    occupancy = colony._get_occupancy_at_step(0)
+    scheduler = FrameScheduler()
+
+    snapshot = scheduler.publish(0, occupancy, colony, {})
+    occupancy["Sv"].pop()
+    occupancy["Sd"].append(99)
+
+    assert len(snapshot.occupancy["Sv"]) == colony.antnest.ants
+    assert snapshot.occupancy["Sd"] == ()
+    with pytest.raises(TypeError):
+        snapshot.occupancy["Sd"] = (1,)
+
+
+def test_effective_fps():
+    """Le débit effectif est calculé à partir des rendus"""
+    scheduler = FrameScheduler(target_fps=5)
+    assert scheduler.effective_fps() == 0.0
+    for _ in range(3):
+        scheduler.frame_rendered()
+    stats = scheduler.stats()
+    assert stats['rendered'] == 3
+    assert stats['effective_fps'] > 0
+    assert stats['target_fps'] == 5
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test du mode à horizon fixé (flot maximal dans le temps)
+"""
+
+import glob
+import json
+import subprocess
+import sys
+
+from main import AntColony, AntNest, load_antnest_from_txt, solve_antnest, validate_solution
+from benchmark import generate_antnest
+from horizon import max_ants_within
+
+
+def test_all_ants_delivered_at_best_known_makespan():
+    """À l'horizon de la meilleure solution connue, toutes les fourmis arrivent"""
+    for filepath in sorted(glob.glob("fourmilieres/*.txt")):
+        antnest = load_antnest_from_txt(filepath)
+        steps = len(solve_antnest(antnest, "reservation").movements_history)
+        result = max_ants_within(antnest, steps)
+        assert result.delivered == antnest.ants, filepath
+        assert result.arrivals[-1] == antnest.ants
+        assert validate_solution(antnest, result.movements_history) == [], filepath
+
+
+def test_earliest_arrival_counts_match_independent_horizons():
+    """arrivals[t] égale le flot maximal calculé pour l'horizon t seul"""
+    antnest = generate_antnest(30, 300, seed=2)
+    result = max_ants_within(antnest, 30)
+    assert len(result.arrivals) == 31
+    assert result.arrivals == sorted(result.arrivals)
+    for t in (0, 5, 12, 20, 30):
+        assert max_ants_within(antnest, t).delivered == result.arrivals[t]
+
+
+def test_partial_schedule_respects_capacities():
+    """Horizon trop court : ordonnancement valide, fourmis non livrées restées dans Sv"""
+    antnest = AntNest("test", 10, {"A": 1, "B": 2, "C": 1},
+                      [("Sv", "A"), ("A", "Sd"), ("Sv", "B"), ("B", "C"), ("C", "Sd")])
+    result = max_ants_within(antnest, 4)
+    # Branche A : arrivées aux étapes 2 à 4 ; branche B-C : arrivées aux étapes 3 et 4
+    assert result.arrivals == [0, 0, 1, 3, 5]
+    assert result.delivered == 5
+    errors = validate_solution(antnest, result.movements_history)
+    assert errors == ["5 fourmi(s) hors du dortoir à la fin"]
+    colony = result.colony(antnest)
+    assert len(colony.room_occupancy["Sd"]) == 5
+
+
+def test_unreachable_and_too_short_horizons():
+    """Dortoir inaccessible ou plus loin que l'horizon : aucune fourmi"""
+    unreachable = AntNest("test", 3, {"A": 1}, [("Sv", "A")])
+    assert max_ants_within(unreachable, 5).arrivals == [0] * 6
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt")
+    distance = AntColony(antnest).distance_to_sd["Sv"]
+    assert max_ants_within(antnest, distance - 1).delivered == 0
+    assert max_ants_within(antnest, distance).delivered > 0
+
+
+def test_horizon_command():
+    """python -m uneviedefourmi horizon écrit un enregistrement JSON"""
+    result = subprocess.run(
+        [sys.executable, "-m", "uneviedefourmi", "horizon", "fourmilieres/fourmiliere_quatre.txt", "7"],
+        capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    record = json.loads(result.stdout)
+    assert record['arrivals'] == [0, 0, 0, 0, 0, 2, 4, 6]
+    assert record['delivered'] == 6
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test de régression du temps d'import du cœur (parsing + résolution)
+"""
+
+import subprocess
+import sys
+
+# Budget d'import du cœur (secondes) : bibliothèque standard uniquement
+IMPORT_BUDGET = 0.25
+
+HEAVY_MODULES = ("networkx", "matplotlib", "tkinter")
+
+
+def measure_import(module):
+    """Importe un module dans un interpréteur neuf et retourne (durée, modules lourds chargés)"""
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(elapsed, ','.join(heavy))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    elapsed, _, heavy = result.stdout.strip().partition(" ")
+    return float(elapsed), [m for m in heavy.split(",") if m]
+
+
+def test_core_import_is_light():
+    """Importer main ne charge ni networkx ni matplotlib et reste sous le budget"""
+    # Meilleur de 3 mesures pour absorber le bruit de la machine
+    timings = []
+    for _ in range(3):
+        elapsed, heavy = measure_import("main")
+        assert heavy == [], f"Modules lourds importés par main : {heavy}"
+        timings.append(elapsed)
+    
+    assert min(timings) < IMPORT_BUDGET, f"Import de main trop lent : {min(timings):.3f}s"
+
+
+def test_solve_without_heavy_modules():
+    """Résoudre une fourmilière ne charge pas les dépendances d'affichage"""
+    code = (
+        "import sys\n"
+        "from main import load_antnest_from_txt, solve_antnest\n"
+        "colony = solve_antnest(load_antnest_from_txt('fourmilieres/fourmiliere_cinq.txt'))\n"
+        "assert len(colony.movements_history) == 11\n"
+        f"print([m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+if __name__ == "__main__":
+    test_core_import_is_light()
+    test_solve_without_heavy_modules()
+    print("✅ Tests terminés!")
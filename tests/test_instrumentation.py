@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Test de l'instrumentation par phase de simulate_step
+"""
+
+from main import AntColony, load_antnest_from_txt
+
+
+def test_instrumentation_is_transparent():
+    """L'instrumentation ne change pas la solution et collecte une entrée par étape"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt")
+    
+    plain = AntColony(antnest)
+    plain.solve()
+    assert plain.profiler is None
+    
+    colony = AntColony(antnest, instrument=True)
+    colony.solve()
+    assert colony.movements_history == plain.movements_history
+    
+    summary = colony.profiler.summary()
+    totals = summary['totals']
+    assert summary['steps'] == len(colony.movements_history)
+    assert totals['moves'] == sum(len(m) for m in colony.movements_history)
+    assert totals['ants_examined'] >= antnest.ants
+    assert totals['path_lookups'] > 0
+    assert totals['phase1_s'] > 0
+    assert abs(sum(summary['shares'][t] for t in ('copy_s', 'phase1_s', 'phase2_s')) - 1) < 1e-9
+    
+    colony.profiler.print_summary()
+
+
+if __name__ == "__main__":
+    test_instrumentation_is_transparent()
+    print("✅ Tests terminés!")
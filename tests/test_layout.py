@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test de la disposition en couches et du cache de dispositions
+"""
+
+import time
+
+from main import AntNest, AntColony, load_antnest_from_txt
+from benchmark import generate_antnest
+from layout import LayoutCache, get_layout, layered_layout, nest_hash
+
+
+def test_layered_layout_reads_left_to_right():
+    """Sv à gauche, Sd à droite, colonnes ordonnées par distance au dortoir"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt")
+    colony = AntColony(antnest)
+    pos = layered_layout(antnest)
+
+    assert set(pos) == set(colony.adjacency)
+    xs = {node: x for node, (x, _) in pos.items()}
+    assert xs["Sv"] == min(xs.values()) and xs["Sd"] == max(xs.values())
+    rooms = [node for node in pos if node != "Sv"]
+    for a in rooms:
+        for b in rooms:
+            if colony.distance_to_sd[a] < colony.distance_to_sd[b]:
+                assert xs[a] > xs[b]
+
+
+def test_layered_layout_scales_to_large_nests():
+    """10k salles disposées en bien moins d'une seconde"""
+    antnest = generate_antnest(10000, 10)
+    start = time.perf_counter()
+    pos = layered_layout(antnest)
+    assert time.perf_counter() - start < 1.0
+    assert len(pos) == 10002
+
+
+def test_cache_memory_and_disk(tmp_path):
+    """Une disposition calculée est relue depuis la mémoire puis depuis le disque"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_quatre.txt")
+    cache = LayoutCache(str(tmp_path))
+
+    pos = get_layout(antnest, "spring", cache=cache, seed=42, k=2)
+    pos["Sv"] = (99, 99)  # La copie retournée peut être modifiée sans altérer le cache
+    assert get_layout(antnest, "spring", cache=cache, seed=42, k=2)["Sv"] != (99, 99)
+    assert len(list(tmp_path.iterdir())) == 1
+
+    fresh = LayoutCache(str(tmp_path))
+    assert fresh.get(f'spring:{{"k": 2, "seed": 42}}:{nest_hash(antnest)}') is not None
+
+
+def test_nest_hash_ignores_ants_and_tube_order():
+    """L'empreinte ne dépend que de la topologie"""
+    a = AntNest("a", 5, {"S1": 1}, [("Sv", "S1"), ("S1", "Sd")])
+    b = AntNest("b", 50, {"S1": 3}, [("Sd", "S1"), ("S1", "Sv")])
+    c = AntNest("c", 5, {"S1": 1}, [("Sv", "S1"), ("Sv", "Sd")])
+    assert nest_hash(a) == nest_hash(b) != nest_hash(c)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test de l'évaluation directe des plans par chemins
+"""
+
+import glob
+
+import numpy as np
+
+from main import AntColony, AntNest, load_antnest_from_txt, validate_solution
+from cooperative import ReservationPlanner
+from makespan import PathSet
+
+
+def flow_path_set(antnest):
+    """Chemins du flot maximal (gabarits initiaux de la planification coopérative)"""
+    planner = ReservationPlanner(AntColony(antnest))
+    return PathSet(antnest, [[planner.names[i] for i in route] for route in planner.templates])
+
+
+def test_closed_form_matches_pipeline_schedule():
+    """Le majorant calculé est le nombre d'étapes de l'ordonnancement en file, qui est valide"""
+    for filepath in sorted(glob.glob("fourmilieres/*.txt")):
+        antnest = load_antnest_from_txt(filepath)
+        paths = flow_path_set(antnest)
+        split = paths.best_split(antnest.ants)
+        assert split.sum() == antnest.ants
+        history = paths.pipeline_history(split)
+        assert validate_solution(antnest, history) == [], filepath
+        assert paths.makespan_bound(split) == len(history)
+        # Dernière arrivée de chaque chemin
+        arrivals = {}
+        for step_num, movements in enumerate(history, 1):
+            for ant_id, _, new_room in movements:
+                if new_room == "Sd":
+                    arrivals[ant_id] = step_num
+        last_ants = np.cumsum(split)  # Fourmis numérotées chemin par chemin
+        for p, count in enumerate(split):
+            if count:
+                assert paths.finish_times(split)[p] == arrivals[int(last_ants[p])]
+
+
+def test_vectorised_and_shared_rooms():
+    """Une répartition par ligne ; capacité d'une salle partagée entre ses chemins"""
+    antnest = AntNest("test", 10, {"A": 3, "B": 1, "C": 1},
+                      [("Sv", "A"), ("A", "B"), ("A", "C"), ("B", "Sd"), ("C", "Sd")])
+    paths = PathSet(antnest, [["Sv", "A", "B", "Sd"], ["Sv", "A", "C", "Sd"]])
+    assert paths.rates.tolist() == [1, 1]
+    splits = np.array([[10, 0], [5, 5], [0, 0]])
+    assert paths.makespan_bound(splits).tolist() == [12, 7, 0]
+    assert paths.best_split(10).tolist() == [5, 5]
+
+    # Parts calculées par répartition : un chemin sans fourmi ne consomme rien
+    antnest.rooms.update({"A": 2, "B": 2, "C": 2})
+    paths = PathSet(antnest, paths.paths)
+    assert paths.rates.tolist() == [1, 1]
+    assert paths.makespan_bound([[10, 0], [0, 10], [5, 5]]).tolist() == [7, 7, 7]
+
+    # Salle de capacité 1 partagée par deux chemins actifs : servis par vagues
+    antnest.rooms["A"] = 1
+    paths = PathSet(antnest, paths.paths)
+    assert paths.rates.tolist() == [1, 0]
+    assert paths.makespan_bound([[5, 5], [10, 0]]).tolist() == [14, 12]
+    history = paths.pipeline_history([5, 5])
+    assert len(history) == 14
+    assert validate_solution(antnest, history) == []
+    assert paths.best_split(10).tolist() == [10, 0]
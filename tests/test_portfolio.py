@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Test du portefeuille de résolutions à départage aléatoire
+"""
+
+import json
+import subprocess
+import sys
+
+from main import AntColony, load_antnest_from_txt, solve_antnest, validate_solution
+from benchmark import generate_antnest
+from portfolio import run_portfolio, run_seed, shuffled_colony
+
+
+def test_seed_zero_keeps_original_orders():
+    """Graine 0 : ordres d'origine ; autre graine : mêmes fourmis et mêmes tunnels"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt")
+    original = AntColony(antnest)
+    assert [ant.id for ant in shuffled_colony(antnest, 0).ants] == [ant.id for ant in original.ants]
+    shuffled = shuffled_colony(antnest, 7)
+    assert sorted(ant.id for ant in shuffled.ants) == [ant.id for ant in original.ants]
+    assert {room: set(n) for room, n in shuffled.adjacency.items()} == \
+        {room: set(n) for room, n in original.adjacency.items()}
+    assert run_seed(antnest, 0) == len(solve_antnest(antnest).movements_history)
+
+
+def test_portfolio_never_worse_than_hybrid():
+    """Meilleure solution valide, distribution complète des nombres d'étapes"""
+    antnest = generate_antnest(30, 200, seed=3)
+    result = run_portfolio(antnest, runs=12, jobs=2)
+    history = result.colony.movements_history
+    assert validate_solution(antnest, history) == []
+    assert len(history) == result.steps[result.seed]
+    assert len(history) <= len(solve_antnest(antnest).movements_history) == result.steps[0]
+    assert sum(result.distribution.values()) + result.abandoned == 12
+    assert min(result.distribution) == len(history)
+
+
+def test_portfolio_command_reports_distribution():
+    """python -m uneviedefourmi portfolio écrit un enregistrement JSON"""
+    result = subprocess.run(
+        [sys.executable, "-m", "uneviedefourmi", "portfolio", "fourmilieres/fourmiliere_cinq.txt",
+         "--runs", "8", "--jobs", "1"],
+        capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    record = json.loads(result.stdout)
+    assert record['runs'] == 8
+    assert record['solved']
+    assert record['steps'] <= record['reference_steps'] == 11
+    assert sum(record['distribution'].values()) + record['abandoned'] == 8
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Test de l'énumération bornée des chemins possibles (k plus courts chemins)
+"""
+
+import time
+import networkx as nx
+from main import load_antnest_from_txt, solve_antnest
+from gui import FourmiGUI
+
+
+def test_paths_ordered_by_length():
+    """Les chemins sont produits par longueur croissante"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt")
+    colony = solve_antnest(antnest)
+    
+    paths = list(FourmiGUI.iter_shortest_paths(colony.graph, "Sv", "Sd"))
+    lengths = [len(path) for path in paths]
+    
+    assert lengths == sorted(lengths)
+    assert len(paths) == len(list(nx.all_simple_paths(colony.graph, "Sv", "Sd")))
+
+
+def test_dense_graph_is_bounded():
+    """Sur un graphe dense, l'énumération respecte le plafond et le budget de temps"""
+    G = nx.complete_graph([f"S{i}" for i in range(14)] + ["Sv", "Sd"])
+    
+    start = time.perf_counter()
+    shown, hidden, exhaustive = FourmiGUI.collect_possible_paths(
+        G, max_paths=5, count_cap=2000, time_budget=0.5)
+    elapsed = time.perf_counter() - start
+    
+    assert len(shown) == 5
+    assert shown[0] == ["Sv", "Sd"]
+    assert hidden > 0
+    assert not exhaustive
+    assert elapsed < 2.0
+
+
+def test_budget_caps_the_search():
+    """Le budget est vérifié pendant la recherche, pas seulement entre deux chemins"""
+    G = nx.complete_graph([f"S{i}" for i in range(22)] + ["Sv", "Sd"])
+    
+    start = time.perf_counter()
+    shown = list(FourmiGUI.iter_shortest_paths(G, "Sv", "Sd", time_budget=0.2))
+    count, exhaustive = FourmiGUI.count_simple_paths(G, "Sv", "Sd", count_cap=None, time_budget=0.2)
+    elapsed = time.perf_counter() - start
+    
+    assert shown[0] == ["Sv", "Sd"]
+    assert count > 0 and not exhaustive
+    assert elapsed < 0.4 + 0.2
+
+
+def test_possible_paths_cached_on_colony():
+    """Les chemins calculés par le thread d'animation sont relus par l'affichage"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_quatre.txt")
+    colony = solve_antnest(antnest)
+    
+    result = FourmiGUI.possible_paths(colony)
+    
+    assert FourmiGUI.possible_paths(colony) is result
+    assert result == FourmiGUI.collect_possible_paths(colony.graph)
+
+
+def test_all_paths_shown_on_small_nest():
+    """Sur une petite fourmilière, tous les chemins tiennent dans le plafond"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_quatre.txt")
+    colony = solve_antnest(antnest)
+    
+    shown, hidden, exhaustive = FourmiGUI.collect_possible_paths(colony.graph, max_paths=12)
+    
+    assert hidden == 0
+    assert exhaustive
+    used_paths = FourmiGUI._used_paths(colony)
+    assert all(isinstance(path, tuple) for path in used_paths)
+    assert any(tuple(path) in used_paths for path in shown)
+
+
+if __name__ == "__main__":
+    test_paths_ordered_by_length()
+    test_dense_graph_is_bounded()
+    test_budget_caps_the_search()
+    test_possible_paths_cached_on_colony()
+    test_all_paths_shown_on_small_nest()
+    print("✅ Tests terminés!")
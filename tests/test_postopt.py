@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test de la post-optimisation par recherche locale
+"""
+
+import glob
+import time
+
+import networkx as nx
+import pytest
+
+from main import AntColony, AntNest, load_antnest_from_txt, solve_antnest, validate_solution
+from benchmark import generate_antnest
+from makespan import PathSet
+from postopt import LocalSearch, ant_plans, optimize_colony, optimize_solution, simple_route
+
+
+def test_ant_plans_and_simple_route():
+    """Plans par fourmi (attentes comprises) et itinéraires sans détour"""
+    history = [[(1, "Sv", "A")], [(2, "Sv", "A")], [(1, "A", "B")], [(1, "B", "Sd")]]
+    plans = ant_plans(history)
+    assert plans[1] == (0, ["Sv", "A", "A", "B", "Sd"])
+    assert plans[2] == (1, ["Sv", "A"])
+    assert simple_route(["Sv", "A", "A", "B", "A", "C", "Sd"]) == ["Sv", "A", "C", "Sd"]
+
+
+def test_optimized_solutions_stay_valid_and_never_grow():
+    """Solutions du glouton : valides après optimisation, jamais plus longues"""
+    nests = [load_antnest_from_txt(filepath) for filepath in sorted(glob.glob("fourmilieres/*.txt"))]
+    nests.append(generate_antnest(300, 100, seed=1))
+    for antnest in nests:
+        colony = solve_antnest(antnest)
+        optimized = optimize_colony(colony, budget=0.5)
+        assert validate_solution(antnest, optimized.movements_history) == []
+        assert optimized.all_ants_arrived()
+        assert len(optimized.movements_history) <= len(colony.movements_history)
+    # Le glouton laisse de la marge sur la fourmilière générée
+    assert len(optimized.movements_history) < len(colony.movements_history)
+
+
+def test_optimizer_rejects_invalid_solution():
+    """Une solution invalide n'est pas optimisée"""
+    antnest = AntNest("test", 1, {"A": 1}, [("Sv", "A"), ("A", "Sd")])
+    with pytest.raises(ValueError, match="Solution invalide"):
+        optimize_solution(antnest, [[(1, "Sv", "Sd")]])
+
+
+def test_run_respects_budget_on_large_nest():
+    """100 000 fourmis : run() rend la main dans son budget, historique reconstruit compris"""
+    antnest = generate_antnest(10, 100_000, seed=0)
+    # Solution valide mais très longue : toutes les fourmis en file sur le plus court chemin
+    path = nx.shortest_path(AntColony(antnest).graph, "Sv", "Sd")
+    history = PathSet(antnest, [path]).pipeline_history([antnest.ants])
+    search = LocalSearch(antnest, history)
+
+    start = time.perf_counter()
+    optimized = search.run(budget=0.5)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5 + 0.5
+    assert len(optimized) <= len(history)
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test du rendu persistant des étapes (artistes réutilisés et blitting)
+"""
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import networkx as nx
+
+from main import AntNest, AntColony, load_antnest_from_txt, solve_antnest
+from benchmark import generate_antnest
+from layout import layered_layout
+from rendering import StepRenderer, arrow_segments, collapse_chains, offset_segments, REGION_GRID, REGION_LABELS
+from gui import FourmiGUI
+
+
+def _renderer(nest="fourmilieres/fourmiliere_quatre.txt"):
+    colony = solve_antnest(load_antnest_from_txt(nest))
+    fig, ax = plt.subplots()
+    pos = nx.spring_layout(colony.graph, seed=42)
+    return colony, StepRenderer(ax, colony, pos)
+
+
+def test_artists_are_reused_between_steps():
+    """Rejouer l'animation réutilise les mêmes artistes sans en créer de nouveaux"""
+    colony, renderer = _renderer()
+    nodes = renderer.node_collection
+    steps = range(len(colony.movements_history) + 1)
+
+    for step in steps:
+        renderer.update(step, colony._get_occupancy_at_step(step))
+    artists = len(renderer.ax.get_children())
+    for step in steps:
+        renderer.update(step, colony._get_occupancy_at_step(step))
+
+    assert renderer.node_collection is nodes
+    assert renderer.background is not None
+    assert len(renderer.ax.get_children()) == artists
+    plt.close(renderer.figure)
+
+
+def test_passages_match_pheromone_data():
+    """Les passages cumulés (incrémentaux, y compris en revenant en arrière) sont exacts"""
+    colony, renderer = _renderer("fourmilieres/fourmiliere_cinq.txt")
+    steps = list(range(len(colony.movements_history) + 1)) + [3, 7]
+
+    for step in steps:
+        passages = renderer.passages_until(step)
+        expected = colony.get_pheromone_data_until_step(step)
+        got = {edge: int(n) for edge, n in zip(renderer.edges, passages) if n > 0}
+        assert got == {edge: data['passages'] for edge, data in expected.items()}
+    plt.close(renderer.figure)
+
+
+def test_node_sizes_follow_occupancy():
+    """La taille des salles reflète l'occupation de l'étape affichée"""
+    colony, renderer = _renderer()
+    occupancy = colony._get_occupancy_at_step(0)
+    renderer.update(0, occupancy)
+
+    sizes = dict(zip(renderer.nodes, renderer.node_collection.get_sizes()))
+    assert sizes["Sv"] == 2500 + colony.antnest.ants * 80
+    assert sizes["Sd"] == 2500
+    assert renderer.ax.get_title().startswith("État Initial")
+    plt.close(renderer.figure)
+
+
+def test_arrow_segments_shape():
+    """Chaque flèche est un corps et deux branches se rejoignant à la pointe"""
+    segments = arrow_segments([[0, 0], [0, 0]], [[1, 0], [0, 2]])
+    assert segments.shape == (6, 2, 2)
+    assert (segments[0, 1] == [0.85, 0]).all()
+    assert (segments[1, 1] == segments[0, 1]).all() and (segments[2, 1] == segments[0, 1]).all()
+
+
+def test_collapse_chains_covers_every_tunnel_once():
+    """Chaque tunnel appartient à une seule chaîne ; les salles internes sont de degré 2"""
+    antnest = AntNest("chaines", 1, {f"S{i}": 1 for i in range(1, 8)},
+                      [("Sv", "S1"), ("S1", "S2"), ("S2", "S3"), ("S3", "Sd"),
+                       ("S1", "S4"), ("S4", "S5"), ("S5", "S1"),     # boucle sur S1
+                       ("S6", "S7"), ("S7", "S6")])                  # cycle isolé (doublon)
+    colony = AntColony(antnest)
+    chains = collapse_chains(colony.adjacency)
+
+    edges = [frozenset(e) for chain in chains for e in zip(chain, chain[1:])]
+    assert sorted(map(sorted, edges)) == sorted(sorted(e) for e in colony.edges)
+    assert ["S1", "S2", "S3", "Sd"] in chains or ["Sd", "S3", "S2", "S1"] in chains
+    for chain in chains:
+        assert chain[0] != chain[-1]
+        assert all(len(colony.adjacency[node]) == 2 for node in chain[1:-1])
+
+
+def test_level_of_detail_bounds_artists():
+    """En niveau de détail, le nombre d'artistes dessinés reste borné sur une grande fourmilière"""
+    colony = solve_antnest(generate_antnest(2000, 300))
+    fig, ax = plt.subplots(figsize=(8, 6), dpi=50)
+    renderer = StepRenderer(ax, colony, layered_layout(colony.antnest))
+    assert renderer.lod
+
+    for step in range(1, 6):
+        renderer.update(step, colony._get_occupancy_at_step(step))
+        visible = [a for a in renderer.dynamic_artists if a.get_visible()]
+        assert len(visible) <= 4 + REGION_LABELS
+        assert len(renderer.arrows.get_segments()) <= 3 * REGION_GRID * REGION_GRID * 4
+    plt.close(fig)
+
+
+def test_offset_segments_are_perpendicular():
+    """Le décalage est perpendiculaire au segment ; un segment de longueur nulle reste en place"""
+    starts, ends = offset_segments([[0, 0], [1, 1], [2, 2]], [[2, 0], [1, 3], [2, 2]], [0.5, -1, 0.5])
+    assert (starts == [[0, 0.5], [2, 1], [2, 2]]).all()
+    assert (ends == [[2, 0.5], [2, 3], [2, 2]]).all()
+
+
+def test_path_overlays_use_one_collection_each():
+    """Chaque surcouche ajoute un nombre fixe de collections, quel que soit le nombre de chemins"""
+    colony, renderer = _renderer("fourmilieres/fourmiliere_cinq.txt")
+    ax = renderer.ax
+    groups = FourmiGUI.get_path_groups(colony)
+    assert FourmiGUI.get_path_groups(colony) is groups
+    assert sum(len(ants) for _, ants in groups) == colony.antnest.ants
+
+    before = len(ax.collections)
+    assert FourmiGUI.draw_ant_paths(colony, renderer.pos, ax) == len(groups)
+    assert FourmiGUI.draw_all_possible_paths(colony, renderer.pos, ax) > 0
+    assert len(ax.collections) == before + 4
+    assert not ax.patches and len(ax.lines) == 0
+    plt.close(renderer.figure)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Test des politiques de routage (congestion, ECMP, progrès monotone)
+"""
+
+import glob
+
+import pytest
+
+from main import AntColony, load_antnest_from_txt, solve_antnest, validate_solution
+from benchmark import generate_antnest
+from routing import CongestionRouter, EcmpRouter, Router, weighted_round_robin
+
+
+@pytest.mark.parametrize("strategy", ["congestion", "ecmp"])
+def test_routing_policies_solve_bundled_nests(strategy):
+    """Toutes les fourmis arrivent, sans dépasser les capacités ni faire pire que la distance seule"""
+    for filepath in sorted(glob.glob("fourmilieres/*.txt")):
+        antnest = load_antnest_from_txt(filepath)
+        colony = solve_antnest(antnest, strategy)
+        assert colony.all_ants_arrived(), filepath
+        assert len(colony.movements_history) <= len(solve_antnest(antnest).movements_history)
+        for step in range(len(colony.movements_history) + 1):
+            occupancy = colony._get_occupancy_at_step(step)
+            for room, capacity in antnest.rooms.items():
+                assert len(occupancy.get(room, [])) <= capacity, (filepath, step, room)
+
+
+def test_incremental_costs_match_full_recomputation():
+    """Les attentes prévues tenues à jour étape par étape égalent un recalcul complet"""
+    colony = AntColony(generate_antnest(100, 300), routing="congestion")
+    for _ in range(8):
+        colony.simulate_step()
+        fresh = CongestionRouter(colony)
+        assert colony.router.expected_wait == pytest.approx(fresh.expected_wait)
+
+
+def test_weighted_round_robin_is_interleaved():
+    """Chaque prochain saut revient proportionnellement à son poids, sans rafale"""
+    assert weighted_round_robin([2, 1]) == [0, 1, 0]
+    assert weighted_round_robin([4, 4]) == [0, 1]
+    cycle = weighted_round_robin([5, 3, 2])
+    assert [cycle.count(i) for i in range(3)] == [5, 3, 2]
+    assert all(len(set(cycle[i:i + 3])) > 1 for i in range(len(cycle) - 2))  # Pas de rafale
+
+
+def test_ecmp_table_spreads_ants_over_parallel_branches():
+    """Les fourmis quittant une salle se répartissent selon la capacité en aval des branches"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt")
+    router = EcmpRouter(AntColony(antnest))
+    hops, cycle = router.table["S2"]
+    assert sorted(hops) == ["S3", "S5"]                    # Deux branches de même longueur
+    assert cycle.count("S3") == cycle.count("S5")           # Goulots de capacité 2 chacune
+    assert router.table["S4"][0] == ["Sd"]
+
+    colony = solve_antnest(antnest, "ecmp")
+    passages = colony.edge_passages
+    assert abs(passages[("S2", "S3")] - passages[("S2", "S5")]) <= 2
+
+
+def test_monotone_policy_never_wastes_moves():
+    """Aucun retour ni pas de côté ; mouvements et attentes comptés à côté des étapes"""
+    for antnest in [load_antnest_from_txt(f) for f in sorted(glob.glob("fourmilieres/*.txt"))] + \
+            [generate_antnest(100, 1000)]:
+        colony = solve_antnest(antnest, "monotone")
+        assert colony.all_ants_arrived(), antnest.name
+        assert validate_solution(antnest, colony.movements_history) == []
+        stats = colony.get_move_statistics()
+        assert stats['wasted_moves'] == 0
+        assert stats['steps'] == len(colony.movements_history)
+        # Chaque fourmi fait exactement un mouvement par tunnel de son plus court chemin
+        assert stats['moves'] == sum(colony.distance_to_sd["Sv"] for _ in colony.ants)
+        assert stats['moves'] <= solve_antnest(antnest).get_move_statistics()['moves']
+
+
+def test_move_statistics_count_idle_ants():
+    """Attentes = fourmis hors du dortoir qui ne bougent pas pendant une étape"""
+    colony = AntColony(load_antnest_from_txt("fourmilieres/fourmiliere_un.txt"))
+    colony.solve()
+    stats = colony.get_move_statistics()
+    ants, steps = colony.antnest.ants, stats['steps']
+    arrivals = [sum(1 for move in movements if move[2] == "Sd") for movements in colony.movements_history]
+    present = sum(ants - sum(arrivals[:i]) for i in range(steps))
+    assert stats['idle_ant_steps'] == present - stats['moves']
+
+
+def test_unknown_routing_is_rejected():
+    """Un nom de routage inconnu est refusé"""
+    with pytest.raises(ValueError):
+        AntColony(load_antnest_from_txt("fourmilieres/fourmiliere_zero.txt"), routing="inconnu")
+
+
+def test_router_requires_choose():
+    """Router est abstrait : une politique sans choose() ne peut pas être instanciée"""
+    with pytest.raises(TypeError):
+        Router()
+
+    class Incomplete(Router):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
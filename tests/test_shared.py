@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test de la publication des solutions en mémoire partagée
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import networkx as nx
+
+from benchmark import generate_antnest
+from main import AntColony, load_antnest_from_txt, solve_antnest
+from makespan import PathSet
+from shared import KEYFRAME_INTERVAL, KEYFRAME_MEMORY_RATIO, SharedSolution, publish_solution
+
+
+def _summary(descriptor):
+    """Lecture depuis un autre processus (attache sans copie)"""
+    solution = SharedSolution.attach(descriptor)
+    try:
+        return solution.steps, solution.movements(1), solution.passages_until(solution.steps).tolist()
+    finally:
+        solution.close()
+
+
+def test_keyframes_match_replay():
+    """Occupation et passages à chaque étape identiques à la reconstitution complète"""
+    colony = solve_antnest(load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt"))
+    with publish_solution(colony, keyframe_interval=4) as solution:
+        assert solution.history() == colony.movements_history
+        assert solution.visited_rooms() == colony.get_visited_rooms()
+        for step in range(len(colony.movements_history) + 1):
+            occupancy = colony._get_occupancy_at_step(step)
+            shared = solution.occupancy_at(step)
+            assert {room: sorted(ants) for room, ants in occupancy.items() if ants} == \
+                   {room: ants for room, ants in shared.items() if ants}
+
+            expected = colony.get_pheromone_data_until_step(step)
+            passages = dict(zip(solution.edges, solution.passages_until(step).tolist()))
+            assert {edge: n for edge, n in passages.items() if n} == \
+                   {edge: data['passages'] for edge, data in expected.items()}
+
+
+def test_attach_from_another_process():
+    """Un autre processus lit la solution à partir du seul descripteur"""
+    colony = solve_antnest(load_antnest_from_txt("fourmilieres/fourmiliere_quatre.txt"))
+    with publish_solution(colony) as solution:
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            steps, first, passages = executor.submit(_summary, solution.descriptor).result()
+    assert steps == len(colony.movements_history)
+    assert first == colony.movements_history[0]
+    assert sum(passages) == sum(colony.edge_passages.values())
+
+
+def test_keyframes_bounded_by_moves():
+    """Beaucoup de fourmis : l'intervalle s'élargit, les images clés restent petites et exactes"""
+    antnest = generate_antnest(10, 2000, seed=0)
+    colony = AntColony(antnest)
+    path = nx.shortest_path(colony.graph, "Sv", "Sd")
+    colony.load_history(PathSet(antnest, [path]).pipeline_history([antnest.ants]))
+
+    with publish_solution(colony) as solution:
+        arrays = solution.arrays
+        keyframes = arrays['keyframe_rooms'].nbytes + arrays['keyframe_passages'].nbytes
+        moves = sum(arrays[key].nbytes for key in
+                    ('counts', 'starts', 'ants', 'sources', 'targets', 'move_edges'))
+        row = arrays['keyframe_rooms'][0].nbytes + arrays['keyframe_passages'][0].nbytes
+        assert solution.descriptor.keyframe_interval > KEYFRAME_INTERVAL
+        assert keyframes <= moves * KEYFRAME_MEMORY_RATIO + row
+        for step in (0, 1, solution.steps // 2, solution.steps):
+            occupancy = colony._get_occupancy_at_step(step)
+            shared = solution.occupancy_at(step)
+            assert {room: sorted(ants) for room, ants in occupancy.items() if ants} == \
+                   {room: ants for room, ants in shared.items() if ants}
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test de la résolution dans un processus séparé (blocs colonnaires, annulation)
+"""
+
+import os
+import time
+
+from main import AntColony, load_antnest_from_txt, solve_antnest
+from benchmark import generate_antnest
+from solver_process import SolveProcess, decode_steps, encode_steps, room_table
+
+
+def test_streamed_solution_matches_in_process_solve():
+    """Les étapes reçues par blocs et la colonie reconstituée sont identiques à la résolution locale"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_cinq.txt")
+    expected = solve_antnest(antnest)
+
+    received = []
+    process = SolveProcess(antnest, chunk_steps=3).start()
+    colony = process.wait(on_steps=received.append)
+
+    assert colony.movements_history == expected.movements_history
+    assert colony.edge_passages == expected.edge_passages
+    assert colony.all_ants_arrived()
+    assert process.diagnostic['reason'] == "solved"
+    assert received[-1] == len(expected.movements_history) and len(received) >= 4
+
+
+def test_encode_decode_roundtrip():
+    """Un bloc colonnaire redonne exactement les mouvements, étapes vides comprises"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_quatre.txt")
+    rooms = room_table(antnest)
+    steps = solve_antnest(antnest).movements_history + [[]]
+    chunk = encode_steps(steps, {room: i for i, room in enumerate(rooms)})
+    assert decode_steps(chunk, rooms) == steps
+
+
+def test_load_history_replays_state():
+    """Rejouer un historique reproduit l'occupation et les phéromones"""
+    antnest = load_antnest_from_txt("fourmilieres/fourmiliere_trois.txt")
+    expected = solve_antnest(antnest)
+    colony = AntColony(antnest).load_history(expected.movements_history)
+    assert colony.get_pheromone_data() == expected.get_pheromone_data()
+    assert colony._get_occupancy_at_step(3) == expected._get_occupancy_at_step(3)
+    assert sorted(colony.room_occupancy["Sd"]) == list(range(1, antnest.ants + 1))
+
+
+def test_cancel_terminates_solver():
+    """L'annulation termine le processus de résolution sans attendre la fin"""
+    solver = SolveProcess(generate_antnest(3000, 20000)).start()
+    time.sleep(0.3)
+    start = time.perf_counter()
+    solver.cancel()
+    assert solver.wait() is None
+    assert time.perf_counter() - start < 2.0
+    assert not solver.process.is_alive()
+
+
+def test_cancel_after_done_releases_shared_block():
+    """Annulation après l'envoi de la solution : le bloc publié est quand même libéré"""
+    before = set(os.listdir("/dev/shm")) if os.path.isdir("/dev/shm") else None
+    solver = SolveProcess(load_antnest_from_txt("fourmilieres/fourmiliere_quatre.txt")).start()
+    solver.process.join()   # "done" est dans le tube, pas encore lu
+    solver.cancel()
+    assert solver.wait() is None
+    if before is not None:
+        assert set(os.listdir("/dev/shm")) - before == set()
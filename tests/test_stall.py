@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test de la détection des blocages (oscillations, absence de progrès, budgets)
+"""
+
+import glob
+
+from benchmark import build_corpus
+from main import (AntColony, AntNest, STRATEGIES, describe_solve_stop, load_antnest_from_txt,
+                  solve_antnest)
+
+
+def oscillating_colony():
+    """Colonie dont la politique renvoie sans fin la fourmi entre Sv et A"""
+    antnest = AntNest("test", 1, {"A": 1, "B": 1}, [("Sv", "A"), ("A", "B"), ("B", "Sd")])
+    colony = AntColony(antnest)
+    choose = lambda ant, moves: "Sv" if ant.current_room == "A" else "A"
+    colony._choose_best_move_with_temp = choose
+    colony._choose_best_move = choose
+    return colony
+
+
+def test_bundled_nests_are_solved():
+    """Aucune fausse alerte sur les fourmilières fournies"""
+    for filepath in sorted(glob.glob("fourmilieres/*.txt")):
+        colony = AntColony(load_antnest_from_txt(filepath))
+        colony.solve()
+        diagnostic = colony.get_solve_diagnostic()
+        assert diagnostic['reason'] == "solved", filepath
+        assert diagnostic['remaining'] == 0 and diagnostic['distance_left'] == 0
+
+
+def test_oscillation_is_detected_as_cycle():
+    """L'état Sv -> A -> Sv se répète : arrêt au troisième passage (détection activée)"""
+    colony = oscillating_colony()
+    colony.solve(max_repeats=3)
+    diagnostic = colony.get_solve_diagnostic()
+    assert diagnostic['reason'] == "cycle"
+    assert diagnostic['step'] == 4
+    assert diagnostic['repeated_step'] == 0
+    assert diagnostic['remaining'] == 1
+
+
+def test_stateful_routers_are_not_cut_short():
+    """ECMP et congestion (politiques à état) : aucune résolution du banc d'essai interrompue"""
+    for antnest in build_corpus("quick", "fourmilieres"):
+        for strategy in ("ecmp", "congestion"):
+            colony = STRATEGIES[strategy](antnest)
+            assert colony.get_solve_diagnostic()['reason'] == "solved", (antnest.name, strategy)
+
+
+def test_oscillation_stops_as_stalled_by_default():
+    """Sans détection de cycle, l'oscillation est arrêtée faute de progrès"""
+    colony = oscillating_colony()
+    colony.solve(stall_window=10)
+    assert colony.get_solve_diagnostic()['reason'] == "stalled"
+
+
+def test_stall_window_and_budgets():
+    """Sans détection de cycle : absence de progrès, puis nombre d'étapes maximal"""
+    colony = oscillating_colony()
+    colony.solve(max_repeats=10**9, stall_window=10)
+    assert colony.get_solve_diagnostic()['reason'] == "stalled"
+    assert colony.step_count == 11  # Meilleur progrès à l'étape 1
+
+    colony = oscillating_colony()
+    colony.solve(max_repeats=10**9, stall_window=None, max_steps=25)
+    assert colony.get_solve_diagnostic()['reason'] == "max_steps"
+    assert colony.step_count == 25
+
+    colony = oscillating_colony()
+    colony.solve(max_repeats=10**9, stall_window=None, time_budget=0.05)
+    assert colony.get_solve_diagnostic()['reason'] == "timeout"
+
+
+def test_blocked_nest():
+    """Dortoir inaccessible : arrêt faute de mouvement"""
+    antnest = AntNest("test", 2, {"A": 1}, [("Sv", "A")])
+    colony = AntColony(antnest)
+    colony.solve()
+    assert colony.get_solve_diagnostic()['reason'] == "blocked"
+
+
+def test_incomplete_solve_is_reported(capsys):
+    """solve_antnest signale une résolution incomplète au lieu de la taire"""
+    antnest = AntNest("impasse", 2, {"A": 1}, [("Sv", "A")])
+    colony = solve_antnest(antnest)
+    assert not colony.all_ants_arrived()
+    message = describe_solve_stop(colony.get_solve_diagnostic())
+    assert "aucun mouvement possible" in message and "2 fourmi(s)" in message
+    assert message in capsys.readouterr().err
+
+    solve_antnest(load_antnest_from_txt("fourmilieres/fourmiliere_quatre.txt"))
+    assert capsys.readouterr().err == ""
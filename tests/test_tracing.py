@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Test du traceur Chrome trace-event (Perfetto)
+"""
+
+import json
+import os
+import threading
+import tracing
+from main import AntColony, load_antnest_from_txt, solve_antnest
+
+
+def test_solver_trace(tmp_path):
+    """Les intervalles du solveur sont écrits au format Chrome trace-event"""
+    path = tmp_path / "trace.json"
+    tracing.enable(str(path))
+    try:
+        colony = solve_antnest(load_antnest_from_txt("fourmilieres/fourmiliere_quatre.txt"))
+    finally:
+        tracing.disable()
+    
+    trace = json.loads(path.read_text(encoding="utf-8"))
+    spans = [e for e in trace['traceEvents'] if e['ph'] == 'X']
+    names = [e['name'] for e in spans]
+    
+    assert names.count("AntColony.simulate_step") == len(colony.movements_history)
+    assert names.count("AntColony.solve") == 1
+    assert all(e['dur'] >= 0 and 'tid' in e for e in spans)
+    assert any(e['ph'] == 'M' and e['name'] == 'thread_name' for e in trace['traceEvents'])
+
+
+def test_queue_handoff_between_threads(tmp_path):
+    """Un put() et le get() correspondant sont reliés par un flux entre deux threads"""
+    path = tmp_path / "trace.json"
+    messages = tracing.TracedQueue()
+    tracing.enable(str(path))
+    try:
+        producer = threading.Thread(target=lambda: messages.put(("status", "ok")), name="animation")
+        producer.start()
+        producer.join()
+        with tracing.span("process_queue"):
+            assert messages.get_nowait() == ("status", "ok")
+    finally:
+        tracing.disable()
+    
+    events = json.loads(path.read_text(encoding="utf-8"))['traceEvents']
+    start = next(e for e in events if e['ph'] == 's')
+    end = next(e for e in events if e['ph'] == 'f')
+    assert start['id'] == end['id']
+    assert start['tid'] != end['tid']
+
+
+def test_disabled_tracer_is_transparent():
+    """Désactivé, le traceur ne modifie ni les résultats ni les files"""
+    assert not tracing.is_enabled()
+    # Aucune enveloppe sur les méthodes instrumentées tant que le traceur est inactif
+    assert AntColony.simulate_step.__name__ == "simulate_step"
+    assert not hasattr(AntColony.simulate_step, "__wrapped__")
+    messages = tracing.TracedQueue()
+    messages.put(1)
+    assert messages.get() == 1
+    with tracing.span("rien"):
+        pass
+
+
+def test_child_process_trace_path(monkeypatch):
+    """Un processus fils écrit sa trace dans un fichier suffixé par son pid"""
+    assert tracing._process_trace_path("trace.json") == "trace.json"
+    monkeypatch.setattr("multiprocessing.parent_process", lambda: object())
+    assert tracing._process_trace_path("trace.json") == f"trace.{os.getpid()}.json"
+
+
+if __name__ == "__main__":
+    import pathlib, tempfile
+    test_solver_trace(pathlib.Path(tempfile.mkdtemp()))
+    test_queue_handoff_between_threads(pathlib.Path(tempfile.mkdtemp()))
+    test_disabled_tracer_is_transparent()
+    print("✅ Tests terminés!")
@@ -0,0 +1,251 @@
+'''
+Traceur opt-in au format Chrome trace-event (visualisable dans Perfetto ou chrome://tracing).
+
+Activation :
+    FOURMI_TRACE=trace.json uv run launcher.py
+ou depuis le code :
+    import tracing
+    tracing.enable("trace.json")
+    ...
+    tracing.disable()   # écrit le fichier (également fait à la sortie du programme)
+
+Chaque intervalle est enregistré avec l'identifiant du thread qui l'exécute, ce qui
+permet de voir la concurrence (GIL) entre le thread d'animation et la boucle Tk.
+Désactivé, le traceur ne coûte rien aux méthodes instrumentées (l'enveloppe n'est
+installée sur la classe qu'à l'activation) et un test aux fonctions instrumentées.
+
+Avec FOURMI_TRACE, les processus fils (pools, SolveProcess) écrivent leur propre
+trace, suffixée par leur pid (trace.1234.json), sans écraser celle du parent.
+'''
+
+import atexit
+import functools
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+
+
+_tracer = None
+_traced_methods = []   # (classe, attribut, méthode, enveloppe) installées à l'activation
+
+
+class Tracer:
+    """Collecte des événements de trace et les écrit au format Chrome trace-event"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.events = []
+        self.pid = os.getpid()
+        self._origin_ns = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._thread_names = {}
+        self._flow_ids = itertools.count(1)
+
+    def _now_us(self) -> float:
+        return (time.perf_counter_ns() - self._origin_ns) / 1000
+
+    def _tid(self) -> int:
+        tid = threading.get_native_id()
+        if tid not in self._thread_names:
+            with self._lock:
+                self._thread_names[tid] = threading.current_thread().name
+        return tid
+
+    def _record(self, event: dict):
+        with self._lock:
+            self.events.append(event)
+
+    def complete(self, name: str, cat: str, start_us: float, args: dict = None):
+        """Enregistre un intervalle terminé (événement 'X')"""
+        event = {"name": name, "cat": cat, "ph": "X", "ts": start_us,
+                 "dur": self._now_us() - start_us, "pid": self.pid, "tid": self._tid()}
+        if args:
+            event["args"] = args
+        self._record(event)
+
+    def instant(self, name: str, cat: str = "fourmi", args: dict = None):
+        """Enregistre un événement ponctuel (événement 'i')"""
+        event = {"name": name, "cat": cat, "ph": "i", "s": "t", "ts": self._now_us(),
+                 "pid": self.pid, "tid": self._tid()}
+        if args:
+            event["args"] = args
+        self._record(event)
+
+    def flow_start(self, name: str, cat: str = "queue") -> int:
+        """Début d'une flèche de flux (passage de relais entre threads)"""
+        flow_id = next(self._flow_ids)
+        self._record({"name": name, "cat": cat, "ph": "s", "id": flow_id, "ts": self._now_us(),
+                      "pid": self.pid, "tid": self._tid()})
+        return flow_id
+
+    def flow_end(self, flow_id: int, name: str, cat: str = "queue"):
+        """Fin d'une flèche de flux, rattachée à l'intervalle englobant"""
+        self._record({"name": name, "cat": cat, "ph": "f", "bp": "e", "id": flow_id,
+                      "ts": self._now_us(), "pid": self.pid, "tid": self._tid()})
+
+    def to_json(self) -> dict:
+        """Événements au format Chrome trace-event (avec les noms de threads)"""
+        with self._lock:
+            events = list(self.events)
+            thread_names = dict(self._thread_names)
+        metadata = [{"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid,
+                     "args": {"name": name}} for tid, name in thread_names.items()]
+        metadata.append({"name": "process_name", "ph": "M", "pid": self.pid,
+                         "args": {"name": "uneviedefourmi"}})
+        return {"traceEvents": metadata + events, "displayTimeUnit": "ms"}
+
+    def save(self, path: str = None):
+        """Écrit la trace sur disque"""
+        with open(path or self.path, "w", encoding="utf-8") as f:
+            json.dump(self.to_json(), f)
+
+
+class _Span:
+    """Intervalle mesuré par un bloc with"""
+
+    __slots__ = ("tracer", "name", "cat", "args", "start")
+
+    def __init__(self, tracer, name, cat, args):
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+        self.args = args
+
+    def __enter__(self):
+        self.start = self.tracer._now_us()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.cat, self.start, self.args)
+        return False
+
+
+class _NullSpan:
+    """Intervalle vide utilisé lorsque le traceur est désactivé"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def enable(path: str = "trace.json") -> Tracer:
+    """Active le traceur ; la trace est écrite à la désactivation ou à la sortie"""
+    global _tracer
+    _tracer = Tracer(path)
+    for owner, attribute, _, wrapper in _traced_methods:
+        setattr(owner, attribute, wrapper)
+    return _tracer
+
+
+def disable():
+    """Désactive le traceur et écrit la trace"""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    for owner, attribute, method, _ in _traced_methods:
+        setattr(owner, attribute, method)
+    if tracer is not None:
+        tracer.save()
+    return tracer
+
+
+def is_enabled() -> bool:
+    """Indique si le traceur est actif"""
+    return _tracer is not None
+
+
+def span(name: str, cat: str = "fourmi", **args):
+    """Bloc with mesurant un intervalle (sans effet si le traceur est désactivé)"""
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return _Span(tracer, name, cat, args or None)
+
+
+def instant(name: str, cat: str = "fourmi", **args):
+    """Événement ponctuel (sans effet si le traceur est désactivé)"""
+    tracer = _tracer
+    if tracer is not None:
+        tracer.instant(name, cat, args or None)
+
+
+class _TracedMethod:
+    """
+    Méthode instrumentée : à la création de la classe, la méthode d'origine ou son
+    enveloppe (selon l'état du traceur) est posée sur la classe ; enable() et
+    disable() les échangent ensuite.
+    """
+
+    def __init__(self, method, wrapper):
+        self.method = method
+        self.wrapper = wrapper
+
+    def __set_name__(self, owner, attribute):
+        _traced_methods.append((owner, attribute, self.method, self.wrapper))
+        setattr(owner, attribute, self.wrapper if _tracer is not None else self.method)
+
+
+def traced(name: str = None, cat: str = "fourmi"):
+    """Décorateur enregistrant chaque appel de la fonction (ou méthode) comme un intervalle"""
+    def decorator(func):
+        span_name = name or func.__qualname__
+        qualified = func.__qualname__.split(".")
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(*args, **kwargs)
+            start = tracer._now_us()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer.complete(span_name, cat, start)
+
+        # Méthode définie dans le corps d'une classe : enveloppe posée à l'activation
+        if len(qualified) > 1 and qualified[-2] != "<locals>":
+            return _TracedMethod(func, wrapper)
+        return wrapper
+    return decorator
+
+
+class TracedQueue(queue.Queue):
+    """File de messages qui relie chaque put() au get() correspondant par une flèche de flux"""
+
+    def _put(self, item):
+        tracer = _tracer
+        flow_id = tracer.flow_start("message_queue") if tracer is not None else None
+        super()._put((flow_id, item))
+
+    def _get(self):
+        flow_id, item = super()._get()
+        tracer = _tracer
+        if flow_id is not None and tracer is not None:
+            tracer.flow_end(flow_id, "message_queue")
+        return item
+
+
+@atexit.register
+def _save_at_exit():
+    if _tracer is not None:
+        disable()
+
+
+def _process_trace_path(path: str) -> str:
+    """Fichier de trace du processus courant : suffixé par le pid dans un processus fils"""
+    import multiprocessing
+    if multiprocessing.parent_process() is None:
+        return path
+    root, extension = os.path.splitext(path)
+    return f"{root}.{os.getpid()}{extension}"
+
+
+if os.environ.get("FOURMI_TRACE"):
+    enable(_process_trace_path(os.environ["FOURMI_TRACE"]))
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Interface en ligne de commande (sans affichage) pour 'Une vie de fourmi'
+
+Usage :
+    python -m uneviedefourmi solve DIR --jobs N --strategy S --out results.jsonl
+    python -m uneviedefourmi portfolio FICHIER.txt --runs N --jobs N
+    python -m uneviedefourmi horizon FICHIER.txt T
+    python -m uneviedefourmi export FICHIER.txt animation.mp4 --jobs N --fps 2
+
+Les fourmilières sont réparties sur un pool de processus ; un enregistrement JSON
+par fourmilière est écrit dès qu'elle est résolue. Ce module n'importe jamais
+tkinter, et matplotlib seulement pour l'export (backend Agg).
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from main import load_antnest_from_txt, solve_antnest, lower_bound_steps, STRATEGIES
+
+
+def find_nest_files(paths):
+    """Retourne la liste triée des fichiers de fourmilières (.txt) à partir de fichiers ou dossiers"""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for filename in sorted(os.listdir(path)):
+                if filename.endswith('.txt'):
+                    files.append(os.path.join(path, filename))
+        else:
+            files.append(path)
+    return files
+
+
+def solve_nest_file(filepath, strategy="hybrid", trace_memory=True, optimize=0.0):
+    """Résout une fourmilière et retourne un enregistrement sérialisable en JSON
+
+    optimize : budget (secondes) de post-optimisation de la solution, 0 = aucune
+    trace_memory : pic mémoire mesuré sur une seconde résolution (tracemalloc ralentit
+    l'exécution : le temps est mesuré sans lui)
+    """
+    record = {'path': filepath, 'strategy': strategy}
+    try:
+        antnest = load_antnest_from_txt(filepath)
+        record.update({
+            'nest': antnest.name,
+            'ants': antnest.ants,
+            'rooms': len(antnest.rooms),
+            'tubes': len(antnest.tubes),
+        })
+
+        start_time = time.perf_counter()
+        colony = solve_antnest(antnest, strategy)
+        end_time = time.perf_counter()
+        if trace_memory:
+            # Pic mémoire mesuré sur une exécution séparée, comme benchmark.run_case
+            tracemalloc.start()
+            solve_antnest(antnest, strategy)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            record['peak_memory_kb'] = round(peak / 1024, 1)
+
+        if optimize > 0:
+            from postopt import optimize_colony
+
+            record['steps_before_optimize'] = len(colony.movements_history)
+            optimize_start = time.perf_counter()
+            colony = optimize_colony(colony, optimize)
+            record['optimize_ms'] = round((time.perf_counter() - optimize_start) * 1000, 3)
+
+        move_stats = colony.get_move_statistics()
+        steps = move_stats['steps']
+        lower_bound = lower_bound_steps(antnest)
+        record.update({
+            'steps': steps,
+            'moves': move_stats['moves'],
+            'idle_ant_steps': move_stats['idle_ant_steps'],
+            'solved': colony.all_ants_arrived(),
+            'time_ms': round((end_time - start_time) * 1000, 3),
+            'lower_bound': lower_bound,
+            'gap': steps - lower_bound if lower_bound is not None else None,
+        })
+        if not record['solved']:
+            record['diagnostic'] = colony.get_solve_diagnostic()
+    except Exception as e:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        record['error'] = f"{type(e).__name__}: {e}"
+    return record
+
+
+def run_solve(files, jobs=None, strategy="hybrid", out=None, trace_memory=True, optimize=0.0):
+    """Résout les fourmilières en parallèle et écrit les enregistrements au fil de l'eau
+
+    Returns:
+        Liste des enregistrements dans l'ordre de terminaison
+    """
+    jobs = jobs or os.cpu_count() or 1
+    records = []
+
+    def emit(record):
+        records.append(record)
+        if out is not None:
+            out.write(json.dumps(record, ensure_ascii=False) + "\n")
+            out.flush()
+
+    if jobs == 1 or len(files) <= 1:
+        for filepath in files:
+            emit(solve_nest_file(filepath, strategy, trace_memory, optimize))
+        return records
+
+    with ProcessPoolExecutor(max_workers=min(jobs, len(files))) as executor:
+        futures = [executor.submit(solve_nest_file, filepath, strategy, trace_memory, optimize)
+                   for filepath in files]
+        for future in as_completed(futures):
+            emit(future.result())
+    return records
+
+
+def build_parser():
+    """Construit l'analyseur d'arguments de la ligne de commande"""
+    parser = argparse.ArgumentParser(prog="uneviedefourmi",
+                                     description="Une vie de fourmi - outils sans affichage")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    solve = subparsers.add_parser("solve", help="Résout un ensemble de fourmilières en parallèle")
+    solve.add_argument("paths", nargs="+", metavar="DIR",
+                       help="Dossier(s) ou fichier(s) de fourmilières (.txt)")
+    solve.add_argument("--jobs", "-j", type=int, default=None,
+                       help="Nombre de processus (défaut: nombre de cœurs)")
+    solve.add_argument("--strategy", "-s", default="hybrid", choices=sorted(STRATEGIES),
+                       help="Stratégie de résolution (défaut: hybrid)")
+    solve.add_argument("--out", "-o", default="-",
+                       help="Fichier JSON Lines de sortie (défaut: sortie standard)")
+    solve.add_argument("--memory", action=argparse.BooleanOptionalAction, default=True,
+                       help="Mesurer le pic mémoire avec tracemalloc, sur une seconde résolution (défaut: oui)")
+    solve.add_argument("--optimize", type=float, default=0.0, metavar="SECONDES",
+                       help="Budget de post-optimisation par fourmilière (défaut: 0, aucune)")
+
+    portfolio = subparsers.add_parser("portfolio",
+                                      help="Relance le glouton sous des ordres permutés (graines)")
+    portfolio.add_argument("nest", help="Fichier de fourmilière (.txt)")
+    portfolio.add_argument("--runs", "-n", type=int, default=32,
+                           help="Nombre de graines (défaut: 32)")
+    portfolio.add_argument("--jobs", "-j", type=int, default=None,
+                           help="Nombre de processus (défaut: nombre de cœurs)")
+    portfolio.add_argument("--seed", type=int, default=0, help="Première graine (défaut: 0)")
+
+    horizon = subparsers.add_parser("horizon",
+                                    help="Nombre maximal de fourmis au dortoir en T étapes")
+    horizon.add_argument("nest", help="Fichier de fourmilière (.txt)")
+    horizon.add_argument("steps", type=int, metavar="T", help="Horizon (nombre d'étapes)")
+    horizon.add_argument("--schedule", action="store_true",
+                         help="Inclure l'ordonnancement (mouvements par étape)")
+
+    export = subparsers.add_parser("export", help="Exporte l'animation d'une fourmilière (MP4/GIF)")
+    export.add_argument("nest", help="Fichier de fourmilière (.txt)")
+    export.add_argument("output", help="Fichier de sortie (.mp4 avec ffmpeg, .gif sinon)")
+    export.add_argument("--jobs", "-j", type=int, default=None,
+                        help="Nombre de processus de rendu (défaut: nombre de cœurs)")
+    export.add_argument("--strategy", "-s", default="hybrid", choices=sorted(STRATEGIES),
+                        help="Stratégie de résolution (défaut: hybrid)")
+    export.add_argument("--fps", type=float, default=2.0, help="Images (étapes) par seconde")
+    export.add_argument("--dpi", type=int, default=100, help="Résolution des images")
+    export.add_argument("--writer", choices=["ffmpeg", "pillow"], default=None,
+                        help="Encodeur (défaut: ffmpeg si disponible, sinon Pillow en GIF)")
+    return parser
+
+
+def main(argv=None):
+    """Point d'entrée de la ligne de commande"""
+    args = build_parser().parse_args(argv)
+
+    if args.command == "solve":
+        files = find_nest_files(args.paths)
+        if not files:
+            print("❌ Aucune fourmilière trouvée", file=sys.stderr)
+            return 1
+
+        if args.out == "-":
+            records = run_solve(files, args.jobs, args.strategy, sys.stdout, args.memory,
+                                args.optimize)
+        else:
+            with open(args.out, "w", encoding="utf-8") as out:
+                records = run_solve(files, args.jobs, args.strategy, out, args.memory,
+                                    args.optimize)
+
+        errors = sum(1 for record in records if 'error' in record)
+        print(f"✅ {len(records) - errors}/{len(records)} fourmilières résolues", file=sys.stderr)
+        return 1 if errors else 0
+
+    if args.command == "portfolio":
+        from portfolio import run_portfolio
+
+        antnest = load_antnest_from_txt(args.nest)
+        result = run_portfolio(antnest, args.runs, args.jobs, args.seed)
+        record = {
+            'path': args.nest,
+            'nest': antnest.name,
+            'runs': len(result.steps),
+            'best_seed': result.seed,
+            'steps': len(result.colony.movements_history),
+            'reference_steps': result.steps[0],
+            'solved': result.colony.all_ants_arrived(),
+            'distribution': result.distribution,
+            'abandoned': result.abandoned,
+        }
+        print(json.dumps(record, ensure_ascii=False))
+        return 0
+
+    if args.command == "horizon":
+        from horizon import max_ants_within
+
+        antnest = load_antnest_from_txt(args.nest)
+        result = max_ants_within(antnest, args.steps)
+        record = {
+            'path': args.nest,
+            'nest': antnest.name,
+            'ants': antnest.ants,
+            'horizon': result.horizon,
+            'delivered': result.delivered,
+            'arrivals': result.arrivals,
+        }
+        if args.schedule:
+            record['schedule'] = result.movements_history
+        print(json.dumps(record, ensure_ascii=False))
+        return 0
+
+    if args.command == "export":
+        from export import export_animation  # matplotlib (Agg) seulement pour l'export
+
+        colony = solve_antnest(load_antnest_from_txt(args.nest), args.strategy)
+        try:
+            export_animation(colony, args.output, fps=args.fps, jobs=args.jobs,
+                             dpi=args.dpi, backend=args.writer)
+        except (RuntimeError, ValueError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+        return 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())